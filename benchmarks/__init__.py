@@ -0,0 +1,3 @@
+from .generator import generate_instance, PRESETS
+
+__all__ = ["generate_instance", "PRESETS"]
\ No newline at end of file
@@ -0,0 +1,92 @@
+import random
+from typing import Dict, List, Tuple
+from models import Professor, Course, Classroom
+
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
+DURATIONS = [60, 90, 120]
+# Two-hour blocks between 08:00 and 18:00 that availability windows are built from.
+BLOCKS = [(8, 10), (10, 12), (12, 14), (14, 16), (16, 18)]
+
+PRESETS: Dict[str, Dict[str, float]] = {
+    "small": {"num_professors": 10, "num_courses": 40, "num_classrooms": 8,
+              "conflict_density": 0.05, "availability_sparsity": 0.5},
+    "medium": {"num_professors": 100, "num_courses": 500, "num_classrooms": 50,
+               "conflict_density": 0.005, "availability_sparsity": 0.4},
+    "large": {"num_professors": 400, "num_courses": 2000, "num_classrooms": 300,
+              "conflict_density": 0.001, "availability_sparsity": 0.4},
+}
+
+
+def _availability(rng: random.Random, sparsity: float) -> List[Tuple[str, str, str]]:
+    """Build merged availability windows where each block is dropped with probability sparsity."""
+    windows = []
+    for day in DAYS:
+        start = None
+        for block_start, block_end in BLOCKS:
+            if rng.random() >= sparsity:
+                if start is None:
+                    start = block_start
+                end = block_end
+            elif start is not None:
+                windows.append((day, f"{start:02d}:00", f"{end:02d}:00"))
+                start = None
+        if start is not None:
+            windows.append((day, f"{start:02d}:00", f"{end:02d}:00"))
+    return windows
+
+
+def generate_instance(num_professors: int, num_courses: int, num_classrooms: int,
+                      conflict_density: float = 0.01, availability_sparsity: float = 0.4,
+                      seed: int = 0) -> Tuple[List[Professor], List[Course], List[Classroom]]:
+    """
+    Generate a synthetic university catalog.
+
+    Args:
+        num_professors (int): Number of professors.
+        num_courses (int): Number of courses (sections).
+        num_classrooms (int): Number of classrooms.
+        conflict_density (float, optional): Fraction of the other courses each
+            course conflicts with.
+        availability_sparsity (float, optional): Probability that a two-hour
+            block of a professor's week is unavailable. Classrooms use half
+            this probability.
+        seed (int, optional): Seed for the generator.
+
+    Returns:
+        Tuple[List[Professor], List[Course], List[Classroom]]: The generated catalog.
+
+    Raises:
+        ValueError: If a count is not positive or a fraction is outside [0, 1].
+    """
+    if min(num_professors, num_courses, num_classrooms) <= 0:
+        raise ValueError("Professor, course and classroom counts must be positive.")
+    if not (0 <= conflict_density <= 1 and 0 <= availability_sparsity <= 1):
+        raise ValueError("Conflict density and availability sparsity must be between 0 and 1.")
+    rng = random.Random(seed)
+
+    professors = [
+        Professor(name=f"Prof {i:04d}", available_times=_availability(rng, availability_sparsity))
+        for i in range(num_professors)
+    ]
+
+    courses = []
+    for i in range(num_courses):
+        teachers = rng.sample(professors, min(rng.choice([1, 1, 2]), num_professors))
+        course = Course(name=f"Course {i:04d}", code=f"C{i:04d}", duration=rng.choice(DURATIONS),
+                        professors=[p.name for p in teachers])
+        for professor in teachers:
+            professor.add_course(course.code)
+        courses.append(course)
+
+    conflicts_per_course = round(conflict_density * (num_courses - 1))
+    for course in courses:
+        for other in rng.sample(courses, min(conflicts_per_course, num_courses)):
+            if other is not course:
+                course.add_conflict(other.code)
+
+    classrooms = [
+        Classroom(name=f"Room {i:03d}", capacity=rng.choice([20, 30, 40, 60, 120]),
+                  available_times=_availability(rng, availability_sparsity / 2))
+        for i in range(num_classrooms)
+    ]
+    return professors, courses, classrooms
\ No newline at end of file
@@ -0,0 +1,56 @@
+import argparse
+import json
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+# Modules that headless users (CLI, worker processes) import.
+HEADLESS_MODULES = ["models", "utils", "utils.cli"]
+# Modules that must not be loaded by a headless import.
+FORBIDDEN_MODULES = ["tkinter", "gui.app", "gui.input_frames", "gui.schedule_view", "gui.timetable_view"]
+
+
+def measure(module: str) -> Dict[str, object]:
+    """
+    Import a module in a fresh interpreter and report its import cost.
+
+    Returns:
+        dict: Cumulative import time in milliseconds and any forbidden modules loaded.
+    """
+    code = (f"import sys, json; import {module}; "
+            f"print(json.dumps([m for m in {FORBIDDEN_MODULES!r} if m in sys.modules]))")
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            capture_output=True, text=True, check=True)
+    cumulative = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, name = line.split("|")
+        if name.strip() == module:
+            cumulative = int(cumulative_us)
+    return {"module": module, "import_ms": round(cumulative / 1000, 2),
+            "forbidden": json.loads(result.stdout.strip().splitlines()[-1])}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Measure headless import times and fail if the GUI is pulled in or a budget is exceeded."""
+    parser = argparse.ArgumentParser(description="Guard the import cost of headless modules.")
+    parser.add_argument("--max-ms", type=float, help="Fail if any module takes longer than this to import.")
+    args = parser.parse_args(argv)
+
+    results = [measure(module) for module in HEADLESS_MODULES]
+    print(json.dumps(results, indent=2))
+    failed = False
+    for result in results:
+        if result["forbidden"]:
+            print(f"{result['module']} imports GUI modules: {', '.join(result['forbidden'])}", file=sys.stderr)
+            failed = True
+        if args.max_ms is not None and result["import_ms"] > args.max_ms:
+            print(f"{result['module']} took {result['import_ms']} ms to import (budget {args.max_ms} ms)",
+                  file=sys.stderr)
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
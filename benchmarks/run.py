@@ -0,0 +1,108 @@
+import argparse
+import json
+import logging
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+from benchmarks.generator import generate_instance, PRESETS
+from utils import SchedulerEngine, STRATEGIES
+
+
+def run_case(params: Dict[str, float], strategy: str, seed: int, measure_memory: bool = True) -> dict:
+    """
+    Generate one instance and time one engine run on it.
+
+    The instance is generated with the same seed as the engine, and memory is
+    measured in a second identical run so tracing does not skew the timing.
+
+    Returns:
+        dict: Parameters, strategy, seed and the measured statistics.
+    """
+    professors, courses, classrooms = generate_instance(**params, seed=seed)
+    engine = SchedulerEngine(professors, courses, classrooms, strategy=strategy, seed=seed)
+    start = time.perf_counter()
+    schedule = engine.generate_schedule()
+    wall_time = time.perf_counter() - start
+
+    peak_memory = None
+    if measure_memory:
+        professors, courses, classrooms = generate_instance(**params, seed=seed)
+        tracemalloc.start()
+        SchedulerEngine(professors, courses, classrooms, strategy=strategy, seed=seed).generate_schedule()
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    scheduled_codes = {entry.course_code for entry in schedule.entries}
+    return {
+        "params": params,
+        "strategy": strategy,
+        "seed": seed,
+        "wall_time": round(wall_time, 4),
+        "iterations": engine.stats.get("iterations"),
+        "peak_memory_bytes": peak_memory,
+        "scheduled": len(scheduled_codes),
+        "unscheduled": sum(1 for c in courses if c.code not in scheduled_codes),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark matrix and write the results as JSON."""
+    parser = argparse.ArgumentParser(description="Benchmark the scheduler engine on synthetic instances.")
+    parser.add_argument("--preset", action="append", choices=sorted(PRESETS),
+                        help="Instance preset to run (repeatable). Defaults to small and medium.")
+    parser.add_argument("--professors", type=int, help="Custom instance: number of professors.")
+    parser.add_argument("--courses", type=int, help="Custom instance: number of courses.")
+    parser.add_argument("--classrooms", type=int, help="Custom instance: number of classrooms.")
+    parser.add_argument("--conflict-density", type=float, default=0.01)
+    parser.add_argument("--availability-sparsity", type=float, default=0.4)
+    parser.add_argument("--strategy", action="append", choices=STRATEGIES,
+                        help="Strategy to run (repeatable). Defaults to all.")
+    parser.add_argument("--seeds", type=int, default=3, help="Number of seeds per case, starting at 0.")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the traced memory run.")
+    parser.add_argument("-o", "--output", help="Output JSON file. Defaults to stdout.")
+    args = parser.parse_args(argv)
+
+    instances: Dict[str, Dict[str, float]] = {}
+    if args.professors or args.courses or args.classrooms:
+        if not (args.professors and args.courses and args.classrooms):
+            parser.error("--professors, --courses and --classrooms must be given together.")
+        instances["custom"] = {
+            "num_professors": args.professors,
+            "num_courses": args.courses,
+            "num_classrooms": args.classrooms,
+            "conflict_density": args.conflict_density,
+            "availability_sparsity": args.availability_sparsity,
+        }
+    for preset in args.preset or ([] if instances else ["small", "medium"]):
+        instances[preset] = PRESETS[preset]
+
+    results = []
+    for name, params in instances.items():
+        for strategy in args.strategy or STRATEGIES:
+            for seed in range(args.seeds):
+                result = run_case(params, strategy, seed, measure_memory=not args.no_memory)
+                result["instance"] = name
+                results.append(result)
+                logging.info(f"{name}/{strategy}/seed {seed}: {result['wall_time']}s, "
+                             f"{result['unscheduled']} unscheduled")
+
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    sys.exit(main())
\ No newline at end of file
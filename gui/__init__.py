@@ -1,5 +1,25 @@
-from .app import App
-from .input_frames import ProfessorInputFrame, CourseInputFrame, ClassroomInputFrame
-from .schedule_view import ScheduleViewer
+import importlib
 
-__all__ = ["App", "ProfessorInputFrame", "CourseInputFrame", "ClassroomInputFrame", "ScheduleViewer"]
\ No newline at end of file
+# GUI classes are imported on first access so that importing the package
+# (or models/utils through it) never loads tkinter unless a window is needed.
+_LAZY_ATTRIBUTES = {
+    "App": ".app",
+    "ProfessorInputFrame": ".input_frames",
+    "CourseInputFrame": ".input_frames",
+    "ClassroomInputFrame": ".input_frames",
+    "ScheduleViewer": ".schedule_view",
+    "ScheduleTableModel": ".schedule_model",
+    "TimetableGrid": ".timetable_view",
+}
+
+__all__ = ["App", "ProfessorInputFrame", "CourseInputFrame", "ClassroomInputFrame", "ScheduleViewer",
+           "ScheduleTableModel", "TimetableGrid"]
+
+
+def __getattr__(name: str):
+    """Import GUI classes lazily on first attribute access."""
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,14 +1,19 @@
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import List, Optional
-from gui.input_frames import ProfessorInputFrame, CourseInputFrame, ClassroomInputFrame
-from gui.schedule_view import ScheduleViewer
 from models import Professor, Course, Classroom, Schedule
 from utils import SchedulerEngine
-import json
+from utils.constraints import NonOverlap, NonOverlapGroups
+from utils.persistence import load_data, save_data
+from utils.sqlite_store import SQLiteStore, is_sqlite_path
 import logging
 import os
 
+# Milliseconds between two checks of the background solver's progress.
+SOLVER_POLL_MS = 100
+
 class App(tk.Tk):
     """Main application class for the University Class Scheduler."""
     
@@ -24,8 +29,12 @@ class App(tk.Tk):
         self.courses: List[Course] = []
         self.classrooms: List[Classroom] = []
         self.schedule: Optional[Schedule] = None
-        self.non_overlap_courses: Optional[tuple[str, str]] = None  # Store course codes to avoid overlap
-        self.data_file = "scheduler_data.json"
+        self.schedule_store: Optional[str] = None  # Database whose saved schedule is not loaded yet
+        self.non_overlap_courses: Optional[NonOverlap] = None  # Pair, or groups, of course codes to avoid overlap
+        self.solver_engine: Optional[SchedulerEngine] = None  # Engine of the solve running in the background
+        self.schedule_views: list = []  # Open schedule table and grid views, refreshed on regeneration
+        # A SQLite database, when present, takes precedence over the JSON file.
+        self.data_file = "scheduler_data.db" if os.path.exists("scheduler_data.db") else "scheduler_data.json"
         
         self.create_widgets()
         self.load_data()
@@ -60,6 +69,7 @@ class App(tk.Tk):
     
     def open_professor_input(self) -> None:
         """Open a window for professor input."""
+        from gui.input_frames import ProfessorInputFrame
         window = tk.Toplevel(self)
         window.title("Add Professor")
         window.geometry("600x600")
@@ -67,6 +77,7 @@ class App(tk.Tk):
     
     def open_course_input(self) -> None:
         """Open a window for course input."""
+        from gui.input_frames import CourseInputFrame
         window = tk.Toplevel(self)
         window.title("Add Course")
         window.geometry("600x700")
@@ -77,6 +88,7 @@ class App(tk.Tk):
     
     def open_classroom_input(self) -> None:
         """Open a window for classroom input."""
+        from gui.input_frames import ClassroomInputFrame
         window = tk.Toplevel(self)
         window.title("Add Classroom")
         window.geometry("600x600")
@@ -114,12 +126,22 @@ class App(tk.Tk):
             if course1 == course2:
                 messagebox.showerror("Error", "Please select different courses.")
                 return
-            self.non_overlap_courses = (course1, course2)
-            messagebox.showinfo("Success", f"Set {course1} and {course2} to avoid time/place overlap.")
+            groups = NonOverlapGroups.coerce(self.non_overlap_courses).groups
+            if (course1, course2) in groups or (course2, course1) in groups:
+                messagebox.showinfo("Info", f"{course1} and {course2} are already kept apart.")
+                return
+            # A single pair keeps the original format; further pairs become a list of groups.
+            self.non_overlap_courses = groups + [(course1, course2)] if groups else (course1, course2)
+            messagebox.showinfo("Success", f"Set {course1} and {course2} to avoid time/place overlap "
+                                           f"({len(groups) + 1} constraint(s) in total).")
             window.destroy()
         
+        def clear_non_overlap():
+            self.non_overlap_courses = None
+            messagebox.showinfo("Success", "Removed all non-overlapping constraints.")
+        
         def check_overlap():
-            if self.schedule is None:
+            if self.schedule is None and self.schedule_store is None:
                 messagebox.showerror("Error", "Please generate a schedule first.")
                 return
             course1 = course1_var.get()
@@ -127,8 +149,16 @@ class App(tk.Tk):
             if not course1 or not course2:
                 messagebox.showerror("Error", "Please select two courses.")
                 return
+            schedule = self.schedule
+            if schedule is None:
+                # Read only the two courses' entries through the database's course index.
+                schedule = Schedule()
+                with SQLiteStore(self.schedule_store) as store:
+                    for code in (course1, course2):
+                        for entry in store.entries(course=code):
+                            schedule.add_entry(entry)
             engine = SchedulerEngine(self.professors, self.courses, self.classrooms)
-            overlap = engine.check_course_overlap(self.schedule, course1, course2)
+            overlap = engine.check_course_overlap(schedule, course1, course2)
             if overlap:
                 messagebox.showwarning("Overlap Detected", 
                     f"{course1} and {course2} overlap in time or place.")
@@ -136,8 +166,10 @@ class App(tk.Tk):
                 messagebox.showinfo("No Overlap", 
                     f"{course1} and {course2} do not overlap in time or place.")
         
-        ttk.Button(frame, text="Set Non-Overlapping Constraint", 
+        ttk.Button(frame, text="Add Non-Overlapping Constraint", 
                   command=set_non_overlap).pack(pady=10)
+        ttk.Button(frame, text="Clear Constraints", 
+                  command=clear_non_overlap).pack(pady=10)
         ttk.Button(frame, text="Check Current Schedule", 
                   command=check_overlap).pack(pady=10)
     
@@ -175,43 +207,135 @@ class App(tk.Tk):
             logging.error(f"Failed to load sample data: {str(e)}")
     
     def generate_schedule(self) -> None:
-        """Generate the class schedule."""
+        """Generate the class schedule on a background thread, showing its progress."""
+        if self.solver_engine is not None:
+            messagebox.showinfo("Info", "A schedule is already being generated.")
+            return
         if not all([self.professors, self.courses, self.classrooms]):
             messagebox.showerror("Error", "Please add professors, courses, and classrooms first.")
             logging.warning("Attempted to generate schedule without complete data.")
             return
         
-        try:
-            engine = SchedulerEngine(self.professors, self.courses, self.classrooms)
-            self.schedule = engine.generate_schedule(non_overlap_courses=self.non_overlap_courses)
-            
-            scheduled_codes = {entry.course_code for entry in self.schedule.entries}
-            all_codes = {course.code for course in self.courses}
-            unscheduled = all_codes - scheduled_codes
-            
-            if unscheduled:
-                messagebox.showwarning("Warning", 
-                    f"Could not schedule: {', '.join(unscheduled)}")
-                logging.warning(f"Unscheduled courses: {', '.join(unscheduled)}")
+        # The solver thread only talks to Tk through this queue, drained by _poll_solver.
+        updates: queue.Queue = queue.Queue()
+        # Copies, so the catalog can be edited while the solve runs.
+        engine = SchedulerEngine(list(self.professors), list(self.courses), list(self.classrooms),
+                                 progress=updates.put)
+        non_overlap_courses = self.non_overlap_courses
+        self.solver_engine = engine
+        
+        window = tk.Toplevel(self)
+        window.title("Generating Schedule")
+        window.geometry("420x160")
+        frame = ttk.Frame(window, padding="20")
+        frame.pack(fill=tk.BOTH, expand=True)
+        status = ttk.Label(frame, text="Preparing...")
+        status.pack(anchor="w", pady=(0, 10))
+        bar = ttk.Progressbar(frame, mode="determinate", maximum=len(engine.courses))
+        bar.pack(fill=tk.X, pady=(0, 10))
+        
+        def cancel():
+            engine.cancel()
+            status.config(text="Cancelling...")
+            cancel_button.config(state=tk.DISABLED)
+        
+        cancel_button = ttk.Button(frame, text="Cancel", command=cancel)
+        cancel_button.pack()
+        window.protocol("WM_DELETE_WINDOW", cancel)
+        
+        def solve():
+            try:
+                updates.put(("done", engine.generate_schedule(non_overlap_courses=non_overlap_courses)))
+            except Exception as e:
+                updates.put(("error", e))
+        
+        threading.Thread(target=solve, daemon=True).start()
+        logging.info("Started schedule generation.")
+        self.after(SOLVER_POLL_MS, self._poll_solver, engine, updates, window, status, bar)
+    
+    def _poll_solver(self, engine: SchedulerEngine, updates: queue.Queue, window: tk.Toplevel,
+                     status: ttk.Label, bar: ttk.Progressbar) -> None:
+        """Show the solver's latest progress and handle its result once it finishes."""
+        progress, result = None, None
+        while True:
+            try:
+                update = updates.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(update, dict):
+                progress = update
             else:
-                messagebox.showinfo("Success", "Schedule generated successfully.")
-                logging.info("Schedule generated successfully.")
-            
-            if self.non_overlap_courses:
-                overlap = engine.check_course_overlap(self.schedule, *self.non_overlap_courses)
-                if overlap:
-                    messagebox.showwarning("Overlap Warning", 
-                        f"Could not prevent overlap between {self.non_overlap_courses[0]} and {self.non_overlap_courses[1]}.")
-                else:
-                    messagebox.showinfo("Non-Overlap Success", 
-                        f"{self.non_overlap_courses[0]} and {self.non_overlap_courses[1]} do not overlap.")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to generate schedule: {str(e)}")
-            logging.error(f"Failed to generate schedule: {str(e)}")
+                result = update
+        
+        if progress is not None and window.winfo_exists() and not engine.cancelled():
+            text = f"Placed {progress['placed']} of {progress['total']} courses ({progress['iterations']} iterations)"
+            if "score" in progress:
+                text += f", best score {progress['score']:.1f}"
+            status.config(text=text)
+            bar.config(value=progress["placed"])
+        if result is None:
+            self.after(SOLVER_POLL_MS, self._poll_solver, engine, updates, window, status, bar)
+            return
+        
+        self.solver_engine = None
+        if window.winfo_exists():
+            window.destroy()
+        kind, value = result
+        if kind == "error":
+            messagebox.showerror("Error", f"Failed to generate schedule: {str(value)}")
+            logging.error(f"Failed to generate schedule: {str(value)}")
+            return
+        self._show_generation_result(engine, value)
+    
+    def _show_generation_result(self, engine: SchedulerEngine, schedule: Schedule) -> None:
+        """Keep a finished or cancelled schedule and report unscheduled courses and overlaps."""
+        from gui.timetable_view import TimetableGrid
+        self.schedule = schedule
+        self.schedule_store = None
+        self.schedule_views = [view for view in self.schedule_views if view.winfo_exists()]
+        for view in self.schedule_views:
+            if isinstance(view, TimetableGrid):
+                # Show professors and classrooms added or removed since the grid opened.
+                view.set_schedule(schedule, [c.name for c in self.classrooms], [p.name for p in self.professors])
+            else:
+                view.set_schedule(schedule)
+        scheduled_codes = {entry.course_code for entry in self.schedule.entries}
+        all_codes = {course.code for course in engine.courses}
+        unscheduled = all_codes - scheduled_codes
+        
+        if engine.cancelled():
+            messagebox.showinfo("Cancelled", f"Generation cancelled. Kept the partial schedule with "
+                                             f"{len(scheduled_codes)} of {len(all_codes)} courses.")
+            logging.info(f"Schedule generation cancelled with {len(scheduled_codes)} courses placed.")
+            return
+        if unscheduled:
+            reasons = [str(d) for d in engine.diagnostics if unscheduled & set(d.courses)]
+            message = f"Could not schedule: {', '.join(unscheduled)}"
+            if reasons:
+                message += "\n\nReasons:\n" + "\n".join(f"- {reason}" for reason in reasons)
+            messagebox.showwarning("Warning", message)
+            logging.warning(f"Unscheduled courses: {', '.join(unscheduled)}")
+        else:
+            messagebox.showinfo("Success", "Schedule generated successfully.")
+            logging.info("Schedule generated successfully.")
+        
+        if self.non_overlap_courses:
+            violations = engine.non_overlap_violations(self.schedule, self.non_overlap_courses)
+            if violations:
+                messagebox.showwarning("Overlap Warning", 
+                    "Could not prevent overlap between " +
+                    ", ".join(f"{first} and {second}" for first, second in violations) + ".")
+            else:
+                groups = NonOverlapGroups.coerce(self.non_overlap_courses).groups
+                message = (f"{' and '.join(groups[0])} do not overlap." if len(groups) == 1 else
+                           f"All {len(groups)} non-overlapping constraints are respected.")
+                messagebox.showinfo("Non-Overlap Success", message)
     
     def view_schedule(self) -> None:
         """Display the generated schedule."""
-        if self.schedule is None:
+        from gui.schedule_view import ScheduleViewer
+        from gui.timetable_view import TimetableGrid
+        if self.load_saved_schedule() is None:
             messagebox.showerror("Error", "Please generate the schedule first.")
             logging.warning("Attempted to view schedule before generation.")
             return
@@ -219,50 +343,65 @@ class App(tk.Tk):
         window = tk.Toplevel(self)
         window.title("Class Schedule")
         window.geometry("1200x700")
-        ScheduleViewer(window, self.schedule).pack(fill=tk.BOTH, expand=True)
+        notebook = ttk.Notebook(window)
+        notebook.pack(fill=tk.BOTH, expand=True)
+        viewer = ScheduleViewer(notebook, self.schedule)
+        grid = TimetableGrid(notebook, self.schedule, [c.name for c in self.classrooms],
+                             [p.name for p in self.professors])
+        notebook.add(viewer, text="Table")
+        notebook.add(grid, text="Weekly Grid")
+        self.schedule_views = [view for view in self.schedule_views if view.winfo_exists()] + [viewer, grid]
         logging.info("Opened schedule viewer.")
     
     def save_data(self) -> None:
-        """Save the current data to a JSON file."""
+        """Save the current data to the data file."""
         try:
-            data = {
-                "professors": [p.to_dict() for p in self.professors],
-                "courses": [c.to_dict() for c in self.courses],
-                "classrooms": [c.to_dict() for c in self.classrooms],
-                "schedule": self.schedule.to_dict() if self.schedule else None,
-                "non_overlap_courses": self.non_overlap_courses
-            }
-            with open(self.data_file, "w") as f:
-                json.dump(data, f, indent=4)
+            save_data(self.data_file, self.professors, self.courses, self.classrooms,
+                      self.load_saved_schedule(), self.non_overlap_courses)
             messagebox.showinfo("Success", "Data saved successfully.")
-            logging.info("Data saved to JSON file.")
+            logging.info(f"Data saved to {self.data_file}.")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save data: {str(e)}")
             logging.error(f"Failed to save data: {str(e)}")
     
     def load_data(self) -> None:
-        """Load data from a JSON file if it exists."""
+        """Load data from the data file if it exists."""
         if not os.path.exists(self.data_file):
             return
         
         try:
-            with open(self.data_file, "r") as f:
-                data = json.load(f)
+            if is_sqlite_path(self.data_file):
+                with SQLiteStore(self.data_file) as store:
+                    data = store.load_catalog()
+                    # The schedule stays in the database until it is viewed or saved.
+                    self.schedule_store = self.data_file if store.has_schedule() else None
+            else:
+                data = load_data(self.data_file)
             
-            self.professors = [Professor.from_dict(p) for p in data.get("professors", [])]
-            self.courses = [Course.from_dict(c) for c in data.get("courses", [])]
-            self.classrooms = [Classroom.from_dict(c) for c in data.get("classrooms", [])]
-            if data.get("schedule"):
-                self.schedule = Schedule.from_dict(data["schedule"])
-            self.non_overlap_courses = data.get("non_overlap_courses")
+            self.professors = data["professors"]
+            self.courses = data["courses"]
+            self.classrooms = data["classrooms"]
+            if data["schedule"]:
+                self.schedule = data["schedule"]
+            self.non_overlap_courses = data["non_overlap_courses"]
             
-            logging.info("Data loaded from JSON file.")
+            logging.info(f"Data loaded from {self.data_file}.")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load data: {str(e)}")
             logging.error(f"Failed to load data: {str(e)}")
     
+    def load_saved_schedule(self) -> Optional[Schedule]:
+        """Return the current schedule, reading the one saved in the database on first use."""
+        if self.schedule is None and self.schedule_store is not None:
+            with SQLiteStore(self.schedule_store) as store:
+                self.schedule = store.load_schedule()
+            self.schedule_store = None
+        return self.schedule
+    
     def on_closing(self) -> None:
         """Handle application closing."""
+        if self.solver_engine is not None:
+            self.solver_engine.cancel()
         if messagebox.askokcancel("Quit", "Do you want to save your data before quitting?"):
             self.save_data()
         self.destroy()
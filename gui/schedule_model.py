@@ -0,0 +1,179 @@
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+from models import Schedule, ScheduleEntry
+
+# Weekday order used to sort the Day column; other days sort after these, by name.
+DAY_ORDER = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+# Columns of the schedule table, in display order.
+COLUMNS = ("Day", "Time", "Course", "Professor", "Classroom")
+
+# Columns that can be filtered, mapped to the ScheduleEntry attribute they match.
+FILTER_FIELDS = {
+    "Day": "day",
+    "Course": "course_code",
+    "Professor": "professor_name",
+    "Classroom": "classroom_name",
+}
+
+# Below this fraction of the rows, a filtered view is ordered by sorting its rows by rank
+# instead of scanning the whole sort order.
+_SORT_SELECTED_RATIO = 0.125
+
+Row = Tuple[str, str, str, str, str]
+
+
+def _day_key(day: str) -> Tuple[int, str]:
+    """Sort key placing known weekdays in calendar order."""
+    return (DAY_ORDER.index(day), "") if day in DAY_ORDER else (len(DAY_ORDER), day)
+
+
+class ScheduleTableModel:
+    """Sorted, filtered view of a schedule's entries, for a table that shows a window of rows.
+
+    Row values and per-column indexes are built once. Each column's sort order
+    is computed on first use and cached, so switching sort columns after that
+    is free. Filters are answered from the indexes: the matching row sets are
+    intersected, smallest first, and put in the current order without sorting
+    the whole schedule again. A viewer asks only for the rows it displays.
+    """
+
+    def __init__(self, schedule: Schedule):
+        """
+        Build the model.
+
+        Args:
+            schedule (Schedule): Schedule whose entries are shown. Later changes to
+                the schedule are not seen; build a new model instead.
+        """
+        self.entries: List[ScheduleEntry] = list(schedule.entries)
+        self.values: List[Row] = [
+            (entry.day, f"{entry.start_time}-{entry.end_time}", entry.course_code, entry.professor_name,
+             entry.classroom_name)
+            for entry in self.entries
+        ]
+        self.indexes: Dict[str, Dict[str, Set[int]]] = {column: {} for column in FILTER_FIELDS}
+        for row, entry in enumerate(self.entries):
+            for column, attribute in FILTER_FIELDS.items():
+                self.indexes[column].setdefault(getattr(entry, attribute), set()).add(row)
+        self._starts = [entry.start for entry in self.entries]
+        self._days = [_day_key(entry.day) for entry in self.entries]
+
+        self._orders: Dict[str, List[int]] = {}
+        self._ranks: Dict[str, List[int]] = {}
+        self.filters: Dict[str, str] = {}
+        self.sort_column = "Day"
+        self.descending = False
+        self.visible: List[int] = []
+        self._refresh()
+
+    def _order(self, column: str) -> List[int]:
+        """Return the rows sorted ascending by a column, computing it on first use."""
+        order = self._orders.get(column)
+        if order is None:
+            start, days = self._starts, self._days
+            keys: Dict[str, Callable[[int], tuple]] = {
+                "Day": lambda row: (days[row], start[row]),
+                "Time": lambda row: (start[row], self.entries[row].end, days[row]),
+                "Course": lambda row: (self.values[row][2], days[row], start[row]),
+                "Professor": lambda row: (self.values[row][3], days[row], start[row]),
+                "Classroom": lambda row: (self.values[row][4], days[row], start[row]),
+            }
+            if column not in keys:
+                raise ValueError(f"Unknown column '{column}'.")
+            order = sorted(range(len(self.entries)), key=keys[column])
+            rank = [0] * len(order)
+            for position, row in enumerate(order):
+                rank[row] = position
+            self._orders[column] = order
+            self._ranks[column] = rank
+        return order
+
+    def _refresh(self) -> None:
+        """Recompute the visible rows from the current filters and sort order."""
+        order = self._order(self.sort_column)
+        selected = self._selected()
+        if selected is None:
+            visible = list(order)
+        elif len(selected) < len(order) * _SORT_SELECTED_RATIO:
+            visible = sorted(selected, key=self._ranks[self.sort_column].__getitem__)
+        else:
+            visible = [row for row in order if row in selected]
+        if self.descending:
+            visible.reverse()
+        self.visible = visible
+
+    def _selected(self) -> Optional[Set[int]]:
+        """Return the rows matching every filter, or None if no filter is set."""
+        if not self.filters:
+            return None
+        matches = sorted((self.indexes[column].get(value, set()) for column, value in self.filters.items()), key=len)
+        selected = set(matches[0])
+        for rows in matches[1:]:
+            selected &= rows
+        return selected
+
+    def set_filter(self, column: str, value: Optional[str]) -> None:
+        """
+        Show only rows whose column equals a value.
+
+        Args:
+            column (str): One of the FILTER_FIELDS columns.
+            value (str, optional): Value to match; None or "All" clears the filter.
+
+        Raises:
+            ValueError: If the column cannot be filtered.
+        """
+        self.set_filters({column: value})
+
+    def set_filters(self, filters: Dict[str, Optional[str]]) -> None:
+        """
+        Set several filters at once, recomputing the visible rows only if one changed.
+
+        Args:
+            filters (Dict[str, Optional[str]]): Value per FILTER_FIELDS column, as for set_filter.
+
+        Raises:
+            ValueError: If a column cannot be filtered.
+        """
+        changed = False
+        for column, value in filters.items():
+            if column not in FILTER_FIELDS:
+                raise ValueError(f"Cannot filter by column '{column}'.")
+            if value is None or value == "All":
+                changed |= self.filters.pop(column, None) is not None
+            elif self.filters.get(column) != value:
+                self.filters[column] = value
+                changed = True
+        if changed:
+            self._refresh()
+
+    def sort(self, column: str, descending: bool = False) -> None:
+        """
+        Order the rows by a column, breaking ties by day and start time.
+
+        Raises:
+            ValueError: If the column is unknown.
+        """
+        if column not in COLUMNS:
+            raise ValueError(f"Unknown column '{column}'.")
+        if (column, descending) != (self.sort_column, self.descending):
+            self.sort_column = column
+            self.descending = descending
+            self._refresh()
+
+    def choices(self, column: str) -> List[str]:
+        """Return the distinct values of a filterable column, in sort order."""
+        values = self.indexes[column]
+        return sorted(values, key=_day_key) if column == "Day" else sorted(values)
+
+    def rows(self, first: int, count: int) -> Sequence[Row]:
+        """Return the values of up to count visible rows, starting at position first."""
+        return [self.values[row] for row in self.visible[first:first + count]]
+
+    def entry(self, position: int) -> ScheduleEntry:
+        """Return the entry shown at a visible position."""
+        return self.entries[self.visible[position]]
+
+    def __len__(self) -> int:
+        """Return the number of visible rows."""
+        return len(self.visible)
\ No newline at end of file
@@ -1,68 +1,139 @@
 import tkinter as tk
 from tkinter import ttk
-from typing import List
-from models import Schedule, ScheduleEntry
+from typing import Dict, List
+from models import Schedule
+from gui.schedule_model import COLUMNS, FILTER_FIELDS, ScheduleTableModel
+from gui.timetable_layout import wheel_steps
+
+# Row height assumed when the Treeview style does not define one.
+DEFAULT_ROW_HEIGHT = 20
 
 class ScheduleViewer(ttk.Frame):
-    """Frame for viewing the generated schedule."""
+    """Frame for viewing the generated schedule.
+    
+    The Treeview holds only as many items as fit on screen. Scrolling, sorting
+    and filtering change which model rows those items show, so the cost of a
+    redraw depends on the window height, not on the size of the schedule.
+    """
     
     def __init__(self, parent: tk.Widget, schedule: Schedule):
         super().__init__(parent, padding="20")
         self.schedule = schedule
+        self.model = ScheduleTableModel(schedule)
+        self.first = 0
+        self.page_size = 20
+        self.items: List[str] = []
+        self.filters: Dict[str, tk.StringVar] = {}
+        self.filter_boxes: Dict[str, ttk.Combobox] = {}
         self.create_widgets()
     
     def create_widgets(self) -> None:
         """Create the schedule viewer widgets."""
-        ttk.Label(self, text="Generated Schedule", 
+        ttk.Label(self, text="Generated Schedule",
                  font=("Helvetica", 16, "bold")).pack(pady=(0, 20))
-        
+    
         filter_frame = ttk.Frame(self)
         filter_frame.pack(fill=tk.X, pady=10)
-        
-        ttk.Label(filter_frame, text="Filter by Day:").pack(side=tk.LEFT, padx=5)
-        self.day_filter = tk.StringVar(value="All")
-        days = ["All", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
-        ttk.Combobox(filter_frame, textvariable=self.day_filter, values=days, state="readonly").pack(side=tk.LEFT, padx=5)
-        ttk.Button(filter_frame, text="Apply Filter", command=self.update_tree).pack(side=tk.LEFT, padx=5)
-        
-        columns = ("Day", "Time", "Course", "Professor", "Classroom")
-        self.tree = ttk.Treeview(self, columns=columns, show="headings", height=20)
-        
-        for col in columns:
+    
+        for column in FILTER_FIELDS:
+            ttk.Label(filter_frame, text=f"{column}:").pack(side=tk.LEFT, padx=5)
+            variable = tk.StringVar(value="All")
+            combobox = ttk.Combobox(filter_frame, textvariable=variable, state="readonly", width=16,
+                                    values=["All"] + self.model.choices(column))
+            combobox.pack(side=tk.LEFT, padx=5)
+            combobox.bind("<<ComboboxSelected>>", lambda event: self.update_tree())
+            self.filters[column] = variable
+            self.filter_boxes[column] = combobox
+        self.count_label = ttk.Label(filter_frame)
+        self.count_label.pack(side=tk.RIGHT, padx=5)
+    
+        self.tree = ttk.Treeview(self, columns=COLUMNS, show="headings", height=self.page_size,
+                                 selectmode="browse")
+    
+        for col in COLUMNS:
             self.tree.heading(col, text=col, command=lambda c=col: self.sort_tree(c))
             self.tree.column(col, width=200, anchor="center")
-        
-        self.update_tree()
-        
-        scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
-        
+    
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.on_scroll)
+    
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 10), pady=10)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=10)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=10)
+    
+        self.tree.bind("<Configure>", self.on_resize)
+        self.tree.bind("<MouseWheel>", lambda event: self.scroll_to(self.first + wheel_steps(event.delta) * 3))
+        self.tree.bind("<Button-4>", lambda event: self.scroll_to(self.first - 3))
+        self.tree.bind("<Button-5>", lambda event: self.scroll_to(self.first + 3))
+        self.tree.bind("<Prior>", lambda event: self.scroll_to(self.first - self.page_size))
+        self.tree.bind("<Next>", lambda event: self.scroll_to(self.first + self.page_size))
+        self.tree.bind("<Home>", lambda event: self.scroll_to(0))
+        self.tree.bind("<End>", lambda event: self.scroll_to(len(self.model)))
+    
+        self.update_tree()
     
     def update_tree(self) -> None:
-        """Update the Treeview with filtered schedule entries."""
-        self.tree.delete(*self.tree.get_children())
-        day_filter = self.day_filter.get()
-        
-        entries = self.schedule.entries
-        if day_filter != "All":
-            entries = [e for e in entries if e.day == day_filter]
-        
-        days_order = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
-        sorted_entries = sorted(
-            entries,
-            key=lambda e: (days_order.index(e.day) if e.day in days_order else 999, e.start_time)
-        )
-        
-        for entry in sorted_entries:
-            time_str = f"{entry.start_time}-{entry.end_time}"
-            values = (entry.day, time_str, entry.course_code, entry.professor_name, entry.classroom_name)
-            self.tree.insert("", tk.END, values=values)
+        """Apply the selected filters and show the first page of matching entries."""
+        self.model.set_filters({column: variable.get() for column, variable in self.filters.items()})
+        self.first = 0
+        self.render()
+    
+    def set_schedule(self, schedule: Schedule) -> None:
+        """Show a changed schedule, keeping the current filters and sort order."""
+        sort_column, descending = self.model.sort_column, self.model.descending
+        self.schedule = schedule
+        self.model = ScheduleTableModel(schedule)
+        self.model.sort(sort_column, descending)
+        for column, combobox in self.filter_boxes.items():
+            combobox.configure(values=["All"] + self.model.choices(column))
+        self.update_tree()
     
     def sort_tree(self, col: str) -> None:
-        """Sort the Treeview by the specified column."""
-        items = [(self.tree.set(k, col), k) for k in self.tree.get_children()]
-        items.sort()
-        for index, (val, k) in enumerate(items):
-            self.tree.move(k, '', index)
\ No newline at end of file
+        """Sort by the specified column; sorting by it again reverses the order."""
+        descending = col == self.model.sort_column and not self.model.descending
+        self.model.sort(col, descending)
+        for column in COLUMNS:
+            arrow = (" ▼" if descending else " ▲") if column == col else ""
+            self.tree.heading(column, text=column + arrow)
+        self.first = 0
+        self.render()
+    
+    def render(self) -> None:
+        """Show the model rows of the current window in the Treeview's items."""
+        total = len(self.model)
+        self.first = max(0, min(self.first, total - self.page_size))
+        rows = self.model.rows(self.first, self.page_size)
+    
+        while len(self.items) < len(rows):
+            self.items.append(self.tree.insert("", tk.END))
+        for iid, values in zip(self.items, rows):
+            self.tree.item(iid, values=values)
+        if len(self.items) > len(rows):
+            self.tree.delete(*self.items[len(rows):])
+            del self.items[len(rows):]
+    
+        if total:
+            self.scrollbar.set(self.first / total, min(1.0, (self.first + self.page_size) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+        self.count_label.configure(text=f"Showing {total} of {len(self.model.entries)} entries")
+    
+    def scroll_to(self, first: int) -> None:
+        """Show the window starting at a row position."""
+        self.first = first
+        self.render()
+    
+    def on_scroll(self, action: str, amount: str, unit: str = "") -> None:
+        """Handle scrollbar drags and clicks."""
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * len(self.model)))
+        elif action == "scroll":
+            step = self.page_size if unit == "pages" else 1
+            self.scroll_to(self.first + int(amount) * step)
+    
+    def on_resize(self, event: tk.Event) -> None:
+        """Fit the number of displayed rows to the Treeview's height."""
+        row_height = int(ttk.Style().lookup("Treeview", "rowheight") or DEFAULT_ROW_HEIGHT)
+        # One row's height is taken by the column headings.
+        page_size = max(1, event.height // row_height - 1)
+        if page_size != self.page_size:
+            self.page_size = page_size
+            self.render()
\ No newline at end of file
@@ -0,0 +1,146 @@
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from models import Schedule
+from gui.schedule_model import DAY_ORDER, _day_key
+
+# Timetable grid views, mapped to the ScheduleEntry attribute naming each row and the one shown in its blocks.
+GRID_VIEWS = {
+    "Classroom": ("classroom_name", "professor_name"),
+    "Professor": ("professor_name", "classroom_name"),
+}
+
+# Hours shown by a timetable grid with no entries outside them.
+DEFAULT_HOURS = (8, 18)
+
+# <MouseWheel> delta of one wheel notch on Windows; macOS reports much smaller deltas.
+WHEEL_NOTCH = 120
+
+# A timetable block: start minute, end minute, course code and the other resource's name.
+Block = Tuple[int, int, str, str]
+
+
+def wheel_steps(delta: int) -> int:
+    """
+    Convert a <MouseWheel> event delta into scroll steps, positive scrolling down.
+
+    Windows reports multiples of WHEEL_NOTCH per notch, while macOS reports
+    small deltas such as ±1, which still scroll one step.
+    """
+    if abs(delta) >= WHEEL_NOTCH:
+        return -int(delta / WHEEL_NOTCH)
+    return (delta < 0) - (delta > 0)
+
+
+class TimetableLayout:
+    """Rows and blocks of a weekly timetable grid, one resource per row and one day at a time.
+
+    Each view lists the same rows on every day, so switching days keeps the
+    scroll position meaningful. Blocks are grouped by row once per (view, day)
+    and cached. When the schedule changes, update compares the cached layouts
+    with the new ones and reports only the rows whose blocks differ, so a grid
+    can redraw just those.
+    """
+
+    def __init__(self, schedule: Schedule, classrooms: Iterable[str] = (), professors: Iterable[str] = ()):
+        """
+        Initialize a TimetableLayout.
+
+        Args:
+            schedule (Schedule): Schedule to lay out.
+            classrooms (Iterable[str], optional): Classroom names to show even without entries.
+            professors (Iterable[str], optional): Professor names to show even without entries.
+        """
+        self.schedule = schedule
+        self.names: Dict[str, Set[str]] = {"Classroom": set(classrooms), "Professor": set(professors)}
+        self._rows: Dict[str, List[str]] = {}
+        self._positions: Dict[str, Dict[str, int]] = {}
+        self._blocks: Dict[Tuple[str, str], Dict[str, Tuple[Block, ...]]] = {}
+
+    def rows(self, view: str) -> List[str]:
+        """
+        Return the row names of a view, sorted.
+
+        Raises:
+            ValueError: If the view is unknown.
+        """
+        rows = self._rows.get(view)
+        if rows is None:
+            if view not in GRID_VIEWS:
+                raise ValueError(f"Unknown view '{view}'.")
+            attribute = GRID_VIEWS[view][0]
+            rows = sorted(self.names[view] | {getattr(entry, attribute) for entry in self.schedule.entries})
+            self._rows[view] = rows
+            self._positions[view] = {name: index for index, name in enumerate(rows)}
+        return rows
+
+    def position(self, view: str, name: str) -> int:
+        """Return the index of a row in its view."""
+        self.rows(view)
+        return self._positions[view][name]
+
+    def days(self) -> List[str]:
+        """Return the days with entries in weekday order, or Monday to Friday if there are none."""
+        return sorted(self.schedule.by_day, key=_day_key) or DAY_ORDER[:5]
+
+    def hours(self) -> Tuple[int, int]:
+        """Return the first and last hour of the grid, widened from DEFAULT_HOURS to cover every entry."""
+        first, last = DEFAULT_HOURS
+        for entry in self.schedule.entries:
+            first = min(first, entry.start // 60)
+            last = max(last, -(-entry.end // 60))
+        return first, last
+
+    def blocks(self, view: str, day: str) -> Dict[str, Tuple[Block, ...]]:
+        """
+        Return the blocks of each row with entries on a day, sorted by start time.
+
+        Raises:
+            ValueError: If the view is unknown.
+        """
+        key = (view, day)
+        blocks = self._blocks.get(key)
+        if blocks is None:
+            if view not in GRID_VIEWS:
+                raise ValueError(f"Unknown view '{view}'.")
+            attribute, other = GRID_VIEWS[view]
+            grouped: Dict[str, List[Block]] = {}
+            for entry in self.schedule.by_day.get(day, ()):
+                grouped.setdefault(getattr(entry, attribute), []).append(
+                    (entry.start, entry.end, entry.course_code, getattr(entry, other)))
+            blocks = {name: tuple(sorted(items)) for name, items in grouped.items()}
+            self._blocks[key] = blocks
+        return blocks
+
+    def update(self, schedule: Schedule, classrooms: Optional[Iterable[str]] = None,
+               professors: Optional[Iterable[str]] = None) -> Dict[Tuple[str, str], Optional[Set[str]]]:
+        """
+        Lay out a changed schedule and report what changed in the cached layouts.
+
+        Args:
+            schedule (Schedule): The new schedule.
+            classrooms (Iterable[str], optional): Classroom names to show even without
+                entries, replacing the current ones. Defaults to keeping them.
+            professors (Iterable[str], optional): Professor names to show even without
+                entries, replacing the current ones. Defaults to keeping them.
+
+        Returns:
+            Dict[Tuple[str, str], Optional[Set[str]]]: For each cached (view, day)
+                that changed, the names of the rows whose blocks differ, or None if
+                the view's rows were added or removed, which moves every row after them.
+        """
+        old_rows, old_blocks = self._rows, self._blocks
+        self.schedule = schedule
+        if classrooms is not None:
+            self.names["Classroom"] = set(classrooms)
+        if professors is not None:
+            self.names["Professor"] = set(professors)
+        self._rows, self._positions, self._blocks = {}, {}, {}
+        changes: Dict[Tuple[str, str], Optional[Set[str]]] = {}
+        for (view, day), blocks in old_blocks.items():
+            if view in old_rows and self.rows(view) != old_rows[view]:
+                changes[(view, day)] = None
+                continue
+            new_blocks = self.blocks(view, day)
+            dirty = {name for name in blocks.keys() | new_blocks.keys() if blocks.get(name) != new_blocks.get(name)}
+            if dirty:
+                changes[(view, day)] = dirty
+        return changes
\ No newline at end of file
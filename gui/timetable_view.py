@@ -0,0 +1,236 @@
+import tkinter as tk
+import zlib
+from tkinter import ttk
+from typing import Dict, Iterable, Optional, Set, Tuple
+from models import Schedule
+from gui.timetable_layout import GRID_VIEWS, TimetableLayout, wheel_steps
+
+# Height of a grid row and width of a minute, in pixels.
+ROW_HEIGHT = 36
+MINUTE_WIDTH = 2
+
+# Width of the row-name column and height of the hour header, in pixels.
+NAME_WIDTH = 160
+HEADER_HEIGHT = 24
+
+# Rows drawn and cached together. A band is drawn the first time it scrolls into view.
+BAND_ROWS = 20
+
+# Fill colours of course blocks; a course always gets the same one.
+BLOCK_COLORS = ["#9ecae1", "#a1d99b", "#fdae6b", "#bcbddc", "#fc9272", "#c7e9c0", "#fdd0a2", "#dadaeb"]
+
+# Colour of grid lines and font of block labels.
+GRID_COLOR = "#d9d9d9"
+BLOCK_FONT = ("Helvetica", 8)
+
+class TimetableGrid(ttk.Frame):
+    """Frame showing one day of the schedule as a room-by-time or professor-by-time grid.
+    
+    Canvas items are created per band of rows, only when the band first
+    scrolls into view, and tagged with their (view, day). Switching view or
+    day hides the items of the previous one and shows the cached items of
+    the new one, so each band is drawn once. When the schedule changes, only
+    the bands holding changed rows are deleted, and they are redrawn when next
+    visible.
+    """
+    
+    def __init__(self, parent: tk.Widget, schedule: Schedule, classrooms: Iterable[str] = (),
+                 professors: Iterable[str] = ()):
+        super().__init__(parent, padding="20")
+        self.layout = TimetableLayout(schedule, classrooms, professors)
+        self.hours = self.layout.hours()
+        self.days = self.layout.days()
+        self.view = tk.StringVar(value="Classroom")
+        self.day = tk.StringVar(value=self.days[0])
+        self.drawn: Dict[Tuple[str, str], Set[int]] = {}
+        self.shown: Optional[Tuple[str, str]] = None
+        self.create_widgets()
+    
+    def create_widgets(self) -> None:
+        """Create the grid widgets."""
+        control_frame = ttk.Frame(self)
+        control_frame.pack(fill=tk.X, pady=(0, 10))
+    
+        ttk.Label(control_frame, text="View by:").pack(side=tk.LEFT, padx=5)
+        view_box = ttk.Combobox(control_frame, textvariable=self.view, values=list(GRID_VIEWS), state="readonly")
+        view_box.pack(side=tk.LEFT, padx=5)
+        view_box.bind("<<ComboboxSelected>>", lambda event: self.show())
+    
+        ttk.Label(control_frame, text="Day:").pack(side=tk.LEFT, padx=5)
+        self.day_box = ttk.Combobox(control_frame, textvariable=self.day, values=self.days, state="readonly")
+        self.day_box.pack(side=tk.LEFT, padx=5)
+        self.day_box.bind("<<ComboboxSelected>>", lambda event: self.show())
+    
+        grid_frame = ttk.Frame(self)
+        grid_frame.pack(fill=tk.BOTH, expand=True)
+    
+        self.header = tk.Canvas(grid_frame, height=HEADER_HEIGHT, background="white", highlightthickness=0)
+        self.names = tk.Canvas(grid_frame, width=NAME_WIDTH, background="white", highlightthickness=0)
+        self.body = tk.Canvas(grid_frame, background="white", highlightthickness=0)
+        y_scrollbar = ttk.Scrollbar(grid_frame, orient="vertical", command=self.yview)
+        x_scrollbar = ttk.Scrollbar(grid_frame, orient="horizontal", command=self.xview)
+        self.body.configure(xscrollcommand=x_scrollbar.set,
+                            yscrollcommand=lambda first, last: self.on_yscroll(y_scrollbar, first, last))
+    
+        self.header.grid(row=0, column=1, sticky="ew")
+        self.names.grid(row=1, column=0, sticky="ns")
+        self.body.grid(row=1, column=1, sticky="nsew")
+        y_scrollbar.grid(row=1, column=2, sticky="ns")
+        x_scrollbar.grid(row=2, column=1, sticky="ew")
+        grid_frame.rowconfigure(1, weight=1)
+        grid_frame.columnconfigure(1, weight=1)
+    
+        self.body.bind("<Configure>", lambda event: self.draw_visible())
+        for canvas in (self.names, self.body):
+            canvas.bind("<MouseWheel>", lambda event: self.yview("scroll", wheel_steps(event.delta), "units"))
+            canvas.bind("<Button-4>", lambda event: self.yview("scroll", -1, "units"))
+            canvas.bind("<Button-5>", lambda event: self.yview("scroll", 1, "units"))
+        self.body.configure(yscrollincrement=ROW_HEIGHT)
+        self.names.configure(yscrollincrement=ROW_HEIGHT)
+    
+        self.draw_header()
+        self.show()
+    
+    def xview(self, *args) -> None:
+        """Scroll the hour header and the grid horizontally together."""
+        self.header.xview(*args)
+        self.body.xview(*args)
+    
+    def yview(self, *args) -> None:
+        """Scroll the row names and the grid vertically together."""
+        self.names.yview(*args)
+        self.body.yview(*args)
+    
+    def on_yscroll(self, scrollbar: ttk.Scrollbar, first: str, last: str) -> None:
+        """Update the scrollbar and draw the bands scrolled into view."""
+        scrollbar.set(first, last)
+        self.draw_visible()
+    
+    def grid_width(self) -> int:
+        """Width of the time axis, in pixels."""
+        first, last = self.hours
+        return (last - first) * 60 * MINUTE_WIDTH
+    
+    def draw_header(self) -> None:
+        """Draw the hour labels of the time axis."""
+        self.header.delete("all")
+        first, last = self.hours
+        for hour in range(first, last + 1):
+            x = (hour - first) * 60 * MINUTE_WIDTH
+            self.header.create_text(x + 4, HEADER_HEIGHT // 2, text=f"{hour:02d}:00", anchor="w")
+            self.header.create_line(x, 0, x, HEADER_HEIGHT, fill=GRID_COLOR)
+        self.header.configure(scrollregion=(0, 0, self.grid_width(), HEADER_HEIGHT))
+    
+    def show(self) -> None:
+        """Show the selected view and day, reusing the bands already drawn for it."""
+        key = (self.view.get(), self.day.get())
+        if key != self.shown:
+            if self.shown is not None:
+                self._set_state(self.shown, "hidden")
+            self._set_state(key, "normal")
+            self.shown = key
+        height = len(self.layout.rows(key[0])) * ROW_HEIGHT
+        self.body.configure(scrollregion=(0, 0, self.grid_width(), height))
+        self.names.configure(scrollregion=(0, 0, NAME_WIDTH, height))
+        self.draw_visible()
+    
+    def draw_visible(self) -> None:
+        """Draw the bands of the shown view and day that are in view and not drawn yet."""
+        if self.shown is None:
+            return
+        view, _ = self.shown
+        band_height = BAND_ROWS * ROW_HEIGHT
+        bands = -(-len(self.layout.rows(view)) // BAND_ROWS)
+        top = int(self.body.canvasy(0)) // band_height
+        bottom = int(self.body.canvasy(self.body.winfo_height())) // band_height
+        drawn = self.drawn.setdefault(self.shown, set())
+        for band in range(max(0, top), min(bands - 1, bottom) + 1):
+            if band not in drawn:
+                self.draw_band(self.shown, band)
+                drawn.add(band)
+    
+    def draw_band(self, key: Tuple[str, str], band: int) -> None:
+        """Create the canvas items of one band of rows."""
+        view, day = key
+        tags = (self._key_tag(key), self._band_tag(key, band))
+        rows = self.layout.rows(view)[band * BAND_ROWS:(band + 1) * BAND_ROWS]
+        blocks = self.layout.blocks(view, day)
+        first_minute = self.hours[0] * 60
+        width = self.grid_width()
+        top = band * BAND_ROWS * ROW_HEIGHT
+        bottom = top + len(rows) * ROW_HEIGHT
+    
+        for x in range(0, width + 1, 60 * MINUTE_WIDTH):
+            self.body.create_line(x, top, x, bottom, fill=GRID_COLOR, tags=tags)
+        for index, name in enumerate(rows):
+            y = top + index * ROW_HEIGHT
+            self.names.create_text(6, y + ROW_HEIGHT // 2, text=name, anchor="w", tags=tags)
+            self.names.create_line(0, y + ROW_HEIGHT, NAME_WIDTH, y + ROW_HEIGHT, fill=GRID_COLOR, tags=tags)
+            self.body.create_line(0, y + ROW_HEIGHT, width, y + ROW_HEIGHT, fill=GRID_COLOR, tags=tags)
+            for start, end, course_code, other in blocks.get(name, ()):
+                x0 = (start - first_minute) * MINUTE_WIDTH
+                x1 = (end - first_minute) * MINUTE_WIDTH
+                color = BLOCK_COLORS[zlib.crc32(course_code.encode()) % len(BLOCK_COLORS)]
+                self.body.create_rectangle(x0 + 1, y + 2, x1 - 1, y + ROW_HEIGHT - 2, fill=color,
+                                           outline="#636363", tags=tags)
+                label = f"{course_code}\n{other}" if x1 - x0 >= 100 else course_code
+                self.body.create_text(x0 + 4, y + ROW_HEIGHT // 2, text=label, anchor="w", font=BLOCK_FONT,
+                                      width=max(1, x1 - x0 - 6), tags=tags)
+    
+    def set_schedule(self, schedule: Schedule, classrooms: Optional[Iterable[str]] = None,
+                     professors: Optional[Iterable[str]] = None) -> None:
+        """
+        Show a changed schedule, redrawing only the bands whose rows changed.
+    
+        Args:
+            schedule (Schedule): The new schedule.
+            classrooms (Iterable[str], optional): Current classroom names, to show even
+                without entries. Defaults to the names already shown.
+            professors (Iterable[str], optional): Current professor names, to show even
+                without entries. Defaults to the names already shown.
+        """
+        changes = self.layout.update(schedule, classrooms, professors)
+        hours = self.layout.hours()
+        if hours != self.hours:
+            # The time axis moved, so every drawn block is misplaced.
+            self.hours = hours
+            self.draw_header()
+            for canvas in (self.names, self.body):
+                canvas.delete("all")
+            self.drawn.clear()
+        else:
+            for key, names in changes.items():
+                if names is None:
+                    self._delete(self._key_tag(key))
+                    self.drawn.pop(key, None)
+                    continue
+                view, _ = key
+                for band in {self.layout.position(view, name) // BAND_ROWS for name in names}:
+                    self._delete(self._band_tag(key, band))
+                    self.drawn.get(key, set()).discard(band)
+    
+        self.days = self.layout.days()
+        self.day_box.configure(values=self.days)
+        if self.day.get() not in self.days:
+            self.day.set(self.days[0])
+        self.show()
+    
+    def _set_state(self, key: Tuple[str, str], state: str) -> None:
+        """Hide or show the items drawn for a view and day."""
+        for canvas in (self.names, self.body):
+            canvas.itemconfigure(self._key_tag(key), state=state)
+    
+    def _delete(self, tag: str) -> None:
+        """Delete the items with a tag from the name and grid canvases."""
+        for canvas in (self.names, self.body):
+            canvas.delete(tag)
+    
+    @staticmethod
+    def _key_tag(key: Tuple[str, str]) -> str:
+        """Canvas tag of every item drawn for a view and day."""
+        return f"grid:{key[0]}:{key[1]}"
+    
+    @staticmethod
+    def _band_tag(key: Tuple[str, str], band: int) -> str:
+        """Canvas tag of the items of one band of a view and day."""
+        return f"band:{key[0]}:{key[1]}:{band}"
\ No newline at end of file
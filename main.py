@@ -1,11 +1,10 @@
-import tkinter as tk
-from gui.app import App
 import logging
 
 def main():
     """Launch the University Class Scheduler application."""
     logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
     try:
+        from gui.app import App
         app = App()
         app.mainloop()
     except Exception as e:
@@ -2,5 +2,7 @@ from .professor import Professor
 from .course import Course
 from .classroom import Classroom
 from .schedule import Schedule, ScheduleEntry
+from .timeline import Timeline, time_to_minutes, minutes_to_time
 
-__all__ = ["Professor", "Course", "Classroom", "Schedule", "ScheduleEntry"]
\ No newline at end of file
+__all__ = ["Professor", "Course", "Classroom", "Schedule", "ScheduleEntry",
+           "Timeline", "time_to_minutes", "minutes_to_time"]
\ No newline at end of file
@@ -1,7 +1,19 @@
 from typing import List, Tuple, Optional, Dict
+import sys
+from bisect import insort
+from .timeline import Timeline, time_to_minutes, intern_slots
 
 class Classroom:
-    """Represents a classroom where courses can be held."""
+    """Represents a classroom where courses can be held.
+
+    ``scheduled_times`` and the booking helpers (``occupancy``, ``is_available``,
+    ``schedule_class``, ``unschedule_class``) are legacy: the scheduler tracks
+    bookings in its own occupancy index and never reads them. They start empty,
+    are not persisted, and bookings found in older files are dropped on load.
+    """
+    
+    __slots__ = ("name", "capacity", "available_times", "features", "scheduled_times",
+                 "_availability", "_occupancy")
     
     def __init__(self, name: str, capacity: int = 30, 
                  available_times: Optional[List[Tuple[str, str, str]]] = None, 
@@ -22,15 +34,37 @@ class Classroom:
             raise ValueError("Classroom name must be non-empty.")
         if capacity <= 0:
             raise ValueError("Capacity must be positive.")
-        self.name = name
+        self.name = sys.intern(name)
         self.capacity = capacity
-        self.available_times = available_times if available_times is not None else []
+        self.available_times = intern_slots(available_times) if available_times is not None else []
         self.features = features if features is not None else []
         self.scheduled_times: Dict[str, List[Tuple[str, str, str]]] = {}
+        self._availability: Optional[Timeline] = None
+        self._occupancy: Optional[Timeline] = None
+    
+    @property
+    def availability(self) -> Timeline:
+        """Timeline of the minutes this classroom is open, built on first use."""
+        if self._availability is None:
+            self._availability = Timeline(self.available_times)
+        return self._availability
+    
+    @property
+    def occupancy(self) -> Timeline:
+        """Timeline of the minutes this classroom is booked, built on first use."""
+        if self._occupancy is None:
+            self._occupancy = Timeline(
+                (day, start, end)
+                for day, slots in self.scheduled_times.items()
+                for start, end, _ in slots
+            )
+        return self._occupancy
     
     def add_available_time(self, day: str, start_time: str, end_time: str) -> None:
         """Add a time slot when the classroom is available."""
-        self.available_times.append((day, start_time, end_time))
+        self.available_times.append((sys.intern(day), sys.intern(start_time), sys.intern(end_time)))
+        if self._availability is not None:
+            self._availability.add(day, time_to_minutes(start_time), time_to_minutes(end_time))
     
     def add_feature(self, feature: str) -> None:
         """Add a feature/equipment to the classroom."""
@@ -39,36 +73,35 @@ class Classroom:
     
     def is_available(self, day: str, start_time: str, end_time: str) -> bool:
         """Check if the classroom is available at the specified time."""
-        time_available = False
-        for avail_day, avail_start, avail_end in self.available_times:
-            if (avail_day == day and 
-                avail_start <= start_time and 
-                avail_end >= end_time):
-                time_available = True
-                break
-        
-        if not time_available:
-            return False
-        
-        if day in self.scheduled_times:
-            for sched_start, sched_end, _ in self.scheduled_times[day]:
-                if not (end_time <= sched_start or start_time >= sched_end):
-                    return False
-        
-        return True
+        start, end = time_to_minutes(start_time), time_to_minutes(end_time)
+        return self.availability.covers(day, start, end) and self.occupancy.is_free(day, start, end)
     
     def schedule_class(self, day: str, start_time: str, end_time: str, course_code: str) -> bool:
         """Schedule a course in this classroom."""
         if not self.is_available(day, start_time, end_time):
             return False
         
-        if day not in self.scheduled_times:
-            self.scheduled_times[day] = []
-        
-        self.scheduled_times[day].append((start_time, end_time, course_code))
-        self.scheduled_times[day].sort()
+        insort(self.scheduled_times.setdefault(sys.intern(day), []),
+               (sys.intern(start_time), sys.intern(end_time), sys.intern(course_code)))
+        self.occupancy.add(day, time_to_minutes(start_time), time_to_minutes(end_time))
         return True
     
+    def unschedule_class(self, day: str, start_time: str, end_time: str, course_code: str) -> bool:
+        """Remove a scheduled course from this classroom."""
+        slots = self.scheduled_times.get(day, [])
+        for index, slot in enumerate(slots):
+            if tuple(slot) == (start_time, end_time, course_code):
+                slots.pop(index)
+                if not slots:
+                    del self.scheduled_times[day]
+                self._occupancy = None
+                return True
+        return False
+    
+    def invalidate_availability(self) -> None:
+        """Drop the cached availability timeline after available_times was edited in place."""
+        self._availability = None
+    
     def get_schedule(self) -> Dict[str, List[Tuple[str, str, str]]]:
         """Get the schedule for this classroom."""
         return self.scheduled_times
@@ -79,21 +112,19 @@ class Classroom:
             "name": self.name,
             "capacity": self.capacity,
             "available_times": self.available_times,
-            "features": self.features,
-            "scheduled_times": self.scheduled_times
+            "features": self.features
         }
     
     @classmethod
     def from_dict(cls, data: dict) -> 'Classroom':
         """Create a Classroom from a dictionary."""
-        classroom = cls(
+        # Legacy "scheduled_times" bookings are ignored; the schedule holds them.
+        return cls(
             name=data["name"],
             capacity=data["capacity"],
             available_times=data["available_times"],
             features=data["features"]
         )
-        classroom.scheduled_times = data.get("scheduled_times", {})
-        return classroom
     
     def __str__(self) -> str:
         """String representation of the Classroom."""
@@ -1,8 +1,11 @@
+import sys
 from typing import List, Optional
 
 class Course:
     """Represents a course that can be scheduled."""
     
+    __slots__ = ("name", "code", "duration", "professors", "conflicts")
+    
     def __init__(self, name: str, code: str, duration: int = 90, 
                  professors: Optional[List[str]] = None, conflicts: Optional[List[str]] = None):
         """
@@ -23,10 +26,10 @@ class Course:
         if duration <= 0:
             raise ValueError("Duration must be positive.")
         self.name = name
-        self.code = code
+        self.code = sys.intern(code)
         self.duration = duration
-        self.professors = professors if professors is not None else []
-        self.conflicts = conflicts if conflicts is not None else []
+        self.professors = [sys.intern(name) for name in professors] if professors is not None else []
+        self.conflicts = [sys.intern(other) for other in conflicts] if conflicts is not None else []
     
     def add_professor(self, professor_name: str) -> None:
         """Add a professor who can teach this course."""
@@ -1,8 +1,12 @@
 from typing import List, Tuple, Optional
+import sys
+from .timeline import Timeline, time_to_minutes, intern_slots
 
 class Professor:
     """Represents a professor who can teach courses."""
     
+    __slots__ = ("name", "available_times", "courses", "_availability")
+    
     def __init__(self, name: str, available_times: Optional[List[Tuple[str, str, str]]] = None, 
                  courses: Optional[List[str]] = None):
         """
@@ -18,27 +22,36 @@ class Professor:
         """
         if not name or not isinstance(name, str):
             raise ValueError("Professor name must be a non-empty string.")
-        self.name = name
-        self.available_times = available_times if available_times is not None else []
-        self.courses = courses if courses is not None else []
+        self.name = sys.intern(name)
+        self.available_times = intern_slots(available_times) if available_times is not None else []
+        self.courses = [sys.intern(code) for code in courses] if courses is not None else []
+        self._availability: Optional[Timeline] = None
+    
+    @property
+    def availability(self) -> Timeline:
+        """Timeline of the minutes this professor is available, built on first use."""
+        if self._availability is None:
+            self._availability = Timeline(self.available_times)
+        return self._availability
     
     def add_available_time(self, day: str, start_time: str, end_time: str) -> None:
         """Add a time slot to the professor's availability."""
-        self.available_times.append((day, start_time, end_time))
+        self.available_times.append((sys.intern(day), sys.intern(start_time), sys.intern(end_time)))
+        if self._availability is not None:
+            self._availability.add(day, time_to_minutes(start_time), time_to_minutes(end_time))
+    
+    def invalidate_availability(self) -> None:
+        """Drop the cached availability timeline after available_times was edited in place."""
+        self._availability = None
     
     def add_course(self, course_name: str) -> None:
         """Add a course the professor can teach."""
         if course_name not in self.courses:
-            self.courses.append(course_name)
+            self.courses.append(sys.intern(course_name))
     
     def is_available(self, day: str, start_time: str, end_time: str) -> bool:
         """Check if the professor is available at the specified time."""
-        for avail_day, avail_start, avail_end in self.available_times:
-            if (avail_day == day and 
-                avail_start <= start_time and 
-                avail_end >= end_time):
-                return True
-        return False
+        return self.availability.covers(day, time_to_minutes(start_time), time_to_minutes(end_time))
     
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
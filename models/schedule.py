@@ -1,17 +1,35 @@
-from typing import List, Dict
+import sys
+from typing import Any, List, Dict
+from .timeline import Timeline, time_to_minutes
 
 class ScheduleEntry:
-    """Represents a single scheduled class in the timetable."""
+    """Represents a single scheduled class in the timetable.
+
+    Entries use __slots__ and interned strings, so the names, days and times
+    repeated across thousands of entries are stored once.
+    """
+    
+    __slots__ = ("course_code", "professor_name", "classroom_name", "day", "start_time", "end_time")
     
     def __init__(self, course_code: str, professor_name: str, classroom_name: str, 
                  day: str, start_time: str, end_time: str):
         """Initialize a ScheduleEntry instance."""
-        self.course_code = course_code
-        self.professor_name = professor_name
-        self.classroom_name = classroom_name
-        self.day = day
-        self.start_time = start_time
-        self.end_time = end_time
+        self.course_code = sys.intern(course_code)
+        self.professor_name = sys.intern(professor_name)
+        self.classroom_name = sys.intern(classroom_name)
+        self.day = sys.intern(day)
+        self.start_time = sys.intern(start_time)
+        self.end_time = sys.intern(end_time)
+    
+    @property
+    def start(self) -> int:
+        """Start time in minutes since midnight."""
+        return time_to_minutes(self.start_time)
+    
+    @property
+    def end(self) -> int:
+        """End time in minutes since midnight."""
+        return time_to_minutes(self.end_time)
     
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
@@ -47,33 +65,82 @@ class Schedule:
     def __init__(self):
         """Initialize a Schedule instance."""
         self.entries: List[ScheduleEntry] = []
+        self.metadata: Dict[str, Any] = {}
+        self.by_day: Dict[str, List[ScheduleEntry]] = {}
+        self.by_classroom: Dict[str, List[ScheduleEntry]] = {}
+        self.by_professor: Dict[str, List[ScheduleEntry]] = {}
+        self.by_course: Dict[str, List[ScheduleEntry]] = {}
+        self.classroom_timelines: Dict[str, Timeline] = {}
+        self.professor_timelines: Dict[str, Timeline] = {}
     
     def add_entry(self, entry: ScheduleEntry) -> None:
         """Add a ScheduleEntry to the schedule."""
         self.entries.append(entry)
+        self.by_day.setdefault(entry.day, []).append(entry)
+        self.by_classroom.setdefault(entry.classroom_name, []).append(entry)
+        self.by_professor.setdefault(entry.professor_name, []).append(entry)
+        self.by_course.setdefault(entry.course_code, []).append(entry)
+        start, end = time_to_minutes(entry.start_time), time_to_minutes(entry.end_time)
+        self.classroom_timelines.setdefault(entry.classroom_name, Timeline()).add(entry.day, start, end)
+        self.professor_timelines.setdefault(entry.professor_name, Timeline()).add(entry.day, start, end)
+    
+    def remove_entry(self, entry: ScheduleEntry) -> None:
+        """
+        Remove a ScheduleEntry from the schedule.
+
+        Raises:
+            ValueError: If the entry is not in the schedule.
+        """
+        self.entries.remove(entry)
+        for index, key in ((self.by_day, entry.day), (self.by_classroom, entry.classroom_name),
+                           (self.by_professor, entry.professor_name), (self.by_course, entry.course_code)):
+            bucket = index[key]
+            bucket.remove(entry)
+            if not bucket:
+                del index[key]
+        self._unmark(self.classroom_timelines, self.by_classroom, entry.classroom_name, entry)
+        self._unmark(self.professor_timelines, self.by_professor, entry.professor_name, entry)
+    
+    @staticmethod
+    def _unmark(timelines: Dict[str, Timeline], index: Dict[str, List[ScheduleEntry]],
+                key: str, entry: ScheduleEntry) -> None:
+        """Clear an entry from a timeline, keeping minutes still covered by other entries."""
+        timeline = timelines[key]
+        timeline.remove(entry.day, time_to_minutes(entry.start_time), time_to_minutes(entry.end_time))
+        for other in index.get(key, ()):
+            if other.day == entry.day:
+                timeline.add(other.day, time_to_minutes(other.start_time), time_to_minutes(other.end_time))
     
     def get_entries_by_day(self, day: str) -> List[ScheduleEntry]:
         """Get all entries for a specific day."""
-        return [entry for entry in self.entries if entry.day == day]
+        return list(self.by_day.get(day, ()))
+    
+    def get_entries_by_classroom(self, classroom_name: str) -> List[ScheduleEntry]:
+        """Get all entries held in a specific classroom."""
+        return list(self.by_classroom.get(classroom_name, ()))
+    
+    def get_entries_by_professor(self, professor_name: str) -> List[ScheduleEntry]:
+        """Get all entries taught by a specific professor."""
+        return list(self.by_professor.get(professor_name, ()))
+    
+    def get_entries_by_course(self, course_code: str) -> List[ScheduleEntry]:
+        """Get all entries of a specific course."""
+        return list(self.by_course.get(course_code, ()))
     
     def has_conflict(self, new_entry: ScheduleEntry) -> bool:
         """Check if adding the new entry would cause a conflict."""
-        for entry in self.entries:
-            if (entry.day == new_entry.day and 
-                entry.classroom_name == new_entry.classroom_name and
-                not (new_entry.end_time <= entry.start_time or 
-                     new_entry.start_time >= entry.end_time)):
-                return True
-            if (entry.day == new_entry.day and 
-                entry.professor_name == new_entry.professor_name and
-                not (new_entry.end_time <= entry.start_time or 
-                     new_entry.start_time >= entry.end_time)):
-                return True
+        start, end = time_to_minutes(new_entry.start_time), time_to_minutes(new_entry.end_time)
+        classroom_timeline = self.classroom_timelines.get(new_entry.classroom_name)
+        if classroom_timeline and not classroom_timeline.is_free(new_entry.day, start, end):
+            return True
+        professor_timeline = self.professor_timelines.get(new_entry.professor_name)
+        if professor_timeline and not professor_timeline.is_free(new_entry.day, start, end):
+            return True
         return False
     
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
-        return {"entries": [entry.to_dict() for entry in self.entries]}
+        return {"entries": [entry.to_dict() for entry in self.entries], "metadata": self.metadata}
     
     @classmethod
     def from_dict(cls, data: dict) -> 'Schedule':
@@ -81,4 +148,5 @@ class Schedule:
         schedule = cls()
         for entry_data in data["entries"]:
             schedule.add_entry(ScheduleEntry.from_dict(entry_data))
+        schedule.metadata = dict(data.get("metadata", {}))
         return schedule
\ No newline at end of file
@@ -0,0 +1,79 @@
+import sys
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+MINUTES_PER_DAY = 24 * 60
+
+
+@lru_cache(maxsize=4096)
+def time_to_minutes(time_str: str) -> int:
+    """Convert an "HH:MM" string to minutes since midnight."""
+    hours, minutes = time_str.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+def minutes_to_time(minutes: int) -> str:
+    """Convert minutes since midnight to an "HH:MM" string."""
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def intern_slots(slots: Iterable[Tuple[str, ...]]) -> List[Tuple[str, ...]]:
+    """Return the slots as tuples of interned strings, so repeated days and times share one object."""
+    return [tuple(sys.intern(value) for value in slot) for slot in slots]
+
+
+def interval_mask(start: int, end: int) -> int:
+    """Return a bitmask with one bit set per minute in [start, end)."""
+    if end <= start:
+        return 0
+    return ((1 << (end - start)) - 1) << start
+
+
+class Timeline:
+    """Per-day occupancy bitmasks at one-minute granularity.
+
+    Bit ``m`` of a day's mask is set when minute ``m`` after midnight is
+    covered, so overlap and containment checks are single mask operations
+    instead of string comparisons over lists of intervals.
+    """
+
+    __slots__ = ("masks",)
+
+    def __init__(self, intervals: Iterable[Tuple[str, str, str]] = ()):
+        """
+        Initialize a Timeline.
+
+        Args:
+            intervals (Iterable[Tuple[str, str, str]], optional): Initial
+                (day, start_time, end_time) intervals to mark.
+        """
+        self.masks: Dict[str, int] = {}
+        for day, start_time, end_time in intervals:
+            self.add(day, time_to_minutes(start_time), time_to_minutes(end_time))
+
+    def add(self, day: str, start: int, end: int) -> None:
+        """Mark the minutes [start, end) on the given day."""
+        self.masks[day] = self.masks.get(day, 0) | interval_mask(start, end)
+
+    def remove(self, day: str, start: int, end: int) -> None:
+        """Clear the minutes [start, end) on the given day."""
+        mask = self.masks.get(day, 0) & ~interval_mask(start, end)
+        if mask:
+            self.masks[day] = mask
+        else:
+            self.masks.pop(day, None)
+
+    def is_free(self, day: str, start: int, end: int) -> bool:
+        """Check that no minute in [start, end) is marked."""
+        return not (self.masks.get(day, 0) & interval_mask(start, end))
+
+    def covers(self, day: str, start: int, end: int) -> bool:
+        """Check that every minute in [start, end) is marked."""
+        mask = interval_mask(start, end)
+        return self.masks.get(day, 0) & mask == mask
+
+    def copy(self) -> 'Timeline':
+        """Return an independent copy of this timeline."""
+        timeline = Timeline()
+        timeline.masks = dict(self.masks)
+        return timeline
\ No newline at end of file
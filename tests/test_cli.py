@@ -0,0 +1,48 @@
+import json
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+from benchmarks import generate_instance, PRESETS
+from models import Schedule
+from utils import SchedulerEngine
+from utils.cli import main
+from utils.persistence import save_data
+
+
+class CliTest(unittest.TestCase):
+    """Exit codes and statistics of `python -m utils.cli solve`."""
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.directory = tempfile.mkdtemp()
+        self.input = os.path.join(self.directory, "input.json")
+        self.output = os.path.join(self.directory, "output.json")
+        self.professors, self.courses, self.classrooms = generate_instance(**PRESETS["small"], seed=3)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        shutil.rmtree(self.directory)
+
+    def test_optimize_keeps_solve_stats(self):
+        save_data(self.input, self.professors, self.courses, self.classrooms)
+        code = main(["solve", self.input, "-o", self.output, "--seed", "1", "--optimize", "0.2"])
+        self.assertEqual(code, 0)
+        with open(self.output) as f:
+            stats = json.load(f)["stats"]
+        self.assertIn("iterations", stats["solve"])
+        self.assertIn("accepted", stats["optimize"])
+
+    def test_conflicting_pinned_entries_exit_with_error(self):
+        schedule = SchedulerEngine(self.professors, self.courses, self.classrooms, seed=1).generate_schedule()
+        pinned = Schedule()
+        pinned.add_entry(schedule.entries[0])
+        pinned.add_entry(schedule.entries[0])
+        save_data(self.input, self.professors, self.courses, self.classrooms, pinned)
+        self.assertEqual(main(["solve", self.input, "-o", self.output, "--keep-schedule"]), 1)
+        self.assertFalse(os.path.exists(self.output))
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,44 @@
+import logging
+import unittest
+from models import Classroom, Course, Professor
+from utils import SchedulerEngine
+
+
+def _tight_instance():
+    """Two professors whose courses exactly fill their available minutes."""
+    professors = [Professor("Ada", [("Monday", "08:00", "14:00")], ["A", "B", "C", "D"]),
+                  Professor("Bo", [("Monday", "08:00", "11:00")], ["E", "F"])]
+    courses = [Course("Algebra", "A", 120, ["Ada"]), Course("Biology", "B", 90, ["Ada"]),
+               Course("Chemistry", "C", 90, ["Ada"]), Course("Drawing", "D", 60, ["Ada"]),
+               Course("Economics", "E", 90, ["Bo"]), Course("French", "F", 90, ["Bo"])]
+    classrooms = [Classroom("R1", 30, [("Monday", "08:00", "14:00")]),
+                  Classroom("R2", 30, [("Monday", "08:00", "11:00")])]
+    return professors, courses, classrooms
+
+
+class CspTest(unittest.TestCase):
+    """The CSP strategy places every course of a tight but feasible instance."""
+
+    def setUp(self):
+        logging.disable(logging.WARNING)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_tight_instance_is_completed(self):
+        for seed in range(10):
+            with self.subTest(seed=seed):
+                professors, courses, classrooms = _tight_instance()
+                engine = SchedulerEngine(professors, courses, classrooms, strategy="csp", seed=seed)
+                schedule = engine.generate_schedule()
+                self.assertEqual(sorted(entry.course_code for entry in schedule.entries), ["A", "B", "C", "D", "E", "F"])
+                for first in schedule.entries:
+                    for second in schedule.entries:
+                        if first is not second and first.day == second.day and first.start < second.end \
+                                and second.start < first.end:
+                            self.assertNotEqual(first.professor_name, second.professor_name)
+                            self.assertNotEqual(first.classroom_name, second.classroom_name)
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,46 @@
+import logging
+import unittest
+from models import Classroom, Course, Professor
+from utils import SchedulerEngine
+
+
+def _engine(codes=None, strategy="greedy"):
+    """Engine over a toy catalog, limited to the given course codes."""
+    professors = [Professor("Ada", [("Monday", "08:00", "11:00")], ["A", "B", "C"]),
+                  Professor("Bo", [("Tuesday", "08:00", "09:00")], ["D"])]
+    courses = [Course("Algebra", "A", 90, ["Ada"]), Course("Biology", "B", 90, ["Ada"]),
+               Course("Chemistry", "C", 90, ["Ada"]), Course("Drawing", "D", 120, ["Bo"]),
+               Course("Economics", "E", 60, [])]
+    classrooms = [Classroom("R1", 30, [("Monday", "08:00", "18:00"), ("Tuesday", "08:00", "18:00")])]
+    if codes is not None:
+        courses = [course for course in courses if course.code in codes]
+    return SchedulerEngine(professors, courses, classrooms, strategy=strategy, seed=1)
+
+
+class DiagnosticsTest(unittest.TestCase):
+    """SchedulerEngine.diagnose explains why a toy instance cannot be scheduled."""
+
+    def setUp(self):
+        logging.disable(logging.WARNING)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_infeasible_courses_are_explained(self):
+        engine = _engine()
+        found = {tuple(d.courses): d for d in engine.diagnose()}
+        self.assertEqual(found[("E",)].resource, "professor")
+        self.assertIsNone(found[("E",)].name)
+        self.assertEqual(found[("D",)].name, "Bo")
+        self.assertEqual(found[("A", "B", "C")].resource, "professor")
+        self.assertEqual(found[("A", "B", "C")].name, "Ada")
+        self.assertEqual(engine.diagnostics, list(found.values()))
+
+    def test_feasible_courses_are_not_reported(self):
+        engine = _engine({"A", "B"}, strategy="csp")
+        self.assertEqual(engine.diagnose(), [])
+        self.assertEqual(len(engine.generate_schedule().entries), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,34 @@
+import logging
+import unittest
+from benchmarks import generate_instance, PRESETS
+from utils import SchedulerEngine
+from utils.objective import Objective
+
+
+class OptimizerTest(unittest.TestCase):
+    """SchedulerEngine.optimize never worsens a schedule and tolerates stale entries."""
+
+    def setUp(self):
+        logging.disable(logging.WARNING)
+        self.professors, self.courses, self.classrooms = generate_instance(**PRESETS["small"], seed=5)
+        self.schedule = SchedulerEngine(self.professors, self.courses, self.classrooms, seed=5).generate_schedule()
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_cost_never_increases(self):
+        engine = SchedulerEngine(self.professors, self.courses, self.classrooms, seed=5)
+        optimized = engine.optimize(self.schedule, time_budget=0.3)
+        self.assertLessEqual(optimized.metadata["objective"], Objective().evaluate(self.schedule))
+        self.assertEqual(len(optimized.entries), len(self.schedule.entries))
+
+    def test_professor_removed_from_catalog(self):
+        removed = self.schedule.entries[0].professor_name
+        professors = [professor for professor in self.professors if professor.name != removed]
+        engine = SchedulerEngine(professors, self.courses, self.classrooms, seed=5)
+        optimized = engine.optimize(self.schedule, time_budget=0.3)
+        self.assertEqual(len(optimized.entries), len(self.schedule.entries))
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
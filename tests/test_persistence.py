@@ -0,0 +1,61 @@
+import json
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+from benchmarks import generate_instance, PRESETS
+from utils import SchedulerEngine
+from utils.persistence import load_data, save_data
+
+
+class PersistenceTest(unittest.TestCase):
+    """Round trips and failure handling of JSON data files."""
+
+    def setUp(self):
+        logging.disable(logging.WARNING)
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "data.json")
+        self.professors, self.courses, self.classrooms = generate_instance(**PRESETS["small"], seed=8)
+        self.schedule = SchedulerEngine(self.professors, self.courses, self.classrooms, seed=8).generate_schedule()
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        shutil.rmtree(self.directory)
+
+    def test_round_trip(self):
+        for indent in (4, None):
+            with self.subTest(indent=indent):
+                save_data(self.path, self.professors, self.courses, self.classrooms, self.schedule,
+                          [("C1", "C2"), ("C3", "C4", "C5")], indent=indent, stats={"runs": 1})
+                data = load_data(self.path)
+                self.assertEqual([p.to_dict() for p in data["professors"]], [p.to_dict() for p in self.professors])
+                self.assertEqual([c.to_dict() for c in data["courses"]], [c.to_dict() for c in self.courses])
+                self.assertEqual([c.to_dict() for c in data["classrooms"]], [c.to_dict() for c in self.classrooms])
+                self.assertEqual(data["schedule"].to_dict(), self.schedule.to_dict())
+                self.assertEqual(data["non_overlap_courses"], [("C1", "C2"), ("C3", "C4", "C5")])
+                with open(self.path) as f:
+                    self.assertEqual(json.load(f)["stats"], {"runs": 1})
+
+    def test_no_schedule_loads_as_none(self):
+        save_data(self.path, self.professors, self.courses, self.classrooms)
+        self.assertIsNone(load_data(self.path)["schedule"])
+
+    def test_failed_save_leaves_previous_file(self):
+        save_data(self.path, self.professors, self.courses, self.classrooms, self.schedule)
+        with open(self.path) as f:
+            before = f.read()
+
+        def failing_courses():
+            yield self.courses[0]
+            raise RuntimeError("interrupted")
+
+        with self.assertRaises(RuntimeError):
+            save_data(self.path, self.professors, failing_courses(), self.classrooms)
+        with open(self.path) as f:
+            self.assertEqual(f.read(), before)
+        self.assertEqual(os.listdir(self.directory), ["data.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
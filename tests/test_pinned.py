@@ -0,0 +1,60 @@
+import logging
+import unittest
+from benchmarks import generate_instance, PRESETS
+from models import Schedule, ScheduleEntry
+from utils import SchedulerEngine
+
+
+class PinnedTest(unittest.TestCase):
+    """Pinned entries are kept unchanged and never double-booked."""
+
+    def setUp(self):
+        logging.disable(logging.WARNING)
+        self.professors, self.courses, self.classrooms = generate_instance(**PRESETS["small"], seed=6)
+        schedule = SchedulerEngine(self.professors, self.courses, self.classrooms, seed=6).generate_schedule()
+        self.pinned = schedule.entries[:5]
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_pinned_entries_are_preserved(self):
+        pinned = [entry.to_dict() for entry in self.pinned]
+        for strategy in ("greedy", "csp"):
+            with self.subTest(strategy=strategy):
+                engine = SchedulerEngine(self.professors, self.courses, self.classrooms, strategy=strategy, seed=1)
+                schedule = engine.generate_schedule(pinned=self.pinned)
+                entries = [entry.to_dict() for entry in schedule.entries]
+                for entry in pinned:
+                    self.assertIn(entry, entries)
+                codes = [entry.course_code for entry in schedule.entries]
+                self.assertEqual(len(codes), len(set(codes)))
+                for entry in schedule.entries:
+                    if entry.course_code in {pin.course_code for pin in self.pinned}:
+                        continue
+                    for pin in self.pinned:
+                        if entry.day == pin.day and entry.start < pin.end and pin.start < entry.end:
+                            self.assertNotEqual(entry.classroom_name, pin.classroom_name)
+                            self.assertNotEqual(entry.professor_name, pin.professor_name)
+
+    def test_pinned_schedule_is_accepted(self):
+        pinned = Schedule()
+        for entry in self.pinned:
+            pinned.add_entry(entry)
+        schedule = SchedulerEngine(self.professors, self.courses, self.classrooms, seed=1).generate_schedule(
+            pinned=pinned)
+        self.assertEqual([entry.to_dict() for entry in schedule.entries[:5]],
+                         [entry.to_dict() for entry in self.pinned])
+
+    def test_invalid_pinned_entries_are_rejected(self):
+        engine = SchedulerEngine(self.professors, self.courses, self.classrooms, seed=1)
+        first = self.pinned[0]
+        unknown = ScheduleEntry("NOPE", first.professor_name, first.classroom_name, first.day,
+                                first.start_time, first.end_time)
+        for pinned in ([first, first], [unknown]):
+            with self.subTest(pinned=len(pinned)):
+                with self.assertRaises(ValueError):
+                    engine.generate_schedule(pinned=pinned)
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,47 @@
+import logging
+import unittest
+from benchmarks import generate_instance, PRESETS
+from utils import SchedulerEngine
+
+
+def _entries(schedule):
+    """Return a schedule's entries as comparable dicts, in order."""
+    return [entry.to_dict() for entry in schedule.entries]
+
+
+class RepairTest(unittest.TestCase):
+    """SchedulerEngine.repair keeps the entries a change does not touch."""
+
+    def setUp(self):
+        logging.disable(logging.WARNING)
+        self.professors, self.courses, self.classrooms = generate_instance(**PRESETS["small"], seed=1)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_empty_change_set_returns_schedule_unchanged(self):
+        for strategy in ("greedy", "csp"):
+            with self.subTest(strategy=strategy):
+                engine = SchedulerEngine(self.professors, self.courses, self.classrooms, strategy=strategy, seed=1)
+                # A partial schedule: courses left out before the repair must not reshuffle it.
+                schedule = engine.generate_schedule(max_iterations=15, time_limit=0.01)
+                repaired = engine.repair(schedule, {})
+                self.assertEqual(_entries(repaired), _entries(schedule))
+                self.assertEqual(repaired.metadata["repaired"], [])
+
+    def test_untouched_entries_are_kept(self):
+        engine = SchedulerEngine(self.professors, self.courses, self.classrooms, seed=1)
+        schedule = engine.generate_schedule()
+        professor = schedule.entries[0].professor_name
+        engine.professors_dict[professor].available_times.clear()
+        repaired = engine.repair(schedule, {"professors": [professor]})
+
+        after = {entry.course_code: entry.to_dict() for entry in repaired.entries}
+        for entry in schedule.entries:
+            if entry.professor_name != professor:
+                self.assertEqual(after.get(entry.course_code), entry.to_dict())
+        self.assertFalse(any(entry.professor_name == professor for entry in repaired.entries))
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,70 @@
+import itertools
+import logging
+import unittest
+from benchmarks import generate_instance, PRESETS
+from gui.schedule_model import COLUMNS, DAY_ORDER, FILTER_FIELDS, ScheduleTableModel
+from utils import SchedulerEngine
+
+
+def _day(entry):
+    """Weekday position of an entry, as the Day column sorts it."""
+    return DAY_ORDER.index(entry.day)
+
+
+# Brute-force sort keys per column, ties broken by day and start time.
+SORT_KEYS = {
+    "Day": lambda e: (_day(e), e.start),
+    "Time": lambda e: (e.start, e.end, _day(e)),
+    "Course": lambda e: (e.course_code, _day(e), e.start),
+    "Professor": lambda e: (e.professor_name, _day(e), e.start),
+    "Classroom": lambda e: (e.classroom_name, _day(e), e.start),
+}
+
+
+class ScheduleTableModelTest(unittest.TestCase):
+    """Filtered and sorted views match filtering and sorting the entries directly."""
+
+    def setUp(self):
+        logging.disable(logging.WARNING)
+        professors, courses, classrooms = generate_instance(**PRESETS["medium"], seed=3)
+        self.schedule = SchedulerEngine(professors, courses, classrooms, seed=3).generate_schedule()
+        self.model = ScheduleTableModel(self.schedule)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def expected(self, filters, column, descending):
+        entries = [entry for entry in self.schedule.entries
+                   if all(getattr(entry, FILTER_FIELDS[name]) == value for name, value in filters.items())]
+        entries.sort(key=SORT_KEYS[column])
+        if descending:
+            entries.reverse()
+        return [entry.to_dict() for entry in entries]
+
+    def test_matches_brute_force(self):
+        entry = self.schedule.entries[0]
+        cases = [{}, {"Day": entry.day}, {"Course": entry.course_code}, {"Professor": entry.professor_name},
+                 {"Classroom": entry.classroom_name}, {"Day": entry.day, "Professor": entry.professor_name},
+                 {"Day": entry.day, "Course": "missing"}]
+        for filters, column, descending in itertools.product(cases, COLUMNS, (False, True)):
+            with self.subTest(filters=filters, column=column, descending=descending):
+                self.model.set_filters({name: filters.get(name) for name in FILTER_FIELDS})
+                self.model.sort(column, descending)
+                visible = [self.model.entry(position).to_dict() for position in range(len(self.model))]
+                self.assertEqual(visible, self.expected(filters, column, descending))
+                self.assertEqual(len(self.model.rows(0, len(self.model))), len(visible))
+
+    def test_all_clears_a_filter(self):
+        self.model.set_filter("Day", self.schedule.entries[0].day)
+        self.model.set_filter("Day", "All")
+        self.assertEqual(len(self.model), len(self.schedule.entries))
+
+    def test_unknown_columns_are_rejected(self):
+        with self.assertRaises(ValueError):
+            self.model.set_filter("Time", "08:00-09:30")
+        with self.assertRaises(ValueError):
+            self.model.sort("Room")
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
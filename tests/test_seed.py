@@ -0,0 +1,42 @@
+import logging
+import unittest
+from benchmarks import generate_instance, PRESETS
+from utils import SchedulerEngine
+
+
+def _entries(schedule):
+    """Return a schedule's entries as comparable dicts, in order."""
+    return [entry.to_dict() for entry in schedule.entries]
+
+
+class SeedTest(unittest.TestCase):
+    """Runs with the same seed produce the same schedule."""
+
+    def setUp(self):
+        logging.disable(logging.WARNING)
+        self.professors, self.courses, self.classrooms = generate_instance(**PRESETS["small"], seed=4)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def _run(self, strategy, seed):
+        engine = SchedulerEngine(self.professors, self.courses, self.classrooms, strategy=strategy, seed=seed)
+        return engine.generate_schedule()
+
+    def test_same_seed_same_schedule(self):
+        for strategy in ("greedy", "csp"):
+            with self.subTest(strategy=strategy):
+                first = self._run(strategy, 7)
+                self.assertEqual(_entries(self._run(strategy, 7)), _entries(first))
+                self.assertEqual(first.metadata["seed"], 7)
+
+    def test_engine_rerun_is_reproducible(self):
+        engine = SchedulerEngine(self.professors, self.courses, self.classrooms, seed=7)
+        self.assertEqual(_entries(engine.generate_schedule()), _entries(engine.generate_schedule()))
+
+    def test_different_seeds_differ(self):
+        self.assertNotEqual(_entries(self._run("greedy", 1)), _entries(self._run("greedy", 2)))
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,58 @@
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+from benchmarks import generate_instance, PRESETS
+from utils import SchedulerEngine
+from utils.snapshot import Snapshot, dump_snapshot, dumps_snapshot, loads_schedule
+
+
+class SnapshotTest(unittest.TestCase):
+    """Binary snapshots decode to the instance and schedule they were made from."""
+
+    def setUp(self):
+        logging.disable(logging.WARNING)
+        self.directory = tempfile.mkdtemp()
+        self.professors, self.courses, self.classrooms = generate_instance(**PRESETS["small"], seed=9)
+        self.schedule = SchedulerEngine(self.professors, self.courses, self.classrooms, seed=9).generate_schedule()
+        self.groups = [("C1", "C2", "C3"), ("C4", "C5")]
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        shutil.rmtree(self.directory)
+
+    def assertRoundTrip(self, snapshot):
+        self.assertEqual([p.to_dict() for p in snapshot.professors()], [p.to_dict() for p in self.professors])
+        self.assertEqual([c.to_dict() for c in snapshot.courses()], [c.to_dict() for c in self.courses])
+        self.assertEqual([c.to_dict() for c in snapshot.classrooms()], [c.to_dict() for c in self.classrooms])
+        self.assertEqual(snapshot.schedule().to_dict(), self.schedule.to_dict())
+        self.assertEqual(snapshot.non_overlap_courses(), self.groups)
+
+    def test_round_trip_in_memory(self):
+        snapshot = Snapshot(dumps_snapshot(self.professors, self.courses, self.classrooms, self.schedule, self.groups))
+        try:
+            self.assertRoundTrip(snapshot)
+        finally:
+            snapshot.close()
+
+    def test_round_trip_memory_mapped(self):
+        path = os.path.join(self.directory, "instance.snap")
+        dump_snapshot(path, self.professors, self.courses, self.classrooms, self.schedule, self.groups)
+        snapshot = Snapshot.open(path)
+        try:
+            self.assertRoundTrip(snapshot)
+        finally:
+            snapshot.close()
+
+    def test_schedule_only(self):
+        self.assertEqual(loads_schedule(dumps_snapshot(schedule=self.schedule)).to_dict(), self.schedule.to_dict())
+        self.assertIsNone(loads_schedule(dumps_snapshot(self.professors)))
+
+    def test_rejects_other_data(self):
+        with self.assertRaises(ValueError):
+            Snapshot(b"\0" * 64)
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
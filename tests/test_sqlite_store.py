@@ -0,0 +1,64 @@
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+from benchmarks import generate_instance, PRESETS
+from utils import SchedulerEngine
+from utils.persistence import load_data, save_data
+from utils.sqlite_store import SQLiteStore
+
+
+class SQLiteStoreTest(unittest.TestCase):
+    """Round trips and indexed queries of the SQLite backend."""
+
+    def setUp(self):
+        logging.disable(logging.WARNING)
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "data.db")
+        self.professors, self.courses, self.classrooms = generate_instance(**PRESETS["small"], seed=2)
+        self.schedule = SchedulerEngine(self.professors, self.courses, self.classrooms, seed=2).generate_schedule()
+        save_data(self.path, self.professors, self.courses, self.classrooms, self.schedule,
+                  [("C1", "C2", "C3"), ("C4", "C5")])
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        shutil.rmtree(self.directory)
+
+    def test_round_trip(self):
+        data = load_data(self.path)
+        self.assertEqual([p.to_dict() for p in data["professors"]], [p.to_dict() for p in self.professors])
+        self.assertEqual([c.to_dict() for c in data["courses"]], [c.to_dict() for c in self.courses])
+        self.assertEqual([c.to_dict() for c in data["classrooms"]], [c.to_dict() for c in self.classrooms])
+        self.assertEqual(data["schedule"].to_dict(), self.schedule.to_dict())
+        self.assertEqual(data["non_overlap_courses"], [("C1", "C2", "C3"), ("C4", "C5")])
+
+    def test_entries_filters_match_schedule(self):
+        entry = self.schedule.entries[0]
+        with SQLiteStore(self.path) as store:
+            self.assertEqual(len(store.entries()), len(self.schedule.entries))
+            for filters, attribute in (({"day": entry.day}, "day"),
+                                       ({"classroom": entry.classroom_name}, "classroom_name"),
+                                       ({"professor": entry.professor_name}, "professor_name"),
+                                       ({"course": entry.course_code}, "course_code")):
+                expected = [e.to_dict() for e in self.schedule.entries
+                            if getattr(e, attribute) == getattr(entry, attribute)]
+                self.assertEqual([e.to_dict() for e in store.entries(**filters)], expected)
+            both = store.entries(day=entry.day, professor=entry.professor_name)
+            self.assertTrue(all(e.day == entry.day and e.professor_name == entry.professor_name for e in both))
+
+    def test_load_catalog_leaves_schedule_in_database(self):
+        with SQLiteStore(self.path) as store:
+            data = store.load_catalog()
+            self.assertIsNone(data["schedule"])
+            self.assertEqual(len(data["courses"]), len(self.courses))
+            self.assertTrue(store.has_schedule())
+
+    def test_unchanged_save_rewrites_nothing(self):
+        with SQLiteStore(self.path) as store, store.conn:
+            self.assertEqual(store._sync("courses", "code", self.courses, lambda c: c.code, store._write_course), 0)
+            self.assertEqual(store._sync_schedule(self.schedule), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
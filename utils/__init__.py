@@ -1,3 +1,3 @@
-from .scheduler_engine import SchedulerEngine
+from .scheduler_engine import SchedulerEngine, STRATEGIES, BACKENDS
 
-__all__ = ["SchedulerEngine"]
\ No newline at end of file
+__all__ = ["SchedulerEngine", "STRATEGIES", "BACKENDS"]
\ No newline at end of file
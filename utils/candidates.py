@@ -0,0 +1,76 @@
+from typing import Dict, List, Tuple
+from models import Professor, Course, Classroom
+from models.timeline import time_to_minutes, interval_mask
+
+# A feasible placement for a course: (professor name, day, start minute, end minute).
+Placement = Tuple[str, str, int, int]
+
+
+class CandidateTable:
+    """Feasible placements per course, computed once per scheduling run.
+
+    A placement is kept when a qualified professor is available for the whole
+    interval and at least one classroom is open for it. Classroom candidates
+    are shared by every course that needs the same (day, start, end) interval.
+    Only static availability is checked here; occupancy changes during a run
+    and is left to the strategies.
+    """
+
+    def __init__(self, professors: List[Professor], courses: List[Course], classrooms: List[Classroom],
+                 time_slots: List[Tuple[str, str, str]]):
+        """
+        Build the candidate table.
+
+        Args:
+            professors (List[Professor]): List of professors.
+            courses (List[Course]): List of courses.
+            classrooms (List[Classroom]): List of classrooms.
+            time_slots (List[Tuple[str, str, str]]): Slots whose start times are
+                the allowed course start times.
+        """
+        self.classrooms = classrooms
+        self.placements: Dict[str, List[Placement]] = {}
+        self.by_professor: Dict[str, Dict[str, List[Placement]]] = {}
+        self.rooms: Dict[Tuple[str, int, int], List[Classroom]] = {}
+        self.coverages: Dict[str, Dict[str, int]] = {}
+
+        professors_dict = {p.name: p for p in professors}
+        starts = [(day, time_to_minutes(start)) for day, start, _ in time_slots]
+        for course in courses:
+            placements: List[Placement] = []
+            by_professor: Dict[str, List[Placement]] = {}
+            for name in course.professors:
+                professor = professors_dict.get(name)
+                if professor is None or name in by_professor:
+                    continue
+                by_professor[name] = []
+                for day, start in starts:
+                    end = start + course.duration
+                    if not professor.availability.covers(day, start, end):
+                        continue
+                    if not self.rooms_for(day, start, end):
+                        continue
+                    placement = (name, day, start, end)
+                    placements.append(placement)
+                    by_professor[name].append(placement)
+            self.placements[course.code] = placements
+            self.by_professor[course.code] = by_professor
+
+    def rooms_for(self, day: str, start: int, end: int) -> List[Classroom]:
+        """Return the classrooms whose availability windows cover the interval."""
+        key = (day, start, end)
+        rooms = self.rooms.get(key)
+        if rooms is None:
+            rooms = [room for room in self.classrooms if room.availability.covers(day, start, end)]
+            self.rooms[key] = rooms
+        return rooms
+    
+    def coverage(self, code: str) -> Dict[str, int]:
+        """Return per-day minute masks of the union of a course's placements."""
+        masks = self.coverages.get(code)
+        if masks is None:
+            masks = {}
+            for _, day, start, end in self.placements.get(code, ()):
+                masks[day] = masks.get(day, 0) | interval_mask(start, end)
+            self.coverages[code] = masks
+        return masks
\ No newline at end of file
@@ -0,0 +1,107 @@
+import argparse
+import logging
+import sys
+import time
+from typing import List, Optional
+from utils.persistence import load_data, save_data
+from utils.scheduler_engine import SchedulerEngine, STRATEGIES, BACKENDS
+
+
+def solve(args: argparse.Namespace) -> int:
+    """Load a data file, generate a schedule and write it with run statistics."""
+    try:
+        data = load_data(args.input)
+    except (OSError, ValueError, KeyError) as e:
+        logging.error(f"Failed to load {args.input}: {str(e)}")
+        return 1
+    if not all([data["professors"], data["courses"], data["classrooms"]]):
+        logging.error("Input must contain professors, courses and classrooms.")
+        return 1
+
+    try:
+        engine = SchedulerEngine(data["professors"], data["courses"], data["classrooms"],
+                                 strategy=args.strategy, seed=args.seed, backend=args.backend)
+    except ImportError as e:
+        logging.error(str(e))
+        return 1
+    pinned = data["schedule"] if args.keep_schedule else None
+    started = time.perf_counter()
+    try:
+        if args.best_of > 1:
+            schedule = engine.generate_best_of(args.best_of, workers=args.workers,
+                                               non_overlap_courses=data["non_overlap_courses"],
+                                               max_iterations=args.max_iterations, pinned=pinned,
+                                               time_limit=args.timeout)
+        else:
+            schedule = engine.generate_schedule(non_overlap_courses=data["non_overlap_courses"],
+                                                max_iterations=args.max_iterations, pinned=pinned,
+                                                time_limit=args.timeout)
+    except ValueError as e:
+        logging.error(f"Failed to solve {args.input}: {str(e)}")
+        return 1
+    solve_time = time.perf_counter() - started
+    solve_stats = dict(engine.stats)
+    optimize_stats = None
+    if args.optimize > 0:
+        schedule = engine.optimize(schedule, time_budget=args.optimize,
+                                   non_overlap_courses=data["non_overlap_courses"], pinned=pinned)
+        optimize_stats = dict(engine.stats)
+
+    scheduled_codes = {entry.course_code for entry in schedule.entries}
+    unscheduled = sorted(c.code for c in data["courses"] if c.code not in scheduled_codes)
+    stats = {
+        "strategy": args.strategy,
+        "backend": args.backend,
+        "seed": schedule.metadata.get("seed"),
+        "solve_time": round(solve_time, 4),
+        "total_time": round(time.perf_counter() - started, 4),
+        "scheduled": len(scheduled_codes),
+        "unscheduled": unscheduled,
+        "diagnostics": [diagnosis.to_dict() for diagnosis in engine.diagnostics],
+        "solve": solve_stats,
+    }
+    if optimize_stats is not None:
+        stats["optimize"] = optimize_stats
+    save_data(args.output, data["professors"], data["courses"], data["classrooms"], schedule,
+              data["non_overlap_courses"], indent=None if args.compact else 4, stats=stats)
+    logging.info(f"Wrote {len(schedule.entries)} entries to {args.output}; "
+                 f"{len(unscheduled)} courses unscheduled.")
+    return 3 if unscheduled and args.strict else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
+    parser = argparse.ArgumentParser(prog="python -m utils.cli",
+                                     description="Headless University Class Scheduler.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    solve_parser = subparsers.add_parser("solve", help="Generate a schedule for a data file.")
+    solve_parser.add_argument("input", help="Data file in the format saved by the application.")
+    solve_parser.add_argument("-o", "--output", required=True, help="File to write the catalog, schedule and stats to.")
+    solve_parser.add_argument("--strategy", choices=STRATEGIES, default="greedy", help="Search strategy.")
+    solve_parser.add_argument("--backend", choices=BACKENDS, default="python",
+                              help="Data structures for feasibility tests; numpy requires NumPy.")
+    solve_parser.add_argument("--seed", type=int, help="Random seed; drawn at random when omitted.")
+    solve_parser.add_argument("--timeout", type=float, help="Seconds each solve may run.")
+    solve_parser.add_argument("--max-iterations", type=int, default=1000, help="Iteration limit of the greedy strategy.")
+    solve_parser.add_argument("--best-of", type=int, default=1, help="Run this many seeded attempts and keep the best.")
+    solve_parser.add_argument("--workers", type=int, help="Worker processes for --best-of.")
+    solve_parser.add_argument("--optimize", type=float, default=0.0, metavar="SECONDS",
+                              help="Improve soft constraints by local search for this long.")
+    solve_parser.add_argument("--keep-schedule", action="store_true",
+                              help="Pin the entries of the schedule already in the input.")
+    solve_parser.add_argument("--compact", action="store_true", help="Write JSON without indentation.")
+    solve_parser.add_argument("--strict", action="store_true", help="Exit with status 3 if any course is unscheduled.")
+    solve_parser.set_defaults(handler=solve)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the command-line interface."""
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
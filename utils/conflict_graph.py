@@ -0,0 +1,134 @@
+import heapq
+from typing import Iterable, List, Optional, Tuple
+from utils.registry import Registry
+
+
+class ConflictGraph:
+    """Symmetric graph of courses that may never overlap in time.
+
+    Vertices are registry course IDs and each vertex's neighbours are kept as
+    an integer bitset, so an edge test is a shift and a mask. Besides the
+    declared conflicts, two courses that can only be taught by the same single
+    professor are joined, since that professor cannot teach both at once.
+
+    The graph offers the classic timetabling-as-coloring heuristics: a DSatur
+    order to place the most constrained courses first, and greedy cliques,
+    whose total duration is a lower bound on the time the instance needs.
+    """
+
+    def __init__(self, size: int, edges: Iterable[Tuple[int, int]] = ()):
+        """
+        Initialize a ConflictGraph.
+
+        Args:
+            size (int): Number of vertices.
+            edges (Iterable[Tuple[int, int]], optional): Undirected edges between vertex IDs.
+        """
+        self.adjacency: List[int] = [0] * size
+        for first, second in edges:
+            self.add_edge(first, second)
+
+    @classmethod
+    def from_registry(cls, registry: Registry) -> 'ConflictGraph':
+        """Build the graph of declared conflicts and shared single professors."""
+        graph = cls(len(registry.courses))
+        for course_id, others in enumerate(registry.conflicts):
+            for other in others:
+                graph.add_edge(course_id, other)
+        sole_courses: dict = {}
+        for course_id, professors in enumerate(registry.qualified):
+            if len(professors) == 1:
+                sole_courses.setdefault(next(iter(professors)), []).append(course_id)
+        for courses in sole_courses.values():
+            for index, course_id in enumerate(courses):
+                for other in courses[index + 1:]:
+                    graph.add_edge(course_id, other)
+        return graph
+
+    def add_edge(self, first: int, second: int) -> None:
+        """Join two vertices; self-loops are ignored."""
+        if first != second:
+            self.adjacency[first] |= 1 << second
+            self.adjacency[second] |= 1 << first
+
+    def conflicts(self, first: int, second: int) -> bool:
+        """Check if two courses must not overlap."""
+        return bool(self.adjacency[first] >> second & 1)
+
+    def neighbors(self, vertex: int) -> List[int]:
+        """Return the neighbours of a vertex in ascending order."""
+        return _members(self.adjacency[vertex])
+
+    def dsatur(self, vertices: Optional[Iterable[int]] = None) -> Tuple[List[int], List[int]]:
+        """
+        Color the graph with the DSatur heuristic.
+
+        The next vertex is always the one whose neighbours already use the
+        most distinct colors (its saturation), ties broken by degree, so the
+        order starts with the most constrained courses.
+
+        Args:
+            vertices (Iterable[int], optional): Vertices to color. Defaults to all.
+
+        Returns:
+            Tuple[List[int], List[int]]: The coloring order, and the color of each
+                vertex indexed by vertex ID (-1 for vertices not colored).
+        """
+        vertices = list(range(len(self.adjacency)) if vertices is None else vertices)
+        mask = 0
+        for vertex in vertices:
+            mask |= 1 << vertex
+        degrees = {vertex: bin(self.adjacency[vertex] & mask).count("1") for vertex in vertices}
+        neighbor_colors = {vertex: set() for vertex in vertices}
+        colors = [-1] * len(self.adjacency)
+        heap = [(0, -degrees[vertex], vertex) for vertex in vertices]
+        heapq.heapify(heap)
+        order: List[int] = []
+        while heap:
+            saturation, _, vertex = heapq.heappop(heap)
+            if colors[vertex] != -1 or -saturation != len(neighbor_colors[vertex]):
+                continue
+            used = neighbor_colors[vertex]
+            color = 0
+            while color in used:
+                color += 1
+            colors[vertex] = color
+            order.append(vertex)
+            for neighbor in _members(self.adjacency[vertex] & mask):
+                if colors[neighbor] == -1 and color not in neighbor_colors[neighbor]:
+                    neighbor_colors[neighbor].add(color)
+                    heapq.heappush(heap, (-len(neighbor_colors[neighbor]), -degrees[neighbor], neighbor))
+        return order, colors
+
+    def greedy_clique(self, start: int, weights: Optional[List[int]] = None) -> List[int]:
+        """
+        Grow a clique from a vertex, adding the candidate with most candidate neighbours.
+
+        Args:
+            start (int): First vertex of the clique.
+            weights (List[int], optional): Vertex weights breaking ties in favour of heavier vertices.
+
+        Returns:
+            List[int]: The clique's vertices.
+        """
+        clique = [start]
+        candidates = self.adjacency[start]
+        while candidates:
+            best, best_key = None, None
+            for vertex in _members(candidates):
+                key = (bin(self.adjacency[vertex] & candidates).count("1"), weights[vertex] if weights else 0)
+                if best_key is None or key > best_key:
+                    best, best_key = vertex, key
+            clique.append(best)
+            candidates &= self.adjacency[best]
+        return clique
+
+
+def _members(bits: int) -> List[int]:
+    """Return the indices of the set bits of an integer."""
+    members = []
+    while bits:
+        low = bits & -bits
+        members.append(low.bit_length() - 1)
+        bits ^= low
+    return members
\ No newline at end of file
@@ -0,0 +1,87 @@
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+# A non-overlap constraint as accepted by the engine: one pair (or group) of
+# course codes, several groups, or a NonOverlapGroups index.
+NonOverlap = Union[Sequence[str], Iterable[Sequence[str]], 'NonOverlapGroups']
+
+
+def normalize_non_overlap(value: Any) -> Optional[Union[Tuple[str, ...], List[Tuple[str, ...]]]]:
+    """
+    Convert a non-overlap value to its stored form.
+
+    A flat list of codes, such as the single pair saved by earlier versions,
+    stays one tuple; a list of lists becomes a list of tuples.
+
+    Args:
+        value: None, a sequence of course codes, an iterable of such sequences,
+            or a NonOverlapGroups index.
+
+    Returns:
+        None, a tuple of codes, or a list of tuples of codes.
+    """
+    if isinstance(value, NonOverlapGroups):
+        value = value.groups
+    if not value:
+        return None
+    items = list(value)
+    if all(isinstance(item, str) for item in items):
+        return tuple(items)
+    return [tuple(group) for group in items]
+
+
+class NonOverlapGroups:
+    """Index of course groups, such as student cohorts, whose members must not overlap.
+
+    Two members of a group may not share a time, nor a classroom, on the same
+    day. Groups are numbered in the order given and each course maps to the
+    groups it belongs to, so a placement is checked against the per-group
+    occupancy kept by Occupancy instead of against every other member.
+    """
+
+    __slots__ = ("groups", "by_course")
+
+    def __init__(self, groups: Iterable[Iterable[str]] = ()):
+        """
+        Build the index.
+
+        Args:
+            groups (Iterable[Iterable[str]], optional): Groups of course codes.
+                Repeated codes are dropped and groups left with fewer than two
+                courses are ignored.
+        """
+        self.groups: List[Tuple[str, ...]] = []
+        self.by_course: Dict[str, List[int]] = {}
+        for group in groups:
+            members = tuple(dict.fromkeys(group))
+            if len(members) < 2:
+                continue
+            for code in members:
+                self.by_course.setdefault(code, []).append(len(self.groups))
+            self.groups.append(members)
+
+    @classmethod
+    def coerce(cls, value: Optional[NonOverlap]) -> 'NonOverlapGroups':
+        """Return the index for any accepted non-overlap value; None gives an empty index."""
+        if isinstance(value, cls):
+            return value
+        normalized = normalize_non_overlap(value)
+        if normalized is None:
+            return cls()
+        return cls([normalized] if isinstance(normalized, tuple) else normalized)
+
+    def peers(self, code: str) -> Set[str]:
+        """Return the courses sharing a group with the given course."""
+        return {other for group_id in self.by_course.get(code, ()) for other in self.groups[group_id]
+                if other != code}
+
+    def __bool__(self) -> bool:
+        """Check if there is at least one group."""
+        return bool(self.groups)
+
+    def __len__(self) -> int:
+        """Return the number of groups."""
+        return len(self.groups)
+
+    def __iter__(self) -> Iterator[Tuple[str, ...]]:
+        """Iterate over the groups."""
+        return iter(self.groups)
\ No newline at end of file
@@ -0,0 +1,341 @@
+from typing import Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+from models import Schedule, ScheduleEntry, Timeline
+from models.timeline import time_to_minutes, minutes_to_time
+from utils.constraints import NonOverlap, NonOverlapGroups
+import logging
+import random
+import time
+
+if TYPE_CHECKING:
+    from utils.scheduler_engine import SchedulerEngine
+
+# A candidate placement for a course: (professor ID, day, start minute, end minute).
+Value = Tuple[int, str, int, int]
+
+
+class CSPSolver:
+    """Backtracking constraint solver used by the "csp" engine strategy.
+
+    Every course is a variable whose domain holds (professor, day, start)
+    placements. Assigning a course forward-checks the courses it interacts
+    with (same professor, declared conflicts, non-overlap groups) by pruning
+    their overlapping values, so dead ends are found before they are
+    searched. Variables are picked by minimum remaining values, ties broken by
+    DSatur order over the conflict graph, and values are tried
+    least-constraining first; the room is chosen when a value is
+    assigned. Courses, professors and rooms are referred to by their engine
+    registry IDs, so the search state is held in ID-indexed lists. Values
+    that constrain equally, and equally constrained rooms, are ordered by
+    the random generator, so a seed selects one of the equally good searches.
+    """
+
+    def __init__(self, engine: 'SchedulerEngine', non_overlap_courses: Optional[NonOverlap] = None,
+                 max_backtracks: int = 10000, max_backtracks_per_course: int = 100,
+                 pinned: Optional[List[ScheduleEntry]] = None, deadline: Optional[float] = None,
+                 rng: Optional[random.Random] = None):
+        """
+        Initialize the solver.
+
+        Args:
+            engine (SchedulerEngine): Engine providing the catalog and time slots.
+            non_overlap_courses (NonOverlap, optional): Pair of course codes, or
+                groups of them, whose members must not share a time or a room on
+                the same day.
+            max_backtracks (int, optional): Backtracks allowed before the solver
+                stops undoing decisions and leaves dead-end courses unscheduled.
+            max_backtracks_per_course (int, optional): Backtracks a single
+                failing course may trigger before it is left unscheduled.
+            pinned (List[ScheduleEntry], optional): Entries fixed in advance. Their
+                courses are not searched and their placements prune the others.
+            deadline (float, optional): time.perf_counter() value at which the
+                search stops and returns the courses placed so far.
+            rng (random.Random, optional): Random generator breaking ties between
+                values and between rooms.
+        """
+        self.engine = engine
+        self.rng = rng if rng is not None else random.Random()
+        self.max_backtracks = max_backtracks
+        self.max_backtracks_per_course = max_backtracks_per_course
+        self.deadline = deadline
+        self.registry = registry = engine.registry
+        self.failures: Dict[int, int] = {}
+        self.backtracks = 0
+        self.nodes = 0
+        self.pinned: List[ScheduleEntry] = list(pinned or [])
+        pinned_ids = {registry.course_ids.get(entry.course_code) for entry in self.pinned}
+        self.courses: List[int] = [course_id for course_id in range(len(registry.courses))
+                                   if course_id not in pinned_ids]
+        self.searched: List[bool] = [False] * len(registry.courses)
+        for course_id in self.courses:
+            self.searched[course_id] = True
+        # Courses sharing a non-overlap group with each course.
+        self.peers: List[Set[int]] = [set() for _ in registry.courses]
+        for group in NonOverlapGroups.coerce(non_overlap_courses):
+            members = [registry.course_ids[code] for code in group if code in registry.course_ids]
+            for course_id in members:
+                self.peers[course_id].update(other for other in members if other != course_id)
+        self.pinned_by_course: Dict[int, ScheduleEntry] = {
+            registry.course_ids[entry.course_code]: entry for entry in self.pinned
+            if entry.course_code in registry.course_ids
+        }
+
+        # Rooms with fewer open minutes are preferred so flexible rooms stay free.
+        self.room_open_minutes: List[int] = [
+            sum(bin(mask).count("1") for mask in room.availability.masks.values())
+            for room in registry.classrooms
+        ]
+        self.room_occupancy: List[Timeline] = [Timeline() for _ in registry.classrooms]
+        self.room_ties: List[float] = [self.rng.random() for _ in registry.classrooms]
+
+        self.values: List[List[Value]] = [[] for _ in registry.courses]
+        # Random key of each value, ordering values that eliminate equally many others.
+        self.value_ties: List[List[float]] = [[] for _ in registry.courses]
+        self.alive: List[List[bool]] = [[] for _ in registry.courses]
+        self.counts: List[int] = [0] * len(registry.courses)
+        self.by_day: List[Dict[str, List[int]]] = [{} for _ in registry.courses]
+        self.by_professor_day: List[Dict[Tuple[int, str], List[int]]] = [{} for _ in registry.courses]
+        self.professor_courses: List[Set[int]] = [set() for _ in registry.professors]
+        self.graph = engine.conflict_graph
+        self.conflicts: List[List[int]] = [self.graph.neighbors(course_id) for course_id in range(len(registry.courses))]
+        # Ties between equally constrained courses go to the earliest in DSatur order.
+        order, _ = engine.conflict_graph.dsatur(self.courses)
+        self.rank: List[int] = [0] * len(registry.courses)
+        for position, course_id in enumerate(order):
+            self.rank[course_id] = position
+        self._build_domains()
+
+        self.assignment: Dict[int, Tuple[Value, int]] = {}
+        # Largest assignment seen, saved before backtracking undoes it.
+        self.best_assignment: Dict[int, Tuple[Value, int]] = {}
+        self.unscheduled: Set[int] = set()
+        self.trail: List[Tuple[int, int]] = []
+        self._apply_pinned()
+
+    def _build_domains(self) -> None:
+        """Build the initial domain of every course from the engine's candidate table."""
+        candidates = self.engine.candidates
+        for code in self.courses:
+            values: List[Value] = []
+            for professor_name, day, start, end in candidates.placements.get(self.registry.courses[code].code, ()):
+                # Placements of professors missing from the registry are dropped.
+                professor_id = self.registry.professor_id(professor_name)
+                if professor_id is not None:
+                    values.append((professor_id, day, start, end))
+            self.values[code] = values
+            self.value_ties[code] = [self.rng.random() for _ in values]
+            self.alive[code] = [True] * len(values)
+            self.counts[code] = len(values)
+            by_day = self.by_day[code]
+            by_professor_day = self.by_professor_day[code]
+            for index, (professor_id, day, _, _) in enumerate(values):
+                by_day.setdefault(day, []).append(index)
+                by_professor_day.setdefault((professor_id, day), []).append(index)
+                self.professor_courses[professor_id].add(code)
+
+    def _apply_pinned(self) -> None:
+        """Book the pinned entries and permanently prune the values they rule out."""
+        for entry in self.pinned:
+            day, start, end = entry.day, time_to_minutes(entry.start_time), time_to_minutes(entry.end_time)
+            room_id = self.registry.classroom_id(entry.classroom_name)
+            if room_id is not None:
+                self.room_occupancy[room_id].add(day, start, end)
+            code = self.registry.course_id(entry.course_code)
+            if code is None:
+                continue
+            for other, professor_filter in self._neighbors(code, self.registry.professor_id(entry.professor_name)):
+                for pruned in self._overlapping(other, professor_filter, day, start, end):
+                    self.alive[other][pruned] = False
+                    self.counts[other] -= 1
+
+    def _neighbors(self, code: int, professor_id: Optional[int]) -> List[Tuple[int, Optional[int]]]:
+        """Return (course, professor filter) pairs affected by placing code with professor_id."""
+        # Conflict-graph neighbours lose every overlapping value, so each course is listed once.
+        conflicts = self.graph.conflicts
+        neighbors: List[Tuple[int, Optional[int]]] = []
+        if professor_id is not None:
+            for other in self.professor_courses[professor_id]:
+                if other != code and not conflicts(code, other):
+                    neighbors.append((other, professor_id))
+        for other in self.conflicts[code]:
+            if self.searched[other]:
+                neighbors.append((other, None))
+        for other in self.peers[code]:
+            if self.searched[other] and not conflicts(code, other):
+                neighbors.append((other, None))
+        return neighbors
+
+    def _overlapping(self, code: int, professor_id: Optional[int], day: str, start: int, end: int) -> List[int]:
+        """Return the live value indices of code on day that overlap [start, end)."""
+        if professor_id is None:
+            bucket = self.by_day[code].get(day, ())
+        else:
+            bucket = self.by_professor_day[code].get((professor_id, day), ())
+        values = self.values[code]
+        alive = self.alive[code]
+        return [index for index in bucket
+                if alive[index] and values[index][2] < end and start < values[index][3]]
+
+    def _is_open(self, code: int) -> bool:
+        """Check if a course still needs to be placed."""
+        return code not in self.assignment and code not in self.unscheduled
+
+    def _select_variable(self) -> Optional[int]:
+        """Pick the open course with the fewest remaining values (MRV)."""
+        best = None
+        best_key = None
+        for code in self.courses:
+            if not self._is_open(code):
+                continue
+            key = (self.counts[code], self.rank[code])
+            if best_key is None or key < best_key:
+                best, best_key = code, key
+        return best
+
+    def _order_values(self, code: int) -> List[int]:
+        """Order the live values of a course least-constraining first."""
+        scored = []
+        ties = self.value_ties[code]
+        for index, alive in enumerate(self.alive[code]):
+            if not alive:
+                continue
+            professor_id, day, start, end = self.values[code][index]
+            eliminated = 0
+            for other, professor_filter in self._neighbors(code, professor_id):
+                if self._is_open(other):
+                    eliminated += len(self._overlapping(other, professor_filter, day, start, end))
+            scored.append((eliminated, ties[index], index))
+        scored.sort()
+        return [index for _, _, index in scored]
+
+    def _find_room(self, code: int, day: str, start: int, end: int) -> Optional[int]:
+        """Pick the most constrained free room for the given interval."""
+        # Rooms used the same day by courses sharing a non-overlap group.
+        blocked = set()
+        for peer in self.peers[code]:
+            if peer in self.assignment:
+                (_, peer_day, _, _), peer_room = self.assignment[peer]
+                if peer_day == day:
+                    blocked.add(peer_room)
+            elif peer in self.pinned_by_course:
+                entry = self.pinned_by_course[peer]
+                if entry.day == day:
+                    blocked.add(self.registry.classroom_id(entry.classroom_name))
+        classroom_id = self.registry.classroom_id
+        best = None
+        for room in self.engine.candidates.rooms_for(day, start, end):
+            room_id = classroom_id(room.name)
+            if room_id is None or room_id in blocked or not self.room_occupancy[room_id].is_free(day, start, end):
+                continue
+            if best is None or ((self.room_open_minutes[room_id], self.room_ties[room_id]) <
+                                (self.room_open_minutes[best], self.room_ties[best])):
+                best = room_id
+        return best
+
+    def _assign(self, code: int, index: int, room_id: int) -> bool:
+        """Assign a value and forward-check neighbors; return False on a domain wipeout."""
+        value = self.values[code][index]
+        professor_id, day, start, end = value
+        self.assignment[code] = (value, room_id)
+        self.room_occupancy[room_id].add(day, start, end)
+        wiped_out = False
+        for other, professor_filter in self._neighbors(code, professor_id):
+            if not self._is_open(other):
+                continue
+            for pruned in self._overlapping(other, professor_filter, day, start, end):
+                self.alive[other][pruned] = False
+                self.counts[other] -= 1
+                self.trail.append((other, pruned))
+            if self.counts[other] == 0:
+                wiped_out = True
+        return not wiped_out
+
+    def _unassign(self, code: int, trail_mark: int) -> None:
+        """Undo an assignment and every pruning made after trail_mark."""
+        (_, day, start, end), room_id = self.assignment.pop(code)
+        self.room_occupancy[room_id].remove(day, start, end)
+        while len(self.trail) > trail_mark:
+            other, index = self.trail.pop()
+            self.alive[other][index] = True
+            self.counts[other] += 1
+
+    def _try_values(self, frame: list) -> bool:
+        """Advance a search frame to its next consistent value."""
+        code, order, position, trail_mark = frame
+        exhausted = self.backtracks >= self.max_backtracks
+        while position < len(order):
+            index = order[position]
+            position += 1
+            _, day, start, end = self.values[code][index]
+            room_id = self._find_room(code, day, start, end)
+            if room_id is None:
+                continue
+            self.nodes += 1
+            if self._assign(code, index, room_id) or exhausted:
+                frame[2] = position
+                return True
+            self._unassign(code, trail_mark)
+        frame[2] = position
+        return False
+
+    def solve(self) -> Schedule:
+        """Search for a complete assignment and return it as a Schedule."""
+        for code in self.courses:
+            if self.counts[code] == 0:
+                self.unscheduled.add(code)
+                logging.warning(f"No feasible placement for course: {self.registry.courses[code].code}")
+
+        stack: List[list] = []
+        while True:
+            if self.deadline is not None and time.perf_counter() >= self.deadline:
+                logging.warning("CSP search stopped at the time limit.")
+                break
+            if self.engine.cancelled():
+                logging.warning("CSP search cancelled.")
+                break
+            self.engine.report_progress(len(self.pinned) + len(self.assignment), self.nodes)
+            code = self._select_variable()
+            if code is None:
+                break
+            frame = [code, self._order_values(code), 0, len(self.trail)]
+            if self._try_values(frame):
+                stack.append(frame)
+                continue
+            # Dead end: backtrack to the most recent frame with values left.
+            while True:
+                if (self.backtracks >= self.max_backtracks or not stack or
+                        self.failures.get(code, 0) >= self.max_backtracks_per_course):
+                    self.unscheduled.add(code)
+                    break
+                self.backtracks += 1
+                self.failures[code] = self.failures.get(code, 0) + 1
+                if len(self.assignment) > len(self.best_assignment):
+                    self.best_assignment = dict(self.assignment)
+                frame = stack.pop()
+                self._unassign(frame[0], frame[3])
+                if self._try_values(frame):
+                    stack.append(frame)
+                    break
+
+        logging.info(f"CSP search finished: {self.nodes} nodes, {self.backtracks} backtracks, "
+                     f"{len(self.unscheduled)} unscheduled.")
+        if len(self.best_assignment) > len(self.assignment):
+            logging.info(f"Keeping an earlier assignment of {len(self.best_assignment)} courses.")
+            return self._build_schedule(self.best_assignment)
+        return self._build_schedule(self.assignment)
+
+    def _build_schedule(self, assignment: Dict[int, Tuple[Value, int]]) -> Schedule:
+        """Convert an assignment into a Schedule."""
+        schedule = Schedule()
+        for entry in self.pinned:
+            schedule.add_entry(entry)
+        registry = self.registry
+        for code, ((professor_id, day, start, end), room_id) in assignment.items():
+            schedule.add_entry(ScheduleEntry(
+                course_code=registry.courses[code].code,
+                professor_name=registry.professors[professor_id].name,
+                classroom_name=registry.classrooms[room_id].name,
+                day=day,
+                start_time=minutes_to_time(start),
+                end_time=minutes_to_time(end)
+            ))
+        return schedule
\ No newline at end of file
@@ -0,0 +1,143 @@
+from typing import Dict, List, Optional, TYPE_CHECKING
+from models.timeline import time_to_minutes, minutes_to_time
+import logging
+
+if TYPE_CHECKING:
+    from utils.scheduler_engine import SchedulerEngine
+
+
+class Diagnosis:
+    """Proof that some courses cannot all be scheduled, naming the resource that blocks them."""
+
+    def __init__(self, courses: List[str], resource: str, name: Optional[str], reason: str):
+        """
+        Initialize a Diagnosis.
+
+        Args:
+            courses (List[str]): Codes of the affected courses. When there are
+                several, at least one of them cannot be placed.
+            resource (str): Kind of blocking resource: "professor", "classroom" or "conflict".
+            name (str, optional): The blocking professor, classroom window or None.
+            reason (str): Human-readable explanation.
+        """
+        self.courses = courses
+        self.resource = resource
+        self.name = name
+        self.reason = reason
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for serialization."""
+        return {
+            "courses": self.courses,
+            "resource": self.resource,
+            "name": self.name,
+            "reason": self.reason
+        }
+
+    def __str__(self) -> str:
+        """String representation of the Diagnosis."""
+        return f"{', '.join(self.courses)}: {self.reason}"
+
+
+def _popcount(masks: Dict[str, int]) -> int:
+    """Count the minutes marked in per-day masks."""
+    return sum(bin(mask).count("1") for mask in masks.values())
+
+
+def diagnose(engine: 'SchedulerEngine') -> List[Diagnosis]:
+    """
+    Find courses that provably cannot be scheduled, before any search.
+
+    Uses only cheap bounds over the engine's candidate table, so it runs in
+    milliseconds: courses without a qualified professor, without a long
+    enough professor window or without an open room; professors whose sole
+    courses need more minutes than they can teach; minutes at which more
+    courses are forced than rooms are open; and conflict cliques that need
+    more minutes than they can use. Pinned entries are ignored, so the
+    bounds never report a feasible course.
+
+    Args:
+        engine (SchedulerEngine): Engine whose candidates were built for the run.
+
+    Returns:
+        List[Diagnosis]: The problems found, single-course ones first.
+    """
+    if engine.candidates is None:
+        engine.build_candidates()
+    candidates = engine.candidates
+    registry = engine.registry
+    starts = sorted({(day, time_to_minutes(start)) for day, start, _ in engine.time_slots})
+    diagnoses: List[Diagnosis] = []
+
+    for course in registry.courses:
+        if course.code not in candidates.placements or candidates.placements[course.code]:
+            continue
+        professors = [registry.professors[pid] for pid in sorted(registry.qualified[registry.course_ids[course.code]])]
+        if not professors:
+            diagnoses.append(Diagnosis([course.code], "professor", None,
+                                       "no professor in the catalog is qualified to teach it"))
+        elif not any(p.availability.covers(day, start, start + course.duration)
+                     for p in professors for day, start in starts):
+            diagnoses.append(Diagnosis(
+                [course.code], "professor", ", ".join(p.name for p in professors),
+                f"no qualified professor is available for {course.duration} minutes at an allowed start time"))
+        else:
+            diagnoses.append(Diagnosis(
+                [course.code], "classroom", None,
+                "no classroom is open at any time its qualified professors are available"))
+
+    sole_courses: Dict[int, List[int]] = {}
+    for course_id, professors in enumerate(registry.qualified):
+        if len(professors) == 1 and candidates.placements.get(registry.courses[course_id].code):
+            sole_courses.setdefault(next(iter(professors)), []).append(course_id)
+    for professor_id, course_ids in sole_courses.items():
+        union: Dict[str, int] = {}
+        for course_id in course_ids:
+            for day, mask in candidates.coverage(registry.courses[course_id].code).items():
+                union[day] = union.get(day, 0) | mask
+        required = sum(registry.durations[course_id] for course_id in course_ids)
+        available = _popcount(union)
+        if required > available:
+            name = registry.professors[professor_id].name
+            diagnoses.append(Diagnosis(
+                [registry.courses[course_id].code for course_id in course_ids], "professor", name,
+                f"{name} is the only professor for these courses, which need {required} minutes, "
+                f"but is available for {available} usable minutes"))
+
+    forced: Dict[str, Dict[int, List[str]]] = {}
+    for course in registry.courses:
+        placements = candidates.placements.get(course.code)
+        if not placements or len({day for _, day, _, _ in placements}) != 1:
+            continue
+        day = placements[0][1]
+        first = max(start for _, _, start, _ in placements)
+        if first < min(end for _, _, _, end in placements):
+            forced.setdefault(day, {}).setdefault(first, []).append(course.code)
+    reported = set()
+    for day, by_minute in forced.items():
+        for minute in by_minute:
+            codes = [code for other, group in by_minute.items() for code in group
+                     if other <= minute < _forced_end(candidates.placements[code])]
+            bit = 1 << minute
+            rooms = sum(1 for room in registry.classrooms if room.availability.masks.get(day, 0) & bit)
+            if len(codes) > rooms and frozenset(codes) not in reported:
+                reported.add(frozenset(codes))
+                window = f"{day} {minutes_to_time(minute)}"
+                diagnoses.append(Diagnosis(
+                    sorted(codes), "classroom", window,
+                    f"{len(codes)} courses can only be held over {window} but only {rooms} classroom(s) are open then"))
+
+    clique, required, available = engine.clique_bound()
+    if required > available and all(set(d.courses) != set(clique) for d in diagnoses):
+        diagnoses.append(Diagnosis(
+            clique, "conflict", None,
+            f"these mutually conflicting courses need {required} minutes but can only use {available}"))
+
+    for diagnosis in diagnoses:
+        logging.warning(f"Unschedulable: {diagnosis}")
+    return diagnoses
+
+
+def _forced_end(placements: list) -> int:
+    """End of the interval shared by every placement of a course."""
+    return min(end for _, _, _, end in placements)
\ No newline at end of file
@@ -0,0 +1,66 @@
+from typing import Dict, List, Tuple
+from models import Schedule
+from models.timeline import time_to_minutes
+
+# Start and end of one occupied interval, in minutes since midnight.
+Interval = Tuple[int, int]
+
+
+class Objective:
+    """Weighted soft-constraint cost of a schedule; lower is better.
+
+    The cost is a sum of independent terms over (professor, day) and
+    (classroom, day) buckets, so a move that touches a few buckets can be
+    scored by recomputing only those buckets.
+    """
+
+    def __init__(self, gap_weight: float = 1.0, lunch_weight: float = 2.0, room_weight: float = 30.0,
+                 lunch_start: str = "12:00", lunch_end: str = "13:00"):
+        """
+        Initialize an Objective.
+
+        Args:
+            gap_weight (float, optional): Cost per idle minute between a professor's
+                consecutive classes on the same day.
+            lunch_weight (float, optional): Cost per minute a professor teaches
+                inside the lunch window.
+            room_weight (float, optional): Cost per classroom opened on a day, which
+                rewards packing classes into fewer rooms.
+            lunch_start (str, optional): Start of the lunch window. Defaults to "12:00".
+            lunch_end (str, optional): End of the lunch window. Defaults to "13:00".
+        """
+        self.gap_weight = gap_weight
+        self.lunch_weight = lunch_weight
+        self.room_weight = room_weight
+        self.lunch_start = time_to_minutes(lunch_start)
+        self.lunch_end = time_to_minutes(lunch_end)
+
+    def professor_day_cost(self, intervals: List[Interval]) -> float:
+        """Cost of one professor's classes on one day."""
+        if not intervals:
+            return 0.0
+        ordered = sorted(intervals)
+        gaps = sum(max(0, start - previous_end)
+                   for (_, previous_end), (start, _) in zip(ordered, ordered[1:]))
+        lunch = sum(max(0, min(end, self.lunch_end) - max(start, self.lunch_start)) for start, end in ordered)
+        return self.gap_weight * gaps + self.lunch_weight * lunch
+
+    def classroom_day_cost(self, intervals: List[Interval]) -> float:
+        """Cost of one classroom's classes on one day."""
+        return self.room_weight if intervals else 0.0
+
+    def evaluate(self, schedule: Schedule) -> float:
+        """Compute the full cost of a schedule."""
+        professor_days: Dict[Tuple[str, str], List[Interval]] = {}
+        classroom_days: Dict[Tuple[str, str], List[Interval]] = {}
+        for entry in schedule.entries:
+            interval = (time_to_minutes(entry.start_time), time_to_minutes(entry.end_time))
+            professor_days.setdefault((entry.professor_name, entry.day), []).append(interval)
+            classroom_days.setdefault((entry.classroom_name, entry.day), []).append(interval)
+        return (sum(self.professor_day_cost(intervals) for intervals in professor_days.values()) +
+                sum(self.classroom_day_cost(intervals) for intervals in classroom_days.values()))
+
+
+def soft_score(schedule: Schedule) -> float:
+    """Score the soft quality of a schedule with the default Objective; lower is better."""
+    return Objective().evaluate(schedule)
\ No newline at end of file
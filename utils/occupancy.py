@@ -0,0 +1,137 @@
+from typing import Dict, Iterable, Optional, Tuple
+from models import ScheduleEntry, Timeline
+from utils.constraints import NonOverlapGroups
+
+
+def _mark(timelines: Dict, key, day: str, start: int, end: int) -> None:
+    """Mark [start, end) on a keyed timeline, creating it on first use."""
+    timeline = timelines.get(key)
+    if timeline is None:
+        timeline = timelines[key] = Timeline()
+    timeline.add(day, start, end)
+
+
+def _clear(timelines: Dict, key, day: str, start: int, end: int) -> None:
+    """Clear [start, end) on a keyed timeline, if it exists."""
+    timeline = timelines.get(key)
+    if timeline is not None:
+        timeline.remove(day, start, end)
+
+
+class Occupancy:
+    """Bookings made during one scheduling run, keyed by classroom, professor and course.
+
+    The engine keeps all per-run occupancy here instead of on the Classroom
+    objects, so the catalog is never modified by a run and several runs can
+    share one loaded catalog. Timelines are created on first booking, which
+    makes an empty state free to create and a copy proportional to its bookings.
+
+    When given non-overlap groups, the state also keeps each group's booked
+    minutes and the classrooms its members use per day, so a placement is
+    checked against a whole group with one mask test and one lookup.
+    """
+
+    __slots__ = ("classrooms", "professors", "courses", "groups", "group_times", "group_rooms")
+
+    def __init__(self, entries: Iterable[ScheduleEntry] = (), groups: Optional[NonOverlapGroups] = None):
+        """
+        Initialize an Occupancy.
+
+        Args:
+            entries (Iterable[ScheduleEntry], optional): Entries to book, such as pinned ones.
+            groups (NonOverlapGroups, optional): Non-overlap groups to keep occupancy for.
+        """
+        self.classrooms: Dict[str, Timeline] = {}
+        self.professors: Dict[str, Timeline] = {}
+        self.courses: Dict[str, Timeline] = {}
+        self.groups = groups if groups is not None else NonOverlapGroups()
+        self.group_times: Dict[int, Timeline] = {}
+        # Number of members of a group held in a classroom, per (group, day, classroom).
+        self.group_rooms: Dict[Tuple[int, str, str], int] = {}
+        for entry in entries:
+            self.book(entry)
+
+    def add(self, course_code: str, professor_name: str, classroom_name: str, day: str, start: int, end: int) -> None:
+        """Mark the minutes [start, end) of a day on a course, its professor, classroom and groups."""
+        _mark(self.classrooms, classroom_name, day, start, end)
+        _mark(self.professors, professor_name, day, start, end)
+        _mark(self.courses, course_code, day, start, end)
+        for group_id in self.groups.by_course.get(course_code, ()):
+            _mark(self.group_times, group_id, day, start, end)
+            key = (group_id, day, classroom_name)
+            self.group_rooms[key] = self.group_rooms.get(key, 0) + 1
+
+    def remove(self, course_code: str, professor_name: str, classroom_name: str, day: str, start: int,
+               end: int) -> None:
+        """Clear a booking made with add."""
+        _clear(self.classrooms, classroom_name, day, start, end)
+        _clear(self.professors, professor_name, day, start, end)
+        _clear(self.courses, course_code, day, start, end)
+        for group_id in self.groups.by_course.get(course_code, ()):
+            _clear(self.group_times, group_id, day, start, end)
+            key = (group_id, day, classroom_name)
+            count = self.group_rooms.get(key, 0) - 1
+            if count > 0:
+                self.group_rooms[key] = count
+            else:
+                self.group_rooms.pop(key, None)
+
+    def book(self, entry: ScheduleEntry) -> None:
+        """Mark an entry's interval on its classroom, professor, course and groups."""
+        self.add(entry.course_code, entry.professor_name, entry.classroom_name, entry.day, entry.start, entry.end)
+
+    def release(self, entry: ScheduleEntry) -> None:
+        """Clear an entry's interval from its classroom, professor, course and groups."""
+        self.remove(entry.course_code, entry.professor_name, entry.classroom_name, entry.day, entry.start, entry.end)
+
+    # The checks below are on the hot path of every strategy, so each looks its timeline up directly.
+    def classroom_is_free(self, name: str, day: str, start: int, end: int) -> bool:
+        """Check that a classroom has no booking in [start, end) on a day."""
+        timeline = self.classrooms.get(name)
+        return timeline is None or timeline.is_free(day, start, end)
+
+    def professor_is_free(self, name: str, day: str, start: int, end: int) -> bool:
+        """Check that a professor has no booking in [start, end) on a day."""
+        timeline = self.professors.get(name)
+        return timeline is None or timeline.is_free(day, start, end)
+
+    def course_is_free(self, code: str, day: str, start: int, end: int) -> bool:
+        """Check that a course has no booking in [start, end) on a day."""
+        timeline = self.courses.get(code)
+        return timeline is None or timeline.is_free(day, start, end)
+
+    def fits_groups(self, course_code: str, classroom_name: str, day: str, start: int, end: int) -> bool:
+        """
+        Check a placement against the non-overlap groups of its course.
+
+        The course itself must not be booked, as its own minutes would count
+        against it.
+
+        Args:
+            course_code (str): Course to place.
+            classroom_name (str): Classroom of the placement.
+            day (str): Day of the placement.
+            start (int): Start minute.
+            end (int): End minute.
+
+        Returns:
+            bool: True if no other member of the course's groups is booked at an
+                overlapping time or in the same classroom that day.
+        """
+        for group_id in self.groups.by_course.get(course_code, ()):
+            if (group_id, day, classroom_name) in self.group_rooms:
+                return False
+            timeline = self.group_times.get(group_id)
+            if timeline is not None and not timeline.is_free(day, start, end):
+                return False
+        return True
+
+    def copy(self) -> 'Occupancy':
+        """Return an independent copy of this state, sharing its groups index."""
+        occupancy = Occupancy(groups=self.groups)
+        occupancy.classrooms = {key: timeline.copy() for key, timeline in self.classrooms.items()}
+        occupancy.professors = {key: timeline.copy() for key, timeline in self.professors.items()}
+        occupancy.courses = {key: timeline.copy() for key, timeline in self.courses.items()}
+        occupancy.group_times = {key: timeline.copy() for key, timeline in self.group_times.items()}
+        occupancy.group_rooms = dict(self.group_rooms)
+        return occupancy
\ No newline at end of file
@@ -0,0 +1,242 @@
+import math
+import random
+import time
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+from models import Schedule, ScheduleEntry
+from models.timeline import time_to_minutes, minutes_to_time
+from utils.constraints import NonOverlap, NonOverlapGroups
+from utils.objective import Objective
+from utils.occupancy import Occupancy
+import logging
+
+if TYPE_CHECKING:
+    from utils.scheduler_engine import SchedulerEngine
+
+# Placement of a scheduled course: (professor name, day, start minute, end minute, classroom name).
+Placement = Tuple[str, str, int, int, str]
+
+
+class LocalSearchOptimizer:
+    """Simulated-annealing search over feasible schedules for soft-constraint cost.
+
+    Moves relocate one course to another candidate placement or swap the
+    times and rooms of two courses of equal duration. Hard constraints are
+    checked against an Occupancy of the current placements, and the cost
+    change of a move is computed from the few (professor, day) and
+    (classroom, day) buckets it touches. Recently moved courses are tabu for
+    a few iterations so the search does not immediately undo itself.
+    """
+
+    def __init__(self, engine: 'SchedulerEngine', schedule: Schedule, objective: Objective,
+                 non_overlap_courses: Optional[NonOverlap] = None, fixed: Iterable[str] = (),
+                 rng: Optional[random.Random] = None, tabu_tenure: int = 7):
+        """
+        Initialize the optimizer.
+
+        Args:
+            engine (SchedulerEngine): Engine providing the catalog and candidate table.
+            schedule (Schedule): Feasible starting schedule. It is not modified.
+            objective (Objective): Cost to minimize.
+            non_overlap_courses (NonOverlap, optional): Pair of courses, or groups of courses, that must not overlap.
+            fixed (Iterable[str], optional): Course codes that must not move.
+            rng (random.Random, optional): Random generator for move selection.
+            tabu_tenure (int, optional): Iterations a moved course stays tabu.
+        """
+        self.engine = engine
+        self.schedule = schedule
+        self.objective = objective
+        self.rng = rng if rng is not None else random.Random()
+        self.tabu: Deque[str] = deque(maxlen=tabu_tenure)
+
+        self.placements: Dict[str, Placement] = {}
+        self.occupancy = Occupancy(groups=NonOverlapGroups.coerce(non_overlap_courses))
+        self.professor_days: Dict[Tuple[str, str], List[Tuple[int, int]]] = {}
+        self.classroom_days: Dict[Tuple[str, str], List[Tuple[int, int]]] = {}
+        for entry in schedule.entries:
+            placement = (entry.professor_name, entry.day, time_to_minutes(entry.start_time),
+                         time_to_minutes(entry.end_time), entry.classroom_name)
+            self.placements[entry.course_code] = placement
+            self._occupy(entry.course_code, placement)
+
+        self.professor_costs = {key: objective.professor_day_cost(intervals)
+                                for key, intervals in self.professor_days.items()}
+        self.classroom_costs = {key: objective.classroom_day_cost(intervals)
+                                for key, intervals in self.classroom_days.items()}
+        self.cost = sum(self.professor_costs.values()) + sum(self.classroom_costs.values())
+
+        fixed = set(fixed)
+        self.movable: List[str] = [code for code in self.placements
+                                   if code not in fixed and engine.candidates.placements.get(code)]
+        self.by_duration: Dict[int, List[str]] = {}
+        for code in self.movable:
+            _, _, start, end, _ = self.placements[code]
+            self.by_duration.setdefault(end - start, []).append(code)
+        self.iterations = 0
+        self.accepted = 0
+        self._saved: Optional[tuple] = None
+
+    def _occupy(self, code: str, placement: Placement) -> None:
+        """Mark a course's placement on the occupancy and cost buckets."""
+        professor_name, day, start, end, classroom_name = placement
+        self.occupancy.add(code, professor_name, classroom_name, day, start, end)
+        self.professor_days.setdefault((professor_name, day), []).append((start, end))
+        self.classroom_days.setdefault((classroom_name, day), []).append((start, end))
+
+    def _vacate(self, code: str, placement: Placement) -> None:
+        """Clear a course's placement from the occupancy and cost buckets."""
+        professor_name, day, start, end, classroom_name = placement
+        self.occupancy.remove(code, professor_name, classroom_name, day, start, end)
+        self.professor_days[(professor_name, day)].remove((start, end))
+        self.classroom_days[(classroom_name, day)].remove((start, end))
+
+    def _is_feasible(self, code: str, placement: Placement) -> bool:
+        """Check a placement against the current state, with code already vacated."""
+        professor_name, day, start, end, classroom_name = placement
+        occupancy = self.occupancy
+        if not (occupancy.professor_is_free(professor_name, day, start, end) and
+                occupancy.classroom_is_free(classroom_name, day, start, end)):
+            return False
+        courses = occupancy.courses
+        for other in self.engine.conflict_sets.get(code, ()):
+            timeline = courses.get(other)
+            if timeline is not None and not timeline.is_free(day, start, end):
+                return False
+        return code not in occupancy.groups.by_course or occupancy.fits_groups(code, classroom_name, day, start, end)
+
+    def _apply(self, changes: List[Tuple[str, Placement]]) -> Optional[float]:
+        """Apply a move if it keeps the schedule feasible and return its cost delta."""
+        old = [(code, self.placements.pop(code)) for code, _ in changes]
+        for code, placement in old:
+            self._vacate(code, placement)
+        applied: List[Tuple[str, Placement]] = []
+        for code, placement in changes:
+            if not self._is_feasible(code, placement):
+                for applied_code, applied_placement in applied:
+                    self._vacate(applied_code, applied_placement)
+                    del self.placements[applied_code]
+                for old_code, old_placement in old:
+                    self._occupy(old_code, old_placement)
+                    self.placements[old_code] = old_placement
+                return None
+            self._occupy(code, placement)
+            self.placements[code] = placement
+            applied.append((code, placement))
+
+        professor_keys = {(p[0], p[1]) for _, p in old + changes}
+        classroom_keys = {(p[4], p[1]) for _, p in old + changes}
+        self._saved = (old, changes,
+                       {key: self.professor_costs.get(key, 0.0) for key in professor_keys},
+                       {key: self.classroom_costs.get(key, 0.0) for key in classroom_keys})
+        delta = 0.0
+        for key in professor_keys:
+            cost = self.objective.professor_day_cost(self.professor_days.get(key, []))
+            delta += cost - self.professor_costs.get(key, 0.0)
+            self.professor_costs[key] = cost
+        for key in classroom_keys:
+            cost = self.objective.classroom_day_cost(self.classroom_days.get(key, []))
+            delta += cost - self.classroom_costs.get(key, 0.0)
+            self.classroom_costs[key] = cost
+        return delta
+
+    def _undo(self) -> None:
+        """Revert the last applied move."""
+        old, changes, professor_costs, classroom_costs = self._saved
+        for code, placement in changes:
+            self._vacate(code, placement)
+            del self.placements[code]
+        for code, placement in old:
+            self._occupy(code, placement)
+            self.placements[code] = placement
+        self.professor_costs.update(professor_costs)
+        self.classroom_costs.update(classroom_costs)
+
+    def _propose(self) -> Optional[List[Tuple[str, Placement]]]:
+        """Draw a random relocation or swap move."""
+        code = self.rng.choice(self.movable)
+        if code in self.tabu:
+            return None
+        if self.rng.random() < 0.3:
+            _, _, start, end, _ = self.placements[code]
+            other = self.rng.choice(self.by_duration[end - start])
+            if other == code or other in self.tabu:
+                return None
+            professor_name, day, start, end, classroom_name = self.placements[code]
+            other_professor_name, other_day, other_start, other_end, other_room = self.placements[other]
+            professor = self.engine.professors_dict.get(professor_name)
+            other_professor = self.engine.professors_dict.get(other_professor_name)
+            # Professors no longer in the catalog cannot be checked, so their courses are not swapped.
+            if professor is None or other_professor is None:
+                return None
+            if not (professor.availability.covers(other_day, other_start, other_end) and
+                    other_professor.availability.covers(day, start, end)):
+                return None
+            return [(code, (professor_name, other_day, other_start, other_end, other_room)),
+                    (other, (other_professor_name, day, start, end, classroom_name))]
+        professor_name, day, start, end = self.rng.choice(self.engine.candidates.placements[code])
+        rooms = self.engine.candidates.rooms_for(day, start, end)
+        if not rooms:
+            return None
+        return [(code, (professor_name, day, start, end, self.rng.choice(rooms).name))]
+
+    def run(self, time_budget: float, initial_temperature: float = 50.0,
+            final_temperature: float = 0.05) -> Schedule:
+        """
+        Search until the time budget expires or the engine is cancelled, and return the best schedule found.
+
+        Args:
+            time_budget (float): Seconds to search.
+            initial_temperature (float, optional): Annealing temperature at the start.
+            final_temperature (float, optional): Annealing temperature at the deadline.
+
+        Returns:
+            Schedule: The lowest-cost schedule seen, never worse than the input.
+        """
+        initial_cost = self.cost
+        best_cost = self.cost
+        best_placements = dict(self.placements)
+        if self.movable:
+            started = time.perf_counter()
+            deadline = started + time_budget
+            now = started
+            while now < deadline and not self.engine.cancelled():
+                self.engine.report_progress(len(self.placements), self.iterations, best_cost)
+                self.iterations += 1
+                changes = self._propose()
+                if changes is not None:
+                    delta = self._apply(changes)
+                    if delta is not None:
+                        progress = (now - started) / time_budget if time_budget > 0 else 1.0
+                        temperature = initial_temperature * (final_temperature / initial_temperature) ** progress
+                        if delta <= 0 or self.rng.random() < math.exp(-delta / temperature):
+                            self.cost += delta
+                            self.accepted += 1
+                            for code, _ in changes:
+                                self.tabu.append(code)
+                            if self.cost < best_cost - 1e-9:
+                                best_cost = self.cost
+                                best_placements = dict(self.placements)
+                        else:
+                            self._undo()
+                now = time.perf_counter()
+        logging.info(f"Local search: {self.iterations} iterations, {self.accepted} accepted, "
+                     f"cost {initial_cost:.1f} -> {best_cost:.1f}.")
+        self.best_cost = best_cost
+        self.engine.report_progress(len(self.placements), self.iterations, best_cost, force=True)
+        return self._build_schedule(best_placements)
+
+    def _build_schedule(self, placements: Dict[str, Placement]) -> Schedule:
+        """Build a Schedule from placements, keeping the input's entry order."""
+        schedule = Schedule()
+        for entry in self.schedule.entries:
+            professor_name, day, start, end, classroom_name = placements[entry.course_code]
+            schedule.add_entry(ScheduleEntry(
+                course_code=entry.course_code,
+                professor_name=professor_name,
+                classroom_name=classroom_name,
+                day=day,
+                start_time=minutes_to_time(start),
+                end_time=minutes_to_time(end)
+            ))
+        schedule.metadata = dict(self.schedule.metadata)
+        return schedule
\ No newline at end of file
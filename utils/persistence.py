@@ -0,0 +1,301 @@
+import json
+import os
+from typing import Any, Dict, Iterable, Iterator, Optional, TextIO, Tuple
+from models import Professor, Course, Classroom, Schedule, ScheduleEntry
+from utils.constraints import NonOverlap, normalize_non_overlap
+from utils.sqlite_store import SQLiteStore, is_sqlite_path
+
+# Top-level sections holding one record per catalog entity.
+CATALOG_SECTIONS = ("professors", "courses", "classrooms")
+
+_MODELS = {
+    "professors": Professor,
+    "courses": Course,
+    "classrooms": Classroom,
+    "schedule": ScheduleEntry,
+}
+
+
+class _JSONStream:
+    """Pull parser that walks a JSON document without loading it whole.
+
+    Containers are walked with items() and elements(); every leaf value or
+    record is decoded on its own with json's raw_decode, so memory stays
+    proportional to the largest single record.
+    """
+
+    def __init__(self, f: TextIO, chunk_size: int = 1 << 16):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """Read more text, dropping what has been consumed; return False at end of file."""
+        if self.eof:
+            return False
+        chunk = self.f.read(max(self.chunk_size, len(self.buffer) - self.pos))
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        if not chunk:
+            self.eof = True
+        return bool(chunk)
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, or "" at end of file."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Consume the given structural character."""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected '{char}' but found '{found or 'end of file'}'.")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                # A value ending at the buffer edge may be a truncated number.
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._fill()
+
+    def items(self) -> Iterator[str]:
+        """Walk an object, yielding each key; the caller must consume its value."""
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+            self.expect("}")
+            return
+
+    def elements(self) -> Iterator[None]:
+        """Walk an array, yielding before each element; the caller must consume it."""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield None
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+            self.expect("]")
+            return
+
+
+def iter_data(path: str) -> Iterator[Tuple[str, Any]]:
+    """
+    Stream a scheduler data file one record at a time.
+
+    Yields (section, record) pairs: each professor, course and classroom
+    dict under its section name, each schedule entry dict under "schedule",
+    the schedule's metadata under "schedule_metadata", and any other
+    top-level value (such as "non_overlap_courses") under its own key.
+
+    Args:
+        path (str): Path to the JSON file.
+    """
+    with open(path, "r") as f:
+        stream = _JSONStream(f)
+        for key in stream.items():
+            if stream.peek() == "n":
+                yield key, stream.value()
+            elif key in CATALOG_SECTIONS:
+                for _ in stream.elements():
+                    yield key, stream.value()
+            elif key == "schedule":
+                for schedule_key in stream.items():
+                    if schedule_key == "entries":
+                        for _ in stream.elements():
+                            yield "schedule", stream.value()
+                    else:
+                        yield f"schedule_{schedule_key}", stream.value()
+            else:
+                yield key, stream.value()
+
+
+def load_data(path: str) -> Dict[str, Any]:
+    """
+    Load a scheduler data file as written by save_data.
+
+    Paths ending in .db, .sqlite or .sqlite3 are read from a SQLite database.
+
+    Args:
+        path (str): Path to the JSON file.
+
+    Returns:
+        Dict[str, Any]: "professors", "courses" and "classrooms" as model lists,
+            "schedule" as a Schedule or None, and "non_overlap_courses" as a
+            tuple of codes, a list of such tuples for several groups, or None.
+    """
+    if is_sqlite_path(path):
+        with SQLiteStore(path) as store:
+            return store.load_data()
+    data: Dict[str, Any] = {section: [] for section in CATALOG_SECTIONS}
+    data.update({"schedule": None, "non_overlap_courses": None})
+    for key, record in iter_data(path):
+        if key in CATALOG_SECTIONS and record is not None:
+            data[key].append(_MODELS[key].from_dict(record))
+        elif key == "schedule" and record is not None:
+            if data["schedule"] is None:
+                data["schedule"] = Schedule()
+            data["schedule"].add_entry(ScheduleEntry.from_dict(record))
+        elif key == "schedule_metadata":
+            if data["schedule"] is None:
+                data["schedule"] = Schedule()
+            data["schedule"].metadata = dict(record or {})
+        elif key == "non_overlap_courses" and record:
+            data["non_overlap_courses"] = normalize_non_overlap(record)
+    return data
+
+
+class DataWriter:
+    """Incremental writer for scheduler data files.
+
+    Sections are written record by record as they are produced, so saving
+    never builds the whole document in memory. With the default indent the
+    output matches json.dump(..., indent=4); indent=None writes compact JSON.
+    The document goes to a temporary file next to the target, which replaces
+    the target only if the with block completes, so a failed save leaves the
+    previous file intact.
+    """
+
+    def __init__(self, path: str, indent: Optional[int] = 4):
+        """
+        Initialize a DataWriter.
+
+        Args:
+            path (str): Path to the JSON file.
+            indent (int, optional): JSON indentation, or None for compact output. Defaults to 4.
+        """
+        self.path = path
+        self.indent = indent
+        self.f: Optional[TextIO] = None
+        self.temp_path: Optional[str] = None
+        self._first_key = True
+
+    def __enter__(self) -> 'DataWriter':
+        self.temp_path = f"{self.path}.{os.getpid()}.tmp"
+        self.f = open(self.temp_path, "w")
+        self.f.write("{")
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        try:
+            if exc_type is None:
+                if self.indent is not None and not self._first_key:
+                    self.f.write("\n")
+                self.f.write("}")
+            self.f.close()
+            if exc_type is None:
+                os.replace(self.temp_path, self.path)
+        finally:
+            if os.path.exists(self.temp_path):
+                os.remove(self.temp_path)
+
+    def _dumps(self, value: Any, depth: int) -> str:
+        """Serialize a value as if it were nested depth levels deep."""
+        if self.indent is None:
+            return json.dumps(value, separators=(",", ":"))
+        return json.dumps(value, indent=self.indent).replace("\n", "\n" + " " * (self.indent * depth))
+
+    def _newline(self, depth: int) -> str:
+        """Line break and indentation for the given depth; empty in compact mode."""
+        return "" if self.indent is None else "\n" + " " * (self.indent * depth)
+
+    def _write_key(self, key: str, depth: int = 1) -> None:
+        """Write a key of the top-level object."""
+        if not self._first_key:
+            self.f.write(",")
+        self._first_key = False
+        self.f.write(self._newline(depth) + json.dumps(key) + (":" if self.indent is None else ": "))
+
+    def _write_array(self, records: Iterable[Any], depth: int) -> None:
+        """Write an array one record at a time."""
+        self.f.write("[")
+        empty = True
+        for record in records:
+            self.f.write(("" if empty else ",") + self._newline(depth + 1) + self._dumps(record, depth + 1))
+            empty = False
+        self.f.write("]" if empty else self._newline(depth) + "]")
+
+    def write_value(self, key: str, value: Any) -> None:
+        """Write a top-level key with a small value."""
+        self._write_key(key)
+        self.f.write(self._dumps(value, 1))
+
+    def write_section(self, key: str, records: Iterable[Any]) -> None:
+        """Write a top-level array section from an iterable of dicts or models with to_dict."""
+        self._write_key(key)
+        self._write_array((r.to_dict() if hasattr(r, "to_dict") else r for r in records), 1)
+
+    def write_schedule(self, entries: Optional[Iterable[Any]], metadata: Optional[dict] = None) -> None:
+        """Write the schedule section, or null when entries is None."""
+        self._write_key("schedule")
+        if entries is None:
+            self.f.write("null")
+            return
+        separator = ":" if self.indent is None else ": "
+        self.f.write("{" + self._newline(2) + '"entries"' + separator)
+        self._write_array((e.to_dict() if hasattr(e, "to_dict") else e for e in entries), 2)
+        self.f.write("," + self._newline(2) + '"metadata"' + separator + self._dumps(metadata or {}, 2))
+        self.f.write(self._newline(1) + "}")
+
+
+def save_data(path: str, professors: Iterable[Professor], courses: Iterable[Course],
+              classrooms: Iterable[Classroom], schedule: Optional[Schedule] = None,
+              non_overlap_courses: Optional[NonOverlap] = None,
+              indent: Optional[int] = 4, **extra: Any) -> None:
+    """
+    Save the catalog and schedule to a JSON file, one record at a time.
+
+    Paths ending in .db, .sqlite or .sqlite3 are saved to a SQLite database,
+    where only the entities that changed since the last save are rewritten.
+
+    Args:
+        path (str): Path to the JSON file.
+        professors (Iterable[Professor]): Professors to save.
+        courses (Iterable[Course]): Courses to save.
+        classrooms (Iterable[Classroom]): Classrooms to save.
+        schedule (Schedule, optional): The current schedule.
+        non_overlap_courses (NonOverlap, optional): Pair of courses, or groups of courses, that must not overlap.
+        indent (int, optional): JSON indentation, or None for compact output. Defaults to 4.
+            Ignored for SQLite databases.
+        **extra: Additional top-level keys, such as run statistics.
+    """
+    if is_sqlite_path(path):
+        with SQLiteStore(path) as store:
+            store.save_data(list(professors), list(courses), list(classrooms), schedule,
+                            non_overlap_courses, **extra)
+        return
+    with DataWriter(path, indent=indent) as writer:
+        writer.write_section("professors", professors)
+        writer.write_section("courses", courses)
+        writer.write_section("classrooms", classrooms)
+        writer.write_schedule(schedule.entries if schedule else None, schedule.metadata if schedule else None)
+        writer.write_value("non_overlap_courses", normalize_non_overlap(non_overlap_courses))
+        for key, value in extra.items():
+            writer.write_value(key, value)
\ No newline at end of file
@@ -0,0 +1,82 @@
+from typing import Dict, List, Optional, Set
+from models import Professor, Course, Classroom
+
+
+class Registry:
+    """Dense integer IDs for the professors, courses and classrooms of one engine.
+
+    IDs are assigned in catalog order when the engine is built, so internal
+    structures can be lists indexed by ID instead of dicts keyed by names.
+    Qualifications and conflicts are resolved to ID sets once, turning the
+    name lookups and list scans of the hot loops into set membership tests.
+    A name repeated in the catalog keeps the ID of its first occurrence and
+    the object of its last one, matching the engine's name dicts.
+    """
+
+    def __init__(self, professors: List[Professor], courses: List[Course], classrooms: List[Classroom]):
+        """
+        Build the registry.
+
+        Args:
+            professors (List[Professor]): List of professors.
+            courses (List[Course]): List of courses.
+            classrooms (List[Classroom]): List of classrooms.
+        """
+        self.professor_ids: Dict[str, int] = {}
+        self.professors: List[Professor] = []
+        for professor in professors:
+            self._register(self.professor_ids, self.professors, professor.name, professor)
+        self.course_ids: Dict[str, int] = {}
+        self.courses: List[Course] = []
+        for course in courses:
+            self._register(self.course_ids, self.courses, course.code, course)
+        self.classroom_ids: Dict[str, int] = {}
+        self.classrooms: List[Classroom] = []
+        for classroom in classrooms:
+            self._register(self.classroom_ids, self.classrooms, classroom.name, classroom)
+
+        self.durations: List[int] = [course.duration for course in self.courses]
+        # Professors qualified for each course, and courses each professor is listed for.
+        self.qualified: List[Set[int]] = [
+            {self.professor_ids[name] for name in course.professors if name in self.professor_ids}
+            for course in self.courses
+        ]
+        self.teaches: List[Set[int]] = [set() for _ in self.professors]
+        for course_id, professor_ids in enumerate(self.qualified):
+            for professor_id in professor_ids:
+                self.teaches[professor_id].add(course_id)
+        # Symmetric conflicts between known courses.
+        self.conflicts: List[Set[int]] = [set() for _ in self.courses]
+        for course_id, course in enumerate(self.courses):
+            for other in course.conflicts:
+                other_id = self.course_ids.get(other)
+                if other_id is not None and other_id != course_id:
+                    self.conflicts[course_id].add(other_id)
+                    self.conflicts[other_id].add(course_id)
+
+    @staticmethod
+    def _register(ids: Dict[str, int], objects: list, key: str, obj: object) -> None:
+        """Assign the next ID to a new key, or replace the object of a repeated one."""
+        if key in ids:
+            objects[ids[key]] = obj
+        else:
+            ids[key] = len(objects)
+            objects.append(obj)
+
+    def professor_id(self, name: str) -> Optional[int]:
+        """Return the ID of a professor, or None if unknown."""
+        return self.professor_ids.get(name)
+
+    def course_id(self, code: str) -> Optional[int]:
+        """Return the ID of a course, or None if unknown."""
+        return self.course_ids.get(code)
+
+    def classroom_id(self, name: str) -> Optional[int]:
+        """Return the ID of a classroom, or None if unknown."""
+        return self.classroom_ids.get(name)
+
+    def is_qualified(self, course_code: str, professor_name: str) -> bool:
+        """Check if a professor is listed for a course."""
+        course_id = self.course_ids.get(course_code)
+        professor_id = self.professor_ids.get(professor_name)
+        return course_id is not None and professor_id in self.qualified[course_id]
\ No newline at end of file
@@ -1,13 +1,39 @@
 import random
 import datetime
-from typing import List, Dict, Optional, Tuple
+import os
+import tempfile
+import threading
+import time
+from typing import Callable, Iterable, List, Dict, Optional, Set, Tuple, Union
 from models import Professor, Course, Classroom, Schedule, ScheduleEntry
+from models.timeline import time_to_minutes, minutes_to_time
+from utils.candidates import CandidateTable
+from utils.constraints import NonOverlap, NonOverlapGroups, normalize_non_overlap
+from utils.conflict_graph import ConflictGraph
+from utils.csp_solver import CSPSolver
+from utils.diagnostics import Diagnosis, diagnose
+from utils.occupancy import Occupancy
+from utils.registry import Registry
+from utils.objective import Objective, soft_score
+from utils.optimizer import LocalSearchOptimizer
+from utils.snapshot import Snapshot, dumps_snapshot, loads_schedule
 import logging
 
+STRATEGIES = ("greedy", "csp")
+BACKENDS = ("python", "numpy")
+# Minimum seconds between two calls of an engine's progress callback.
+PROGRESS_INTERVAL = 0.1
+# Event stopping the attempts of a best-of pool's worker process, set by _init_worker.
+_worker_cancel_event = None
+
 class SchedulerEngine:
     """Scheduling engine for assigning courses to professors and classrooms."""
     
-    def __init__(self, professors: List[Professor], courses: List[Course], classrooms: List[Classroom]):
+    def __init__(self, professors: List[Professor], courses: List[Course], classrooms: List[Classroom],
+                 strategy: str = "greedy", seed: Optional[int] = None,
+                 rng: Optional[random.Random] = None, backend: str = "python",
+                 progress: Optional[Callable[[Dict[str, float]], None]] = None,
+                 cancel_event: Optional[threading.Event] = None):
         """
         Initialize the scheduler engine.
 
@@ -15,20 +41,119 @@ class SchedulerEngine:
             professors (List[Professor]): List of professors.
             courses (List[Course]): List of courses.
             classrooms (List[Classroom]): List of classrooms.
+            strategy (str, optional): Search strategy, "greedy" for the randomized
+                retry loop or "csp" for the backtracking constraint solver.
+                Defaults to "greedy".
+            seed (int, optional): Seed for the engine's random generator. Each
+                run reseeds from it, so runs on the same inputs are reproducible.
+                A fresh seed is drawn when omitted.
+            rng (random.Random, optional): Generator to use instead of a seeded
+                one. Runs then continue its sequence and record no seed.
+            backend (str, optional): "python" for the default data structures, or
+                "numpy" to compute candidates and the greedy feasibility tests from
+                boolean occupancy tensors. Defaults to "python".
+            progress (Callable, optional): Called from the solving thread, at most
+                every PROGRESS_INTERVAL seconds, with a dict of "placed" and
+                "total" courses, "iterations" and, when known, the best "score".
+            cancel_event (threading.Event, optional): Event that stops a running
+                solve when set, from any thread; the solve then returns the best
+                schedule found so far. Several engines may share one event.
+                A private event, set by cancel(), is used when omitted.
+
+        Raises:
+            ValueError: If the strategy or backend is unknown.
+            ImportError: If the numpy backend is requested without NumPy installed.
         """
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown strategy '{strategy}'. Expected one of: {', '.join(STRATEGIES)}.")
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}'. Expected one of: {', '.join(BACKENDS)}.")
+        if backend == "numpy":
+            # Imported here so the default backend never loads NumPy.
+            from utils.vectorized import HAS_NUMPY
+            if not HAS_NUMPY:
+                raise ImportError("The numpy backend requires NumPy. Install it with 'pip install numpy'.")
+        self.strategy = strategy
+        self.backend = backend
+        self.progress = progress
+        self.cancel_event = cancel_event if cancel_event is not None else threading.Event()
+        self._last_report = 0.0
+        self.rng = rng
+        self.seed = seed if seed is not None or rng is not None else random.SystemRandom().randrange(2 ** 32)
         self.professors = professors
         self.courses = courses
         self.classrooms = classrooms
         self.schedule = Schedule()
+        # Bookings of the latest run; the catalog objects are only read, never modified.
+        self.occupancy = Occupancy()
         
-        self.professors_dict: Dict[str, Professor] = {p.name: p for p in professors}
-        self.courses_dict: Dict[str, Course] = {c.code: c for c in courses}
-        self.classrooms_dict: Dict[str, Classroom] = {c.name: c for c in classrooms}
+        self.professors_dict: Dict[str, Professor] = {}
+        self.courses_dict: Dict[str, Course] = {}
+        self.classrooms_dict: Dict[str, Classroom] = {}
+        self.registry = Registry([], [], [])
+        self.conflict_sets: Dict[str, Set[str]] = {}
+        self.conflict_graph = ConflictGraph(0)
+        self._index_catalog()
         self.time_slots: List[Tuple[str, str, str]] = []
         self._generate_time_slots()
+        self.candidates: Optional[CandidateTable] = None
+        # Occupancy tensors of the numpy backend, rebuilt with the candidates.
+        self.tensors = None
+        self.stats: Dict[str, int] = {}
+        self.diagnostics: List[Diagnosis] = []
         
         logging.info("Scheduler engine initialized.")
     
+    def _index_catalog(self) -> None:
+        """
+        Rebuild the name dicts, ID registry and conflict data from the current catalog.
+
+        Called at the start of every run, so courses, professors, classrooms,
+        qualifications and conflicts edited or added since the engine was built
+        are seen by the run.
+        """
+        self.professors_dict = {p.name: p for p in self.professors}
+        self.courses_dict = {c.code: c for c in self.courses}
+        self.classrooms_dict = {c.name: c for c in self.classrooms}
+        self.registry = Registry(self.professors, self.courses, self.classrooms)
+        self.conflict_graph = ConflictGraph.from_registry(self.registry)
+        # Name-keyed view of the conflict graph's neighbours for callers working with codes.
+        self.conflict_sets = {
+            course.code: {self.registry.courses[other].code for other in self.conflict_graph.neighbors(course_id)}
+            for course_id, course in enumerate(self.registry.courses)
+        }
+    
+    def cancel(self) -> None:
+        """Ask the running solve to stop and return the best schedule found so far."""
+        self.cancel_event.set()
+    
+    def cancelled(self) -> bool:
+        """Check if the running solve was asked to stop."""
+        return self.cancel_event.is_set()
+    
+    def report_progress(self, placed: int, iterations: int, score: Optional[float] = None,
+                        force: bool = False) -> None:
+        """
+        Pass the state of a run to the progress callback, if any.
+
+        Args:
+            placed (int): Courses in the current or best schedule.
+            iterations (int): Iterations, search nodes or attempts so far.
+            score (float, optional): Best objective value so far, if the run has one.
+            force (bool, optional): Report even if the last report was under
+                PROGRESS_INTERVAL seconds ago, such as at the end of a run.
+        """
+        if self.progress is None:
+            return
+        now = time.perf_counter()
+        if not force and now - self._last_report < PROGRESS_INTERVAL:
+            return
+        self._last_report = now
+        update: Dict[str, float] = {"placed": placed, "total": len(self.courses), "iterations": iterations}
+        if score is not None:
+            update["score"] = score
+        self.progress(update)
+    
     def _generate_time_slots(self, start_hour: int = 8, end_hour: int = 18, slot_duration: int = 30) -> None:
         """Generate time slots for scheduling."""
         days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
@@ -43,84 +168,242 @@ class SchedulerEngine:
     
     def _calculate_end_time(self, start_time: str, duration: int) -> str:
         """Calculate end time based on start time and duration."""
-        hours, minutes = map(int, start_time.split(':'))
-        start_datetime = datetime.datetime(2023, 1, 1, hours, minutes)
-        end_datetime = start_datetime + datetime.timedelta(minutes=duration)
-        return end_datetime.strftime("%H:%M")
-    
-    def _check_professor_availability(self, professor: Professor, day: str, start_time: str, end_time: str) -> bool:
-        """Check if a professor is available at the specified time."""
-        return professor.is_available(day, start_time, end_time)
-    
-    def _check_classroom_availability(self, classroom: Classroom, day: str, start_time: str, end_time: str) -> bool:
-        """Check if a classroom is available at the specified time."""
-        return classroom.is_available(day, start_time, end_time)
+        return minutes_to_time(time_to_minutes(start_time) + duration)
     
     def _check_course_conflicts(self, course_code: str, day: str, start_time: str, end_time: str) -> bool:
         """Check if scheduling a course would create conflicts."""
-        course = self.courses_dict[course_code]
-        for entry in self.schedule.entries:
-            if entry.day != day:
-                continue
-            if not (end_time <= entry.start_time or start_time >= entry.end_time):
-                if (course.has_conflict_with(entry.course_code) or 
-                    self.courses_dict[entry.course_code].has_conflict_with(course_code)):
-                    return False
-        return True
+        start, end = time_to_minutes(start_time), time_to_minutes(end_time)
+        return all(self.occupancy.course_is_free(other, day, start, end)
+                   for other in self.conflict_sets.get(course_code, ()))
     
     def check_course_overlap(self, schedule: Schedule, course1_code: str, course2_code: str) -> bool:
         """Check if two courses overlap in time or place in the given schedule."""
-        course1_entries = [e for e in schedule.entries if e.course_code == course1_code]
-        course2_entries = [e for e in schedule.entries if e.course_code == course2_code]
-        
-        for e1 in course1_entries:
-            for e2 in course2_entries:
-                if e1.day == e2.day:
-                    if not (e1.end_time <= e2.start_time or e1.start_time >= e2.end_time):
-                        return True  # Time overlap
-                    if e1.classroom_name == e2.classroom_name:
-                        return True  # Place overlap
+        course2_entries = schedule.by_course.get(course2_code, ())
+        for e1 in schedule.by_course.get(course1_code, ()):
+            if self._entry_overlaps(e1, course2_entries):
+                return True
         return False
     
-    def generate_schedule(self, non_overlap_courses: Optional[Tuple[str, str]] = None, 
-                         max_iterations: int = 1000) -> Schedule:
-        """Generate a class schedule, optionally ensuring two courses don't overlap."""
+    def non_overlap_violations(self, schedule: Schedule, non_overlap_courses: NonOverlap) -> List[Tuple[str, str]]:
+        """Return the pairs of courses sharing a non-overlap group that overlap in time or place in the schedule."""
+        violations: List[Tuple[str, str]] = []
+        seen = set()
+        for group in NonOverlapGroups.coerce(non_overlap_courses):
+            for index, first in enumerate(group):
+                for second in group[index + 1:]:
+                    pair = (first, second)
+                    if pair not in seen and self.check_course_overlap(schedule, first, second):
+                        violations.append(pair)
+                    seen.add(pair)
+        return violations
+    
+    @staticmethod
+    def _entry_overlaps(entry: ScheduleEntry, others: Iterable[ScheduleEntry]) -> bool:
+        """Check if an entry overlaps any of the others in time or place on the same day."""
+        for other in others:
+            if entry.day == other.day:
+                if not (entry.end_time <= other.start_time or entry.start_time >= other.end_time):
+                    return True  # Time overlap
+                if entry.classroom_name == other.classroom_name:
+                    return True  # Place overlap
+        return False
+    
+    def build_candidates(self, courses: Optional[List[Course]] = None) -> CandidateTable:
+        """Precompute the feasible placements of the given courses (default: all) for this run."""
+        courses = self.courses if courses is None else courses
+        if self.backend == "numpy":
+            from utils.vectorized import OccupancyTensors, VectorCandidateTable
+            self.tensors = OccupancyTensors(self.registry, self.time_slots, self.conflict_graph)
+            self.candidates = VectorCandidateTable(self.tensors, courses)
+        else:
+            self.candidates = CandidateTable(self.professors, courses, self.classrooms, self.time_slots)
+        return self.candidates
+    
+    def clique_bound(self) -> Tuple[List[str], int, int]:
+        """
+        Compare the time a group of mutually conflicting courses needs with the time it can use.
+
+        Courses of a clique in the conflict graph must occupy disjoint
+        intervals, all inside the union of the clique's candidate placements.
+        A greedy clique is grown from every course not already in an earlier
+        clique and the one with the largest shortfall (or smallest slack) is
+        returned. When the required minutes exceed the available ones, no
+        schedule can place every course of the clique. Courses without
+        candidate placements are left out.
+
+        Returns:
+            Tuple[List[str], int, int]: The clique's course codes, the minutes its
+                courses need together, and the minutes their placements cover.
+        """
+        if self.candidates is None:
+            self.build_candidates()
+        registry = self.registry
+        coverage = [self.candidates.coverage(course.code) for course in registry.courses]
+        
+        best: Tuple[List[str], int, int] = ([], 0, 0)
+        best_slack = None
+        covered = set()
+        for course_id in range(len(registry.courses)):
+            if course_id in covered or not coverage[course_id] or not self.conflict_graph.adjacency[course_id]:
+                continue
+            clique = [member for member in self.conflict_graph.greedy_clique(course_id, registry.durations)
+                      if coverage[member]]
+            covered.update(clique)
+            union: Dict[str, int] = {}
+            for member in clique:
+                for day, mask in coverage[member].items():
+                    union[day] = union.get(day, 0) | mask
+            required = sum(registry.durations[member] for member in clique)
+            available = sum(bin(mask).count("1") for mask in union.values())
+            if best_slack is None or available - required < best_slack:
+                best_slack = available - required
+                best = ([registry.courses[member].code for member in sorted(clique)], required, available)
+        return best
+    
+    def diagnose(self) -> List[Diagnosis]:
+        """
+        Find provably unschedulable courses and their blocking resources with cheap bounds.
+
+        Uses the current candidate table, or builds one for every course. The
+        result is also kept in self.diagnostics.
+
+        Returns:
+            List[Diagnosis]: The problems found.
+        """
+        self.diagnostics = diagnose(self)
+        return self.diagnostics
+    
+    def generate_schedule(self, non_overlap_courses: Optional[NonOverlap] = None, 
+                         max_iterations: int = 1000,
+                         pinned: Optional[Union[Schedule, List[ScheduleEntry]]] = None,
+                         time_limit: Optional[float] = None) -> Schedule:
+        """
+        Generate a class schedule, optionally keeping groups of courses from overlapping.
+
+        Args:
+            non_overlap_courses (NonOverlap, optional): Pair of courses, or groups of courses, that must not overlap.
+            max_iterations (int, optional): Iteration limit of the greedy strategy.
+            pinned (Schedule or List[ScheduleEntry], optional): Pre-committed entries,
+                such as fixed labs or exams, or a partial schedule. They are copied
+                into the result unchanged and their courses are not searched.
+            time_limit (float, optional): Seconds after which the search stops and
+                the courses placed so far are returned.
+
+        Returns:
+            Schedule: The generated schedule.
+
+        Raises:
+            ValueError: If the pinned entries reference unknown courses, repeat a
+                course, or overlap in a classroom or for a professor.
+        """
+        self._index_catalog()
+        entries = pinned.entries if isinstance(pinned, Schedule) else list(pinned or [])
+        self._validate_pinned(entries)
+        return self._generate(non_overlap_courses, max_iterations, pinned=entries, time_limit=time_limit)
+    
+    def _validate_pinned(self, pinned: List[ScheduleEntry]) -> None:
+        """Reject pinned entries that cannot coexist in one schedule."""
+        check = Schedule()
+        seen = set()
+        for entry in pinned:
+            if entry.course_code not in self.courses_dict:
+                raise ValueError(f"Pinned entry references unknown course: {entry.course_code}")
+            if entry.course_code in seen:
+                raise ValueError(f"Course pinned more than once: {entry.course_code}")
+            seen.add(entry.course_code)
+            if check.has_conflict(entry):
+                raise ValueError(f"Pinned entry overlaps another pinned entry: {entry}")
+            if not self._entry_is_valid(entry):
+                logging.warning(f"Pinned entry is outside the catalog's availability: {entry}")
+            check.add_entry(entry)
+    
+    def _generate(self, non_overlap_courses: Optional[NonOverlap] = None, max_iterations: int = 1000,
+                  pinned: Optional[List[ScheduleEntry]] = None, time_limit: Optional[float] = None) -> Schedule:
+        """Run the configured strategy around a set of fixed entries."""
+        deadline = time.perf_counter() + time_limit if time_limit is not None else None
+        pinned = list(pinned or [])
+        pinned_codes = {entry.course_code for entry in pinned}
+        self.build_candidates([course for course in self.courses if course.code not in pinned_codes])
+        self.diagnose()
+        if self.strategy == "csp":
+            schedule = self._generate_csp(non_overlap_courses, pinned, deadline)
+        else:
+            schedule = self._generate_greedy(non_overlap_courses, max_iterations, pinned, deadline)
+        schedule.metadata.update({"strategy": self.strategy, "seed": self.seed})
+        return schedule
+    
+    def _generate_greedy(self, non_overlap_courses: Optional[NonOverlap] = None,
+                         max_iterations: int = 1000, pinned: Optional[List[ScheduleEntry]] = None,
+                         deadline: Optional[float] = None) -> Schedule:
+        """Generate a class schedule with the randomized retry loop."""
+        rng = self.rng if self.rng is not None else random.Random(self.seed)
         self.schedule = Schedule()
-        courses_to_schedule = list(self.courses)
-        random.shuffle(courses_to_schedule)
+        self.occupancy = Occupancy(groups=NonOverlapGroups.coerce(non_overlap_courses))
+        tensors = self.tensors
+        for entry in pinned or []:
+            self.schedule.add_entry(entry)
+            self.occupancy.book(entry)
+            if tensors is not None:
+                tensors.book(entry)
+        pinned_codes = {entry.course_code for entry in self.schedule.entries}
+        courses_to_schedule = [course for course in self.courses if course.code not in pinned_codes]
+        rng.shuffle(courses_to_schedule)
         
         iterations = 0
         while courses_to_schedule and iterations < max_iterations:
+            if deadline is not None and time.perf_counter() >= deadline:
+                logging.warning("Schedule generation stopped at the time limit.")
+                break
+            if self.cancelled():
+                logging.warning("Schedule generation cancelled.")
+                break
+            self.report_progress(len(self.schedule.entries), iterations)
             iterations += 1
             course = courses_to_schedule[0]
-            suitable_professors = [p for p in self.professors if p.name in course.professors]
+            by_professor = self.candidates.by_professor[course.code]
             
-            if not suitable_professors:
+            if not by_professor:
                 courses_to_schedule.pop(0)
                 logging.warning(f"No professor available for course: {course.code}")
                 continue
+            if not self.candidates.placements[course.code]:
+                courses_to_schedule.pop(0)
+                logging.warning(f"No feasible time slot for course: {course.code}")
+                continue
             
+            # The numpy backend finds every placement that fits the current bookings at once.
+            feasible = tensors.feasible_placements(course) if tensors is not None else None
             scheduled = False
-            random.shuffle(suitable_professors)
-            for professor in suitable_professors:
+            suitable_professors = list(by_professor)
+            rng.shuffle(suitable_professors)
+            for professor_name in suitable_professors:
                 if scheduled:
                     break
-                random.shuffle(self.time_slots)
-                for day, start_time, _ in self.time_slots:
+                placements = by_professor[professor_name]
+                if feasible is not None:
+                    placements = [placement for placement in placements if placement in feasible]
+                else:
+                    placements = list(placements)
+                rng.shuffle(placements)
+                for placement in placements:
                     if scheduled:
                         break
-                    end_time = self._calculate_end_time(start_time, course.duration)
-                    if not self._check_professor_availability(professor, day, start_time, end_time):
-                        continue
-                    if not self._check_course_conflicts(course.code, day, start_time, end_time):
+                    _, day, start, end = placement
+                    start_time, end_time = minutes_to_time(start), minutes_to_time(end)
+                    if feasible is None and not self._check_course_conflicts(course.code, day, start_time, end_time):
                         continue
-                    random.shuffle(self.classrooms)
-                    for classroom in self.classrooms:
-                        if not self._check_classroom_availability(classroom, day, start_time, end_time):
+                    classrooms = list(self.candidates.rooms_for(day, start, end))
+                    rng.shuffle(classrooms)
+                    for classroom in classrooms:
+                        room_id = self.registry.classroom_id(classroom.name) if tensors is not None else None
+                        if room_id is not None:
+                            if not tensors.classroom_is_free(room_id, day, start, end):
+                                continue
+                        elif not self.occupancy.classroom_is_free(classroom.name, day, start, end):
                             continue
                         entry = ScheduleEntry(
                             course_code=course.code,
-                            professor_name=professor.name,
+                            professor_name=professor_name,
                             classroom_name=classroom.name,
                             day=day,
                             start_time=start_time,
@@ -128,17 +411,13 @@ class SchedulerEngine:
                         )
                         if self.schedule.has_conflict(entry):
                             continue
-                        # Check non-overlap constraint
-                        if non_overlap_courses and course.code in non_overlap_courses:
-                            temp_schedule = Schedule()
-                            for e in self.schedule.entries:
-                                temp_schedule.add_entry(e)
-                            temp_schedule.add_entry(entry)
-                            other_course = non_overlap_courses[0] if course.code == non_overlap_courses[1] else non_overlap_courses[1]
-                            if self.check_course_overlap(temp_schedule, course.code, other_course):
-                                continue
+                        # Check non-overlap constraints
+                        if not self.occupancy.fits_groups(course.code, classroom.name, day, start, end):
+                            continue
                         self.schedule.add_entry(entry)
-                        classroom.schedule_class(day, start_time, end_time, course.code)
+                        self.occupancy.book(entry)
+                        if tensors is not None:
+                            tensors.book(entry)
                         scheduled = True
                         break
             
@@ -148,5 +427,304 @@ class SchedulerEngine:
                 course = courses_to_schedule.pop(0)
                 courses_to_schedule.append(course)
         
+        self.stats = {"iterations": iterations}
+        self.report_progress(len(self.schedule.entries), iterations, force=True)
         logging.info(f"Schedule generation completed in {iterations} iterations.")
-        return self.schedule
\ No newline at end of file
+        return self.schedule
+    
+    def _generate_csp(self, non_overlap_courses: Optional[NonOverlap] = None,
+                      pinned: Optional[List[ScheduleEntry]] = None, deadline: Optional[float] = None) -> Schedule:
+        """Generate a class schedule with the backtracking constraint solver."""
+        rng = self.rng if self.rng is not None else random.Random(self.seed)
+        solver = CSPSolver(self, non_overlap_courses=non_overlap_courses, pinned=pinned, deadline=deadline, rng=rng)
+        self.schedule = solver.solve()
+        self.stats = {"iterations": solver.nodes, "backtracks": solver.backtracks}
+        self.report_progress(len(self.schedule.entries), solver.nodes, force=True)
+        self.occupancy = Occupancy(self.schedule.entries, groups=NonOverlapGroups.coerce(non_overlap_courses))
+        return self.schedule
+    
+    def _entry_is_valid(self, entry: ScheduleEntry) -> bool:
+        """Check an entry against the current catalog, ignoring other entries."""
+        course = self.courses_dict.get(entry.course_code)
+        professor = self.professors_dict.get(entry.professor_name)
+        classroom = self.classrooms_dict.get(entry.classroom_name)
+        if course is None or professor is None or classroom is None:
+            return False
+        start, end = time_to_minutes(entry.start_time), time_to_minutes(entry.end_time)
+        return (end - start == course.duration and
+                self.registry.is_qualified(course.code, professor.name) and
+                professor.availability.covers(entry.day, start, end) and
+                classroom.availability.covers(entry.day, start, end))
+    
+    def repair(self, schedule: Schedule, changes: Dict[str, Iterable[str]],
+               non_overlap_courses: Optional[NonOverlap] = None, max_iterations: int = 1000) -> Schedule:
+        """
+        Repair a schedule after catalog edits instead of regenerating it.
+
+        Entries of changed courses, and entries whose changed professor or
+        classroom can no longer host them, are released; every other entry is
+        pinned. The released courses, and any course missing from the
+        schedule, are then re-solved around the pinned entries. Released or
+        changed courses that still cannot be placed widen the neighbourhood
+        once, releasing the entries of their professors and conflicting
+        courses; the widened result is kept only if it places more courses.
+        When nothing is released and no changed course needs placing, the
+        schedule is returned as it is, without solving.
+
+        Args:
+            schedule (Schedule): The schedule to repair. It is not modified.
+            changes (Dict[str, Iterable[str]]): Names of edited entities under the
+                keys "professors", "classrooms" and "courses" (course codes).
+            non_overlap_courses (NonOverlap, optional): Pair of courses, or groups of courses, that must not overlap.
+            max_iterations (int, optional): Iteration limit of the greedy strategy.
+
+        Returns:
+            Schedule: The repaired schedule. Its metadata lists the moved courses under "repaired".
+        """
+        changed_professors = set(changes.get("professors", ()))
+        changed_classrooms = set(changes.get("classrooms", ()))
+        changed_courses = set(changes.get("courses", ()))
+        self._index_catalog()
+        for name in changed_professors & self.professors_dict.keys():
+            self.professors_dict[name].invalidate_availability()
+        for name in changed_classrooms & self.classrooms_dict.keys():
+            self.classrooms_dict[name].invalidate_availability()
+        
+        kept: List[ScheduleEntry] = []
+        released: List[ScheduleEntry] = []
+        for entry in schedule.entries:
+            touched = (entry.course_code in changed_courses or
+                       entry.professor_name in changed_professors or
+                       entry.classroom_name in changed_classrooms)
+            if entry.course_code in changed_courses or (touched and not self._entry_is_valid(entry)):
+                released.append(entry)
+            elif entry.course_code in self.courses_dict:
+                kept.append(entry)
+        
+        # Courses this change took out of the schedule or edited; only these may widen the repair.
+        affected = ({entry.course_code for entry in released} | changed_courses) & self.courses_dict.keys()
+        if not affected:
+            repaired = Schedule()
+            for entry in kept:
+                repaired.add_entry(entry)
+            repaired.metadata = dict(schedule.metadata)
+            repaired.metadata["repaired"] = []
+            self.schedule = repaired
+            self.occupancy = Occupancy(repaired.entries, groups=NonOverlapGroups.coerce(non_overlap_courses))
+            logging.info("Repair found no entries to reschedule.")
+            return repaired
+        
+        repaired = self._generate(non_overlap_courses, max_iterations, pinned=kept)
+        placed = {entry.course_code for entry in repaired.entries}
+        missing = [self.courses_dict[code] for code in sorted(affected - placed)]
+        if missing:
+            professors = {name for course in missing for name in course.professors}
+            conflicting = {code for course in missing for code in self.conflict_sets.get(course.code, ())}
+            widened = [entry for entry in kept
+                       if entry.professor_name in professors or entry.course_code in conflicting]
+            if widened:
+                logging.info(f"Widening repair neighbourhood by {len(widened)} entries.")
+                widened_ids = {id(entry) for entry in widened}
+                attempt = self._generate(non_overlap_courses, max_iterations,
+                                         pinned=[entry for entry in kept if id(entry) not in widened_ids])
+                if len(attempt.entries) > len(repaired.entries):
+                    released.extend(widened)
+                    repaired = attempt
+                else:
+                    self.schedule = repaired
+                    self.occupancy = Occupancy(repaired.entries,
+                                               groups=NonOverlapGroups.coerce(non_overlap_courses))
+        
+        original = {entry.course_code: entry for entry in schedule.entries}
+        moved = sorted(
+            entry.course_code for entry in repaired.entries
+            if entry.course_code not in original or
+            original[entry.course_code].to_dict() != entry.to_dict()
+        )
+        repaired.metadata["repaired"] = moved
+        logging.info(f"Repair released {len(released)} entries and moved {len(moved)} courses.")
+        return repaired
+    
+    def optimize(self, schedule: Schedule, objective: Optional[Objective] = None, time_budget: float = 5.0,
+                 non_overlap_courses: Optional[NonOverlap] = None,
+                 pinned: Optional[Union[Schedule, List[ScheduleEntry]]] = None) -> Schedule:
+        """
+        Improve the soft-constraint cost of a feasible schedule by local search.
+
+        The search is anytime: it runs until the time budget expires or the
+        engine is cancelled, and returns the best schedule seen, which is never
+        worse than the input.
+
+        Args:
+            schedule (Schedule): Feasible schedule to improve. It is not modified.
+            objective (Objective, optional): Cost to minimize. Defaults to Objective().
+            time_budget (float, optional): Seconds to search. Defaults to 5.0.
+            non_overlap_courses (NonOverlap, optional): Pair of courses, or groups of courses, that must not overlap.
+            pinned (Schedule or List[ScheduleEntry], optional): Entries whose courses must not move.
+
+        Returns:
+            Schedule: The optimized schedule, with its cost in metadata["objective"].
+        """
+        objective = objective or Objective()
+        self._index_catalog()
+        pinned_entries = pinned.entries if isinstance(pinned, Schedule) else list(pinned or [])
+        self.build_candidates()
+        rng = self.rng if self.rng is not None else random.Random(self.seed)
+        optimizer = LocalSearchOptimizer(self, schedule, objective, non_overlap_courses=non_overlap_courses,
+                                         fixed={entry.course_code for entry in pinned_entries}, rng=rng)
+        optimized = optimizer.run(time_budget)
+        optimized.metadata["objective"] = optimizer.best_cost
+        self.stats = {"iterations": optimizer.iterations, "accepted": optimizer.accepted}
+        self.occupancy = Occupancy(optimized.entries, groups=NonOverlapGroups.coerce(non_overlap_courses))
+        self.schedule = optimized
+        return optimized
+    
+    def generate_best_of(self, n: int, workers: Optional[int] = None, seed: Optional[int] = None,
+                         non_overlap_courses: Optional[NonOverlap] = None,
+                         max_iterations: int = 1000, stop_when_complete: bool = True,
+                         pinned: Optional[Union[Schedule, List[ScheduleEntry]]] = None,
+                         time_limit: Optional[float] = None) -> Schedule:
+        """
+        Run independent seeded attempts in a process pool and keep the best schedule.
+
+        Attempts are ranked by the number of unscheduled courses, then by
+        soft_score. The catalog is written once to a binary snapshot that every
+        worker memory-maps, and each attempt builds its own copy from it. The
+        kept attempt's search stats, the number of finished attempts and the
+        kept seed are stored in self.stats. Once the search stops, a shared
+        event cancels the attempts still running in the workers, which then
+        return at once.
+
+        Args:
+            n (int): Number of attempts.
+            workers (int, optional): Worker processes. Defaults to the CPU count.
+            seed (int, optional): Seed of the first attempt; attempt i uses seed + i.
+                Defaults to the engine's seed.
+            non_overlap_courses (NonOverlap, optional): Pair of courses, or groups of courses, that must not overlap.
+            max_iterations (int, optional): Iteration limit of each attempt.
+            stop_when_complete (bool, optional): Cancel the remaining attempts as soon
+                as one schedules every course. Defaults to True.
+            pinned (Schedule or List[ScheduleEntry], optional): Pre-committed entries
+                shared by every attempt.
+            time_limit (float, optional): Seconds each attempt may search.
+
+        Returns:
+            Schedule: The best schedule found.
+
+        Raises:
+            ValueError: If n is not positive or the pinned entries are inconsistent.
+        """
+        if n <= 0:
+            raise ValueError("Number of attempts must be positive.")
+        # Imported here so single-run users do not pay for loading multiprocessing.
+        import multiprocessing
+        from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+        self._index_catalog()
+        entries = pinned.entries if isinstance(pinned, Schedule) else list(pinned or [])
+        self._validate_pinned(entries)
+        pinned_codes = {entry.course_code for entry in entries}
+        self.build_candidates([course for course in self.courses if course.code not in pinned_codes])
+        self.diagnose()
+        workers = workers or os.cpu_count() or 1
+        if seed is None:
+            seed = self.seed if self.seed is not None else self.rng.randrange(2 ** 32)
+        # Workers map one shared read-only snapshot instead of unpickling the catalog per task.
+        shared_pinned = Schedule()
+        for entry in entries:
+            shared_pinned.add_entry(entry)
+        handle, snapshot_path = tempfile.mkstemp(suffix=".snap")
+        best = None
+        attempts = 0
+        try:
+            with os.fdopen(handle, "wb") as f:
+                f.write(dumps_snapshot(self.professors, self.courses, self.classrooms, shared_pinned))
+            non_overlap = normalize_non_overlap(non_overlap_courses)
+            payloads = [(snapshot_path, self.strategy, self.backend, seed + i, non_overlap, max_iterations, time_limit)
+                        for i in range(n)]
+            
+            if workers == 1:
+                for attempts, payload in enumerate(payloads, 1):
+                    result = _run_attempt(payload, self.cancel_event)
+                    if best is None or result[:2] < best[:2]:
+                        best = result
+                    self.report_progress(len(self.courses) - best[0], attempts, best[1], force=True)
+                    if (stop_when_complete and best[0] == 0) or self.cancelled():
+                        break
+            else:
+                stop = multiprocessing.Event()
+                executor = ProcessPoolExecutor(max_workers=min(workers, n), initializer=_init_worker,
+                                               initargs=(stop,))
+                try:
+                    pending = {executor.submit(_run_attempt, payload) for payload in payloads}
+                    complete = False
+                    while pending and not complete:
+                        done, pending = wait(pending, timeout=PROGRESS_INTERVAL, return_when=FIRST_COMPLETED)
+                        if self.cancelled() and not stop.is_set():
+                            # Running attempts return their partial schedules; queued ones are dropped.
+                            stop.set()
+                            for future in pending:
+                                future.cancel()
+                        for future in done:
+                            if future.cancelled():
+                                continue
+                            attempts += 1
+                            result = future.result()
+                            if best is None or result[:2] < best[:2]:
+                                best = result
+                            self.report_progress(len(self.courses) - best[0], attempts, best[1], force=True)
+                            if stop_when_complete and best[0] == 0:
+                                complete = True
+                                break
+                finally:
+                    # Stop the running attempts too; cancel_futures only drops the queued ones.
+                    stop.set()
+                    executor.shutdown(wait=False, cancel_futures=True)
+        finally:
+            try:
+                os.remove(snapshot_path)
+            except OSError as e:
+                logging.debug(f"Could not remove snapshot {snapshot_path}: {str(e)}")
+        
+        if best is None:
+            logging.warning("Best-of cancelled before any attempt finished; keeping the pinned entries.")
+            self.stats = {"attempts": 0}
+            self.schedule = shared_pinned
+            self.occupancy = Occupancy(self.schedule.entries, groups=NonOverlapGroups.coerce(non_overlap_courses))
+            return self.schedule
+        unscheduled, score, best_seed, schedule_data, stats = best
+        logging.info(f"Best of {n} attempts: seed {best_seed}, {unscheduled} unscheduled, score {score}.")
+        # Search stats of the kept attempt, with how many attempts finished and its seed.
+        self.stats = {**stats, "attempts": attempts, "best_seed": best_seed}
+        self.schedule = loads_schedule(schedule_data)
+        self.occupancy = Occupancy(self.schedule.entries, groups=NonOverlapGroups.coerce(non_overlap_courses))
+        return self.schedule
+
+
+def _init_worker(cancel_event) -> None:
+    """Keep the event that cancels a best-of pool's attempts in the worker process."""
+    global _worker_cancel_event
+    _worker_cancel_event = cancel_event
+
+
+def _run_attempt(payload: tuple, cancel_event=None) -> Tuple[int, float, int, bytes, Dict[str, int]]:
+    """
+    Run one seeded scheduling attempt on a fresh copy of the catalog read from a snapshot.
+
+    The attempt stops early when cancel_event, or in a pool worker the event
+    given to _init_worker, is set.
+    """
+    snapshot_path, strategy, backend, seed, non_overlap_courses, max_iterations, time_limit = payload
+    if cancel_event is None:
+        cancel_event = _worker_cancel_event
+    snapshot = Snapshot.open(snapshot_path)
+    try:
+        engine = SchedulerEngine(snapshot.professors(), snapshot.courses(), snapshot.classrooms(),
+                                 strategy=strategy, seed=seed, backend=backend, cancel_event=cancel_event)
+        pinned = snapshot.schedule().entries
+    finally:
+        snapshot.close()
+    schedule = engine.generate_schedule(non_overlap_courses=non_overlap_courses, max_iterations=max_iterations,
+                                        pinned=pinned, time_limit=time_limit)
+    scheduled_codes = {entry.course_code for entry in schedule.entries}
+    unscheduled = sum(1 for course in engine.courses if course.code not in scheduled_codes)
+    return unscheduled, soft_score(schedule), seed, dumps_snapshot(schedule=schedule), engine.stats
\ No newline at end of file
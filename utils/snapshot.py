@@ -0,0 +1,290 @@
+import json
+import mmap
+import struct
+import sys
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+from models import Professor, Course, Classroom, Schedule, ScheduleEntry
+from utils.constraints import NonOverlap, normalize_non_overlap
+
+MAGIC = b"UCSNAP"
+VERSION = 2
+
+# Marker for a missing string reference.
+NONE = 0xFFFFFFFF
+
+# Arrays of a snapshot, in file order, with their array typecodes. Strings
+# are stored once in the string table and referenced everywhere else by
+# index; grouped lists are flattened with an offsets array per group.
+ARRAYS = (
+    ("string_offsets", "I"),
+    ("string_data", "B"),
+    ("professor_names", "I"),
+    ("professor_time_offsets", "I"),
+    ("professor_times", "I"),
+    ("professor_course_offsets", "I"),
+    ("professor_courses", "I"),
+    ("course_codes", "I"),
+    ("course_names", "I"),
+    ("course_durations", "i"),
+    ("course_professor_offsets", "I"),
+    ("course_professors", "I"),
+    ("course_conflict_offsets", "I"),
+    ("course_conflicts", "I"),
+    ("classroom_names", "I"),
+    ("classroom_capacities", "i"),
+    ("classroom_time_offsets", "I"),
+    ("classroom_times", "I"),
+    ("classroom_feature_offsets", "I"),
+    ("classroom_features", "I"),
+    ("classroom_booking_offsets", "I"),
+    ("classroom_bookings", "I"),
+    ("entries", "I"),
+    ("settings", "I"),
+)
+
+# Magic, version, byte order ("l" or "b") and number of arrays.
+HEADER = struct.Struct("<6sHcxI")
+# Offset and length of one array.
+DIRECTORY_ENTRY = struct.Struct("<QQ")
+
+
+def _group_name(name: str) -> str:
+    """Offsets array of a flattened group array, e.g. professor_times -> professor_time_offsets."""
+    return name[:-1] + "_offsets"
+
+
+class _Encoder:
+    """Collects the arrays of a snapshot while interning strings."""
+
+    def __init__(self):
+        self.strings: Dict[str, int] = {}
+        self.data = bytearray()
+        self.arrays = {name: array(typecode) for name, typecode in ARRAYS}
+        self.arrays["string_offsets"].append(0)
+
+    def intern(self, value: Optional[str]) -> int:
+        """Return the string table index of a value, adding it if new."""
+        if value is None:
+            return NONE
+        index = self.strings.get(value)
+        if index is None:
+            index = len(self.strings)
+            self.strings[value] = index
+            self.data += value.encode("utf-8")
+            self.arrays["string_offsets"].append(len(self.data))
+        return index
+
+    def group(self, name: str, values: Iterable[Sequence[str]]) -> None:
+        """Append one group of string tuples to a flattened array and its offsets."""
+        flat = self.arrays[name]
+        offsets = self.arrays[_group_name(name)]
+        for value in values:
+            flat.extend(self.intern(part) for part in value)
+        offsets.append(len(flat))
+
+    def encode(self) -> bytes:
+        """Lay out the header, directory and 8-byte aligned arrays."""
+        self.arrays["string_data"] = array("B", self.data)
+        position = HEADER.size + DIRECTORY_ENTRY.size * len(ARRAYS)
+        directory, chunks = [], []
+        for name, _ in ARRAYS:
+            position += -position % 8
+            raw = self.arrays[name].tobytes()
+            directory.append(DIRECTORY_ENTRY.pack(position, len(self.arrays[name])))
+            chunks.append((position, raw))
+            position += len(raw)
+        output = bytearray(position)
+        output[:HEADER.size] = HEADER.pack(MAGIC, VERSION, sys.byteorder[0].encode(), len(ARRAYS))
+        output[HEADER.size:HEADER.size + DIRECTORY_ENTRY.size * len(ARRAYS)] = b"".join(directory)
+        for offset, raw in chunks:
+            output[offset:offset + len(raw)] = raw
+        return bytes(output)
+
+
+def dumps_snapshot(professors: Iterable[Professor] = (), courses: Iterable[Course] = (),
+                   classrooms: Iterable[Classroom] = (), schedule: Optional[Schedule] = None,
+                   non_overlap_courses: Optional[NonOverlap] = None) -> bytes:
+    """
+    Encode an instance and optionally a schedule as a binary snapshot.
+
+    Args:
+        professors (Iterable[Professor], optional): Professors to encode.
+        courses (Iterable[Course], optional): Courses to encode.
+        classrooms (Iterable[Classroom], optional): Classrooms to encode.
+        schedule (Schedule, optional): Schedule to encode.
+        non_overlap_courses (NonOverlap, optional): Pair of courses, or groups of courses, that must not overlap.
+
+    Returns:
+        bytes: The snapshot.
+    """
+    encoder = _Encoder()
+    arrays = encoder.arrays
+    for offsets in ("professor_time_offsets", "professor_course_offsets", "course_professor_offsets",
+                    "course_conflict_offsets", "classroom_time_offsets", "classroom_feature_offsets",
+                    "classroom_booking_offsets"):
+        arrays[offsets].append(0)
+
+    for professor in professors:
+        arrays["professor_names"].append(encoder.intern(professor.name))
+        encoder.group("professor_times", professor.available_times)
+        encoder.group("professor_courses", ((code,) for code in professor.courses))
+    for course in courses:
+        arrays["course_codes"].append(encoder.intern(course.code))
+        arrays["course_names"].append(encoder.intern(course.name))
+        arrays["course_durations"].append(course.duration)
+        encoder.group("course_professors", ((name,) for name in course.professors))
+        encoder.group("course_conflicts", ((code,) for code in course.conflicts))
+    for classroom in classrooms:
+        arrays["classroom_names"].append(encoder.intern(classroom.name))
+        arrays["classroom_capacities"].append(classroom.capacity)
+        encoder.group("classroom_times", classroom.available_times)
+        encoder.group("classroom_features", ((feature,) for feature in classroom.features))
+        # Legacy classroom bookings are no longer stored; the group stays for format compatibility.
+        encoder.group("classroom_bookings", ())
+    if schedule is not None:
+        for entry in schedule.entries:
+            arrays["entries"].extend(encoder.intern(value) for value in (
+                entry.course_code, entry.professor_name, entry.classroom_name,
+                entry.day, entry.start_time, entry.end_time))
+    non_overlap = normalize_non_overlap(non_overlap_courses)
+    arrays["settings"].extend([
+        NONE if schedule is None else encoder.intern(json.dumps(schedule.metadata)),
+        NONE if non_overlap is None else encoder.intern(json.dumps(non_overlap)),
+    ])
+    return encoder.encode()
+
+
+def dump_snapshot(path: str, *args: Any, **kwargs: Any) -> None:
+    """Write a snapshot to a file; takes the same arguments as dumps_snapshot."""
+    with open(path, "wb") as f:
+        f.write(dumps_snapshot(*args, **kwargs))
+
+
+class Snapshot:
+    """Read-only view of a binary snapshot.
+
+    Arrays are exposed as memoryviews over the underlying buffer, so a
+    memory-mapped snapshot is shared page by page between every process
+    that opens it and nothing is copied until models are built.
+    """
+
+    def __init__(self, buffer: Union[bytes, mmap.mmap]):
+        """
+        Initialize a Snapshot.
+
+        Args:
+            buffer (bytes or mmap.mmap): Encoded snapshot.
+
+        Raises:
+            ValueError: If the buffer is not a snapshot of a supported version.
+        """
+        self.buffer = buffer
+        view = memoryview(buffer)
+        self._views = [view]
+        magic, version, byteorder, count = HEADER.unpack_from(view)
+        if magic != MAGIC or version != VERSION or count != len(ARRAYS):
+            raise ValueError("Not a scheduler snapshot or unsupported snapshot version.")
+        swap = byteorder.decode() != sys.byteorder[0]
+        self.arrays: Dict[str, Any] = {}
+        for index, (name, typecode) in enumerate(ARRAYS):
+            offset, length = DIRECTORY_ENTRY.unpack_from(view, HEADER.size + DIRECTORY_ENTRY.size * index)
+            size = array(typecode).itemsize
+            data = view[offset:offset + length * size]
+            self._views.append(data)
+            if swap and size > 1:
+                swapped = array(typecode, data.tobytes())
+                swapped.byteswap()
+                self.arrays[name] = swapped
+            else:
+                self.arrays[name] = data.cast(typecode)
+                self._views.append(self.arrays[name])
+        self._strings: List[Optional[str]] = [None] * (len(self.arrays["string_offsets"]) - 1)
+
+    @classmethod
+    def open(cls, path: str) -> 'Snapshot':
+        """Memory-map a snapshot file read-only."""
+        with open(path, "rb") as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def close(self) -> None:
+        """Release the views and close the mapping, if any."""
+        self.arrays = {}
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+
+    def string(self, index: int) -> Optional[str]:
+        """Return an entry of the string table, decoding it on first use."""
+        if index == NONE:
+            return None
+        value = self._strings[index]
+        if value is None:
+            offsets = self.arrays["string_offsets"]
+            value = sys.intern(bytes(self.arrays["string_data"][offsets[index]:offsets[index + 1]]).decode("utf-8"))
+            self._strings[index] = value
+        return value
+
+    def _groups(self, name: str, width: int) -> List[List[tuple]]:
+        """Split a flattened group array into per-entity lists of string tuples."""
+        flat, offsets = self.arrays[name], self.arrays[_group_name(name)]
+        string = self.string
+        return [[tuple(string(flat[i + k]) for k in range(width)) for i in range(offsets[n], offsets[n + 1], width)]
+                for n in range(len(offsets) - 1)]
+
+    def professors(self) -> List[Professor]:
+        """Build the professors."""
+        times = self._groups("professor_times", 3)
+        courses = self._groups("professor_courses", 1)
+        return [Professor(self.string(name), available_times=times[i], courses=[code for code, in courses[i]])
+                for i, name in enumerate(self.arrays["professor_names"])]
+
+    def courses(self) -> List[Course]:
+        """Build the courses."""
+        professors = self._groups("course_professors", 1)
+        conflicts = self._groups("course_conflicts", 1)
+        names, durations = self.arrays["course_names"], self.arrays["course_durations"]
+        return [Course(self.string(names[i]), self.string(code), durations[i],
+                       professors=[name for name, in professors[i]],
+                       conflicts=[other for other, in conflicts[i]])
+                for i, code in enumerate(self.arrays["course_codes"])]
+
+    def classrooms(self) -> List[Classroom]:
+        """Build the classrooms; legacy bookings in older snapshots are dropped."""
+        times = self._groups("classroom_times", 3)
+        features = self._groups("classroom_features", 1)
+        capacities = self.arrays["classroom_capacities"]
+        classrooms = []
+        for i, name in enumerate(self.arrays["classroom_names"]):
+            classroom = Classroom(self.string(name), capacities[i], available_times=times[i],
+                                  features=[feature for feature, in features[i]])
+            classrooms.append(classroom)
+        return classrooms
+
+    def schedule(self) -> Optional[Schedule]:
+        """Build the schedule, or None if the snapshot holds none."""
+        metadata = self.string(self.arrays["settings"][0])
+        if metadata is None:
+            return None
+        schedule = Schedule()
+        entries, string = self.arrays["entries"], self.string
+        for i in range(0, len(entries), 6):
+            schedule.add_entry(ScheduleEntry(*(string(entries[i + k]) for k in range(6))))
+        schedule.metadata = json.loads(metadata)
+        return schedule
+
+    def non_overlap_courses(self) -> Optional[NonOverlap]:
+        """Return the pair or groups of courses that must not overlap, if any."""
+        value = self.string(self.arrays["settings"][1])
+        return normalize_non_overlap(json.loads(value)) if value is not None else None
+
+
+def loads_schedule(data: bytes) -> Optional[Schedule]:
+    """Decode the schedule of a snapshot held in memory."""
+    snapshot = Snapshot(data)
+    try:
+        return snapshot.schedule()
+    finally:
+        snapshot.close()
\ No newline at end of file
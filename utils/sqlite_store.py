@@ -0,0 +1,355 @@
+import json
+import sqlite3
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from models import Professor, Course, Classroom, Schedule, ScheduleEntry
+from utils.constraints import NonOverlap, normalize_non_overlap
+import logging
+
+# File extensions persistence treats as SQLite databases rather than JSON.
+SQLITE_EXTENSIONS = (".db", ".sqlite", ".sqlite3")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS professors (
+    name TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    fingerprint TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS professor_availability (
+    professor TEXT NOT NULL REFERENCES professors(name) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    day TEXT NOT NULL,
+    start_time TEXT NOT NULL,
+    end_time TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_professor_availability ON professor_availability(professor, day);
+CREATE TABLE IF NOT EXISTS professor_courses (
+    professor TEXT NOT NULL REFERENCES professors(name) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    course_code TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_professor_courses ON professor_courses(professor);
+
+CREATE TABLE IF NOT EXISTS courses (
+    code TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    fingerprint TEXT NOT NULL,
+    name TEXT NOT NULL,
+    duration INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS course_professors (
+    course_code TEXT NOT NULL REFERENCES courses(code) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    professor TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_course_professors ON course_professors(course_code);
+CREATE TABLE IF NOT EXISTS course_conflicts (
+    course_code TEXT NOT NULL REFERENCES courses(code) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    conflict_code TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_course_conflicts ON course_conflicts(course_code);
+
+CREATE TABLE IF NOT EXISTS classrooms (
+    name TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    fingerprint TEXT NOT NULL,
+    capacity INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS classroom_availability (
+    classroom TEXT NOT NULL REFERENCES classrooms(name) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    day TEXT NOT NULL,
+    start_time TEXT NOT NULL,
+    end_time TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_classroom_availability ON classroom_availability(classroom, day);
+CREATE TABLE IF NOT EXISTS classroom_features (
+    classroom TEXT NOT NULL REFERENCES classrooms(name) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    feature TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_classroom_features ON classroom_features(classroom);
+
+CREATE TABLE IF NOT EXISTS schedule_entries (
+    id INTEGER PRIMARY KEY,
+    course_code TEXT NOT NULL,
+    professor_name TEXT NOT NULL,
+    classroom_name TEXT NOT NULL,
+    day TEXT NOT NULL,
+    start_time TEXT NOT NULL,
+    end_time TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_day ON schedule_entries(day, start_time);
+CREATE INDEX IF NOT EXISTS idx_entries_classroom ON schedule_entries(classroom_name, day);
+CREATE INDEX IF NOT EXISTS idx_entries_professor ON schedule_entries(professor_name, day);
+CREATE INDEX IF NOT EXISTS idx_entries_course ON schedule_entries(course_code);
+
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# Columns of schedule_entries in ScheduleEntry constructor order.
+ENTRY_COLUMNS = ("course_code", "professor_name", "classroom_name", "day", "start_time", "end_time")
+
+# Columns schedule_entries may be filtered on by entries().
+ENTRY_FILTERS = {"day": "day", "classroom": "classroom_name", "professor": "professor_name",
+                 "course": "course_code"}
+
+
+def is_sqlite_path(path: str) -> bool:
+    """Return True if the path names a SQLite database rather than a JSON file."""
+    return path.lower().endswith(SQLITE_EXTENSIONS)
+
+
+def _fingerprint(data: dict) -> str:
+    """Stable serialization of an entity, used to detect unchanged rows on save."""
+    return json.dumps(data, sort_keys=True, separators=(",", ":"))
+
+
+def _group(rows: Iterable[tuple]) -> Dict[str, List[tuple]]:
+    """Group (owner, *values) rows by owner, keeping row order."""
+    grouped: Dict[str, List[tuple]] = {}
+    for owner, *values in rows:
+        grouped.setdefault(owner, []).append(tuple(values))
+    return grouped
+
+
+class SQLiteStore:
+    """SQLite repository for the catalog and the schedule.
+
+    Each entity is stored in normalized tables, with its availability,
+    qualifications, conflicts and features indexed by owner. Schedule entries
+    are indexed by day, classroom, professor and course, so callers can read
+    only the entries they need with entries() instead of the whole schedule.
+    Saving compares a fingerprint of every entity with the stored one and
+    rewrites only the rows that changed, so a single edit touches a single
+    entity. Classroom bookings are not stored because they repeat the
+    schedule entries.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open or create a database.
+
+        Args:
+            path (str): Path to the database file, or ":memory:".
+        """
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        if path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    def __enter__(self) -> 'SQLiteStore':
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.close()
+
+    def load_professors(self) -> List[Professor]:
+        """Load all professors in their saved order."""
+        times = _group(self.conn.execute(
+            "SELECT professor, day, start_time, end_time FROM professor_availability ORDER BY professor, position"))
+        courses = _group(self.conn.execute(
+            "SELECT professor, course_code FROM professor_courses ORDER BY professor, position"))
+        return [Professor(name, available_times=times.get(name, []),
+                          courses=[code for code, in courses.get(name, [])])
+                for name, in self.conn.execute("SELECT name FROM professors ORDER BY position")]
+
+    def load_courses(self) -> List[Course]:
+        """Load all courses in their saved order."""
+        professors = _group(self.conn.execute(
+            "SELECT course_code, professor FROM course_professors ORDER BY course_code, position"))
+        conflicts = _group(self.conn.execute(
+            "SELECT course_code, conflict_code FROM course_conflicts ORDER BY course_code, position"))
+        return [Course(name, code, duration,
+                       professors=[professor for professor, in professors.get(code, [])],
+                       conflicts=[other for other, in conflicts.get(code, [])])
+                for code, name, duration in self.conn.execute(
+                    "SELECT code, name, duration FROM courses ORDER BY position")]
+
+    def load_classrooms(self) -> List[Classroom]:
+        """Load all classrooms in their saved order."""
+        times = _group(self.conn.execute(
+            "SELECT classroom, day, start_time, end_time FROM classroom_availability ORDER BY classroom, position"))
+        features = _group(self.conn.execute(
+            "SELECT classroom, feature FROM classroom_features ORDER BY classroom, position"))
+        return [Classroom(name, capacity, available_times=times.get(name, []),
+                          features=[feature for feature, in features.get(name, [])])
+                for name, capacity in self.conn.execute("SELECT name, capacity FROM classrooms ORDER BY position")]
+
+    def entries(self, day: Optional[str] = None, classroom: Optional[str] = None,
+                professor: Optional[str] = None, course: Optional[str] = None) -> List[ScheduleEntry]:
+        """
+        Query schedule entries through the day, classroom, professor and course indexes.
+
+        Args:
+            day (str, optional): Only entries on this day.
+            classroom (str, optional): Only entries in this classroom.
+            professor (str, optional): Only entries taught by this professor.
+            course (str, optional): Only entries of this course.
+
+        Returns:
+            List[ScheduleEntry]: Matching entries in schedule order.
+        """
+        filters = {"day": day, "classroom": classroom, "professor": professor, "course": course}
+        clauses = [f"{ENTRY_FILTERS[key]} = ?" for key, value in filters.items() if value is not None]
+        params = [value for value in filters.values() if value is not None]
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self.conn.execute(
+            f"SELECT {', '.join(ENTRY_COLUMNS)} FROM schedule_entries{where} ORDER BY id", params)
+        return [ScheduleEntry(*row) for row in rows]
+
+    def has_schedule(self) -> bool:
+        """Return True if a schedule was saved, without reading its entries."""
+        return self.get_setting("schedule_metadata") is not None
+
+    def load_catalog(self) -> Dict[str, Any]:
+        """Load everything but the schedule, in the format returned by persistence.load_data."""
+        return {
+            "professors": self.load_professors(),
+            "courses": self.load_courses(),
+            "classrooms": self.load_classrooms(),
+            "schedule": None,
+            "non_overlap_courses": normalize_non_overlap(self.get_setting("non_overlap_courses")),
+        }
+
+    def load_schedule(self) -> Optional[Schedule]:
+        """Load the saved schedule, or None if none was saved."""
+        metadata = self.get_setting("schedule_metadata")
+        if metadata is None:
+            return None
+        schedule = Schedule()
+        for entry in self.entries():
+            schedule.add_entry(entry)
+        schedule.metadata = metadata
+        return schedule
+
+    def load_data(self) -> Dict[str, Any]:
+        """Load everything in the format returned by persistence.load_data."""
+        data = self.load_catalog()
+        data["schedule"] = self.load_schedule()
+        return data
+
+    def get_setting(self, key: str, default: Any = None) -> Any:
+        """Return a JSON value stored in the settings table."""
+        row = self.conn.execute("SELECT value FROM settings WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def set_setting(self, key: str, value: Any) -> None:
+        """Store a JSON value in the settings table."""
+        with self.conn:
+            self._set_setting(key, value)
+
+    def _set_setting(self, key: str, value: Any) -> None:
+        self.conn.execute("INSERT INTO settings (key, value) VALUES (?, ?) "
+                          "ON CONFLICT(key) DO UPDATE SET value = excluded.value", (key, json.dumps(value)))
+
+    def _write_professor(self, professor: Professor, position: int) -> None:
+        self.conn.execute("INSERT INTO professors (name, position, fingerprint) VALUES (?, ?, ?) "
+                          "ON CONFLICT(name) DO UPDATE SET position = excluded.position, "
+                          "fingerprint = excluded.fingerprint",
+                          (professor.name, position, _fingerprint(professor.to_dict())))
+        self.conn.execute("DELETE FROM professor_availability WHERE professor = ?", (professor.name,))
+        self.conn.execute("DELETE FROM professor_courses WHERE professor = ?", (professor.name,))
+        self.conn.executemany("INSERT INTO professor_availability VALUES (?, ?, ?, ?, ?)",
+                              [(professor.name, i, *slot) for i, slot in enumerate(professor.available_times)])
+        self.conn.executemany("INSERT INTO professor_courses VALUES (?, ?, ?)",
+                              [(professor.name, i, code) for i, code in enumerate(professor.courses)])
+
+    def _write_course(self, course: Course, position: int) -> None:
+        self.conn.execute("INSERT INTO courses (code, position, fingerprint, name, duration) VALUES (?, ?, ?, ?, ?) "
+                          "ON CONFLICT(code) DO UPDATE SET position = excluded.position, "
+                          "fingerprint = excluded.fingerprint, name = excluded.name, duration = excluded.duration",
+                          (course.code, position, _fingerprint(course.to_dict()), course.name, course.duration))
+        self.conn.execute("DELETE FROM course_professors WHERE course_code = ?", (course.code,))
+        self.conn.execute("DELETE FROM course_conflicts WHERE course_code = ?", (course.code,))
+        self.conn.executemany("INSERT INTO course_professors VALUES (?, ?, ?)",
+                              [(course.code, i, name) for i, name in enumerate(course.professors)])
+        self.conn.executemany("INSERT INTO course_conflicts VALUES (?, ?, ?)",
+                              [(course.code, i, code) for i, code in enumerate(course.conflicts)])
+
+    def _write_classroom(self, classroom: Classroom, position: int) -> None:
+        self.conn.execute("INSERT INTO classrooms (name, position, fingerprint, capacity) VALUES (?, ?, ?, ?) "
+                          "ON CONFLICT(name) DO UPDATE SET position = excluded.position, "
+                          "fingerprint = excluded.fingerprint, capacity = excluded.capacity",
+                          (classroom.name, position, _fingerprint(classroom.to_dict()), classroom.capacity))
+        for table in ("classroom_availability", "classroom_features"):
+            self.conn.execute(f"DELETE FROM {table} WHERE classroom = ?", (classroom.name,))
+        self.conn.executemany("INSERT INTO classroom_availability VALUES (?, ?, ?, ?, ?)",
+                              [(classroom.name, i, *slot) for i, slot in enumerate(classroom.available_times)])
+        self.conn.executemany("INSERT INTO classroom_features VALUES (?, ?, ?)",
+                              [(classroom.name, i, feature) for i, feature in enumerate(classroom.features)])
+
+    def _sync(self, table: str, key: str, items: List[Any], key_of, write) -> int:
+        """Write the items whose fingerprint or position changed and delete the missing ones."""
+        stored = {name: (position, fingerprint) for name, position, fingerprint in
+                  self.conn.execute(f"SELECT {key}, position, fingerprint FROM {table}")}
+        written = 0
+        for position, item in enumerate(items):
+            name = key_of(item)
+            saved = stored.pop(name, None)
+            if saved is None or saved[1] != _fingerprint(item.to_dict()):
+                write(item, position)
+                written += 1
+            elif saved[0] != position:
+                self.conn.execute(f"UPDATE {table} SET position = ? WHERE {key} = ?", (position, name))
+        self.conn.executemany(f"DELETE FROM {table} WHERE {key} = ?", [(name,) for name in stored])
+        return written + len(stored)
+
+    def _sync_schedule(self, schedule: Optional[Schedule]) -> int:
+        """Insert the new entries and delete the removed ones."""
+        stored: Dict[Tuple[str, ...], List[int]] = {}
+        for row_id, *values in self.conn.execute(
+                f"SELECT id, {', '.join(ENTRY_COLUMNS)} FROM schedule_entries ORDER BY id"):
+            stored.setdefault(tuple(values), []).append(row_id)
+        added = []
+        for entry in schedule.entries if schedule else []:
+            values = tuple(getattr(entry, column) for column in ENTRY_COLUMNS)
+            ids = stored.get(values)
+            if ids:
+                ids.pop(0)
+            else:
+                added.append(values)
+        removed = [(row_id,) for ids in stored.values() for row_id in ids]
+        self.conn.executemany("DELETE FROM schedule_entries WHERE id = ?", removed)
+        self.conn.executemany(f"INSERT INTO schedule_entries ({', '.join(ENTRY_COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?)",
+                              added)
+        if schedule is None:
+            self.conn.execute("DELETE FROM settings WHERE key = 'schedule_metadata'")
+        else:
+            self._set_setting("schedule_metadata", schedule.metadata)
+        return len(added) + len(removed)
+
+    def save_data(self, professors: List[Professor], courses: List[Course], classrooms: List[Classroom],
+                  schedule: Optional[Schedule] = None, non_overlap_courses: Optional[NonOverlap] = None,
+                  **extra: Any) -> None:
+        """
+        Save the catalog and schedule, rewriting only what changed since the last save.
+
+        Args:
+            professors (List[Professor]): List of professors.
+            courses (List[Course]): List of courses.
+            classrooms (List[Classroom]): List of classrooms.
+            schedule (Schedule, optional): The current schedule.
+            non_overlap_courses (NonOverlap, optional): Pair of courses, or groups of courses, that must not overlap.
+            **extra: Additional JSON values stored in the settings table, such as run statistics.
+        """
+        with self.conn:
+            written = self._sync("professors", "name", list(professors), lambda p: p.name,
+                                 self._write_professor)
+            written += self._sync("courses", "code", list(courses), lambda c: c.code, self._write_course)
+            written += self._sync("classrooms", "name", list(classrooms), lambda c: c.name,
+                                  self._write_classroom)
+            written += self._sync_schedule(schedule)
+            self._set_setting("non_overlap_courses", normalize_non_overlap(non_overlap_courses))
+            for key, value in extra.items():
+                self._set_setting(key, value)
+        logging.info(f"Saved {self.path}: {written} rows changed.")
\ No newline at end of file
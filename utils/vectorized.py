@@ -0,0 +1,268 @@
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Set, Tuple
+from models import Course, ScheduleEntry
+from models.timeline import MINUTES_PER_DAY, time_to_minutes
+from utils.candidates import CandidateTable, Placement
+from utils.conflict_graph import ConflictGraph
+from utils.registry import Registry
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the engine's default backend is pure Python.
+    np = None
+
+HAS_NUMPY = np is not None
+
+
+def _unpack(masks: Dict[str, int], days: List[str]) -> 'np.ndarray':
+    """Expand per-day minute bitmasks into a boolean [day × minute] array."""
+    rows = np.zeros((len(days), MINUTES_PER_DAY), dtype=bool)
+    for index, day in enumerate(days):
+        mask = masks.get(day, 0) & ((1 << MINUTES_PER_DAY) - 1)
+        if mask:
+            data = np.frombuffer(mask.to_bytes(MINUTES_PER_DAY // 8, "little"), dtype=np.uint8)
+            rows[index] = np.unpackbits(data, bitorder="little").astype(bool)
+    return rows
+
+
+def _prefix(free: 'np.ndarray') -> 'np.ndarray':
+    """Return cumulative minute counts along the last axis, with a leading zero column."""
+    sums = np.zeros(free.shape[:-1] + (MINUTES_PER_DAY + 1,), dtype=np.int16)
+    np.cumsum(free, axis=-1, out=sums[..., 1:])
+    return sums
+
+
+def _windows(sums: 'np.ndarray', starts: 'np.ndarray', duration: int) -> 'np.ndarray':
+    """
+    Test every allowed start at once for a free window of the given length.
+
+    Args:
+        sums (np.ndarray): Prefix sums, from _prefix, of a boolean [... × day × minute]
+            array of usable minutes.
+        starts (np.ndarray): Allowed start minutes.
+        duration (int): Window length in minutes.
+
+    Returns:
+        np.ndarray: Boolean [... × day × start] array, True where every minute of
+            [start, start + duration) is usable.
+    """
+    ends = np.minimum(starts + duration, MINUTES_PER_DAY)
+    return (sums[..., ends] - sums[..., starts] == duration) & (starts + duration <= MINUTES_PER_DAY)
+
+
+class OccupancyTensors:
+    """Professor, classroom and course occupancy as boolean [entity × day × minute] tensors.
+
+    Rows are registry IDs, days follow the engine's time slots and minutes
+    count from midnight. A window test is a difference of cumulative sums, so
+    every (professor, day, start) of a course is checked in a few array
+    operations. The classrooms and professors free for each course length are
+    kept per (entity, day, start) and patched row by row on every booking, and
+    each course counts the bookings of conflicting courses that overlap each of
+    its starts, so a feasibility test only indexes these arrays.
+    """
+
+    def __init__(self, registry: Registry, time_slots: List[Tuple[str, str, str]], conflict_graph: ConflictGraph):
+        """
+        Build the tensors from the catalog's availability, with nothing booked.
+
+        Args:
+            registry (Registry): ID registry of the engine's catalog.
+            time_slots (List[Tuple[str, str, str]]): Slots whose start times are
+                the allowed course start times.
+            conflict_graph (ConflictGraph): Courses that may not overlap, by registry ID.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if np is None:
+            raise ImportError("The numpy backend requires NumPy. Install it with 'pip install numpy'.")
+        self.registry = registry
+        self.conflicts: List[List[int]] = [conflict_graph.neighbors(course_id) for course_id in range(len(registry.courses))]
+        self.days: List[str] = list(dict.fromkeys(day for day, _, _ in time_slots))
+        self.day_index: Dict[str, int] = {day: index for index, day in enumerate(self.days)}
+        self.starts = np.array(sorted({time_to_minutes(start) for _, start, _ in time_slots}), dtype=np.intp)
+        self.start_minutes: List[int] = self.starts.tolist()
+        self.start_index: Dict[int, int] = {start: index for index, start in enumerate(self.start_minutes)}
+        self.allowed = np.zeros((len(self.days), len(self.starts)), dtype=bool)
+        for day, start, _ in time_slots:
+            self.allowed[self.day_index[day], self.start_index[time_to_minutes(start)]] = True
+
+        shape = (len(self.days), MINUTES_PER_DAY)
+        self.professor_open = self._stack([p.availability.masks for p in registry.professors])
+        self.professor_sums = _prefix(self.professor_open)
+        self.classroom_open = self._stack([c.availability.masks for c in registry.classrooms])
+        self.professor_busy = np.zeros((len(registry.professors),) + shape, dtype=bool)
+        self.classroom_busy = np.zeros((len(registry.classrooms),) + shape, dtype=bool)
+        # Bookings of conflicting courses overlapping each [course × day × start] placement.
+        self.course_blocked = np.zeros((len(registry.courses), len(self.days), len(self.starts)), dtype=np.int32)
+        # Per course length: static open windows and currently free windows, both [classroom × day × start].
+        self._open_windows: Dict[int, 'np.ndarray'] = {}
+        self._open_any: Dict[int, 'np.ndarray'] = {}
+        self._free_windows: Dict[int, 'np.ndarray'] = {}
+        self._free_counts: Dict[int, 'np.ndarray'] = {}
+        # Per course length: windows where each professor is available and unbooked, [professor × day × start].
+        self._professor_windows: Dict[int, 'np.ndarray'] = {}
+
+    def _stack(self, masks: List[Dict[str, int]]) -> 'np.ndarray':
+        """Stack the per-day masks of several entities into one tensor."""
+        if not masks:
+            return np.zeros((0, len(self.days), MINUTES_PER_DAY), dtype=bool)
+        return np.stack([_unpack(entity_masks, self.days) for entity_masks in masks])
+
+    def open_windows(self, duration: int) -> 'np.ndarray':
+        """Return the [classroom × day × start] windows open for a course length, ignoring bookings."""
+        windows = self._open_windows.get(duration)
+        if windows is None:
+            windows = _windows(_prefix(self.classroom_open), self.starts, duration)
+            self._open_windows[duration] = windows
+        return windows
+
+    def free_counts(self, duration: int) -> 'np.ndarray':
+        """Return how many classrooms are open and unbooked for each [day × start] window of a course length."""
+        counts = self._free_counts.get(duration)
+        if counts is None:
+            windows = _windows(_prefix(self.classroom_open & ~self.classroom_busy), self.starts, duration)
+            counts = windows.sum(axis=0, dtype=np.int32)
+            self._free_windows[duration] = windows
+            self._free_counts[duration] = counts
+        return counts
+
+    def professor_windows(self, duration: int) -> 'np.ndarray':
+        """Return the [professor × day × start] windows where each professor is available and unbooked."""
+        windows = self._professor_windows.get(duration)
+        if windows is None:
+            windows = _windows(_prefix(self.professor_open & ~self.professor_busy), self.starts, duration)
+            self._professor_windows[duration] = windows
+        return windows
+
+    def candidate_mask(self, professor_ids: List[int], duration: int) -> 'np.ndarray':
+        """Return the [professor × day × start] placements allowed by availability alone."""
+        rooms = self._open_any.get(duration)
+        if rooms is None:
+            rooms = self.open_windows(duration).any(axis=0) & self.allowed
+            self._open_any[duration] = rooms
+        return _windows(self.professor_sums[professor_ids], self.starts, duration) & rooms
+
+    def feasible_mask(self, course_id: int, professor_ids: List[int]) -> 'np.ndarray':
+        """
+        Return the [professor × day × start] placements of a course that fit the current bookings.
+
+        A placement needs its professor available and unbooked, no conflicting
+        course booked at the same time, and at least one free classroom.
+
+        Args:
+            course_id (int): Registry ID of the course.
+            professor_ids (List[int]): Registry IDs of the professors to test.
+
+        Returns:
+            np.ndarray: Boolean mask indexed by position in professor_ids, day and start.
+        """
+        duration = self.registry.durations[course_id]
+        rooms = self.allowed & (self.free_counts(duration) > 0) & (self.course_blocked[course_id] == 0)
+        return self.professor_windows(duration)[professor_ids] & rooms
+
+    def feasible_placements(self, course: Course) -> Set[Placement]:
+        """Return the placements of a course that fit the current bookings, as candidate tuples."""
+        course_id = self.registry.course_id(course.code)
+        professor_ids = [self.registry.professor_ids[name] for name in dict.fromkeys(course.professors)
+                         if name in self.registry.professor_ids]
+        if course_id is None or not professor_ids:
+            return set()
+        starts = self.start_minutes
+        return {
+            (self.registry.professors[professor_ids[p]].name, self.days[d], starts[s], starts[s] + course.duration)
+            for p, d, s in np.argwhere(self.feasible_mask(course_id, professor_ids)).tolist()
+        }
+
+    def classroom_is_free(self, classroom_id: int, day: str, start: int, end: int) -> bool:
+        """Check that a classroom has no booking in [start, end) on a day."""
+        return not self.classroom_busy[classroom_id, self.day_index[day], start:end].any()
+
+    def book(self, entry: ScheduleEntry) -> None:
+        """Mark an entry's professor, classroom and course as busy for its interval."""
+        self._mark(entry, True)
+
+    def release(self, entry: ScheduleEntry) -> None:
+        """Clear the bookings made for an entry."""
+        self._mark(entry, False)
+
+    def _mark(self, entry: ScheduleEntry, busy: bool) -> None:
+        """Set or clear an entry's interval and patch the cached windows and conflict counts."""
+        day = self.day_index.get(entry.day)
+        if day is None:
+            return
+        start, end = entry.start, entry.end
+        professor_id = self.registry.professor_ids.get(entry.professor_name)
+        course_id = self.registry.course_ids.get(entry.course_code)
+        classroom_id = self.registry.classroom_ids.get(entry.classroom_name)
+        if professor_id is not None:
+            self.professor_busy[professor_id, day, start:end] = busy
+            if self._professor_windows:
+                sums = _prefix(self.professor_open[professor_id, day] & ~self.professor_busy[professor_id, day])
+                for duration, windows in self._professor_windows.items():
+                    windows[professor_id, day] = _windows(sums, self.starts, duration)
+        if course_id is not None:
+            # A conflicting course of length d overlaps [start, end) when it starts in (start - d, end).
+            last = bisect_left(self.start_minutes, end)
+            for other in self.conflicts[course_id]:
+                first = bisect_right(self.start_minutes, start - self.registry.durations[other])
+                self.course_blocked[other, day, first:last] += 1 if busy else -1
+        if classroom_id is not None:
+            self.classroom_busy[classroom_id, day, start:end] = busy
+            sums = _prefix(self.classroom_open[classroom_id, day] & ~self.classroom_busy[classroom_id, day])
+            for duration, windows in self._free_windows.items():
+                row = _windows(sums, self.starts, duration)
+                self._free_counts[duration][day] += row.astype(np.int32) - windows[classroom_id, day]
+                windows[classroom_id, day] = row
+
+
+class VectorCandidateTable(CandidateTable):
+    """Candidate table whose placements and classroom lists are computed from occupancy tensors.
+
+    Produces the same placements, in the same order, as CandidateTable.
+    """
+
+    def __init__(self, tensors: OccupancyTensors, courses: List[Course]):
+        """
+        Build the candidate table.
+
+        Args:
+            tensors (OccupancyTensors): Tensors of the engine's catalog.
+            courses (List[Course]): Courses to compute placements for.
+        """
+        registry = tensors.registry
+        self.tensors = tensors
+        self.classrooms = registry.classrooms
+        self.placements: Dict[str, List[Placement]] = {}
+        self.by_professor: Dict[str, Dict[str, List[Placement]]] = {}
+        self.rooms = {}
+        self.coverages: Dict[str, Dict[str, int]] = {}
+
+        starts = tensors.start_minutes
+        for course in courses:
+            names = [name for name in dict.fromkeys(course.professors) if name in registry.professor_ids]
+            by_professor: Dict[str, List[Placement]] = {name: [] for name in names}
+            placements: List[Placement] = []
+            if names:
+                mask = tensors.candidate_mask([registry.professor_ids[name] for name in names], course.duration)
+                for p, d, s in np.argwhere(mask).tolist():
+                    placement = (names[p], tensors.days[d], starts[s], starts[s] + course.duration)
+                    placements.append(placement)
+                    by_professor[names[p]].append(placement)
+            self.placements[course.code] = placements
+            self.by_professor[course.code] = by_professor
+
+    def rooms_for(self, day: str, start: int, end: int) -> list:
+        """Return the classrooms whose availability windows cover the interval."""
+        key = (day, start, end)
+        rooms = self.rooms.get(key)
+        if rooms is None:
+            day_index = self.tensors.day_index.get(day)
+            start_index = self.tensors.start_index.get(start)
+            if day_index is None or start_index is None:
+                return super().rooms_for(day, start, end)
+            windows = self.tensors.open_windows(end - start)[:, day_index, start_index]
+            rooms = [self.classrooms[room_id] for room_id in np.flatnonzero(windows).tolist()]
+            self.rooms[key] = rooms
+        return rooms
\ No newline at end of file